@@ -1,12 +1,13 @@
 """Django admin configuration for the LiLy Stoica platform."""
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
+from django.utils import timezone
 from import_export.admin import ImportExportModelAdmin
 
 from .models import (
-    User, BookingSlot, Booking, Testimonial, BlogPost, Event,
-    LeadMagnetEntry, ContactMessage, AIUsageLog, VideoRoomEvent,
-    VideoSignal, SystemConfiguration, ResourceCategory, Resource,
+    User, AvailabilityRule, BookingSlot, Booking, Testimonial, BlogPost, Tag, Event,
+    LeadMagnetEntry, ContactMessage, AIUsageLog, AIUsageDaily, VideoRoomEvent,
+    VideoSignal, OutboundEmail, SystemConfiguration, ResourceCategory, Resource,
     Goal, SessionNote,
 )
 
@@ -32,10 +33,17 @@ class UserAdmin(BaseUserAdmin, ImportExportModelAdmin):
     )
 
 
+@admin.register(AvailabilityRule)
+class AvailabilityRuleAdmin(admin.ModelAdmin):
+    list_display = ("weekday", "start_time", "end_time", "session_type", "valid_from", "valid_until", "is_active")
+    list_filter = ("weekday", "session_type", "is_active")
+
+
 @admin.register(BookingSlot)
 class BookingSlotAdmin(ImportExportModelAdmin):
-    list_display = ("date", "start_time", "end_time", "session_type", "is_available")
+    list_display = ("date", "start_time", "end_time", "session_type", "is_available", "rule")
     list_filter = ("session_type", "is_available", "date")
+    list_select_related = ("rule",)
 
 
 @admin.register(Booking)
@@ -60,6 +68,13 @@ class BlogPostAdmin(ImportExportModelAdmin):
     readonly_fields = ("view_count", "created_at", "updated_at")
 
 
+@admin.register(Tag)
+class TagAdmin(admin.ModelAdmin):
+    list_display = ("name", "published_count")
+    search_fields = ("name",)
+    readonly_fields = ("published_count",)
+
+
 @admin.register(Event)
 class EventAdmin(ImportExportModelAdmin):
     list_display = ("title", "date", "start_time", "location", "is_online", "is_published")
@@ -80,8 +95,19 @@ class ContactMessageAdmin(ImportExportModelAdmin):
 
 @admin.register(AIUsageLog)
 class AIUsageLogAdmin(admin.ModelAdmin):
-    list_display = ("user", "tokens_used", "created_at")
-    list_filter = ("created_at",)
+    list_display = ("user", "tokens_used", "cache_hit", "created_at")
+    list_filter = ("created_at", "cache_hit")
+    list_select_related = ("user",)
+    date_hierarchy = "created_at"
+    show_full_result_count = False
+
+
+@admin.register(AIUsageDaily)
+class AIUsageDailyAdmin(admin.ModelAdmin):
+    list_display = ("date", "session_id", "user", "requests", "tokens_used")
+    list_filter = ("date",)
+    list_select_related = ("user",)
+    date_hierarchy = "date"
 
 
 @admin.register(VideoRoomEvent)
@@ -89,6 +115,21 @@ class VideoRoomEventAdmin(admin.ModelAdmin):
     list_display = ("room_id", "user", "event_type", "created_at")
 
 
+@admin.register(OutboundEmail)
+class OutboundEmailAdmin(admin.ModelAdmin):
+    list_display = ("subject", "to_email", "status", "attempts", "next_attempt_at", "sent_at", "created_at")
+    list_filter = ("status",)
+    search_fields = ("to_email", "subject")
+    readonly_fields = ("attempts", "last_error", "sent_at", "created_at")
+    date_hierarchy = "created_at"
+    actions = ["retry_now"]
+
+    @admin.action(description="Retry selected emails now")
+    def retry_now(self, request, queryset):
+        updated = queryset.exclude(status="sent").update(status="pending", attempts=0, next_attempt_at=timezone.now())
+        self.message_user(request, f"{updated} email(s) queued for retry.")
+
+
 @admin.register(SystemConfiguration)
 class SystemConfigurationAdmin(admin.ModelAdmin):
     list_display = ("__str__", "ai_enabled", "email_test_mode")
@@ -109,6 +150,7 @@ class ResourceCategoryAdmin(ImportExportModelAdmin):
 @admin.register(Resource)
 class ResourceAdmin(ImportExportModelAdmin):
     list_display = ("title", "resource_type", "category", "is_published", "is_premium", "download_count")
+    list_select_related = ("category",)
     list_filter = ("resource_type", "is_published", "is_premium", "category")
     search_fields = ("title", "description")
     prepopulated_fields = {"slug": ("title",)}
@@ -0,0 +1,130 @@
+"""
+Cache backends with hit/miss accounting.
+
+Thin subclasses of Django's built-in backends that count hits and misses per
+process and periodically fold them into shared counters stored in the cache
+itself, so ``manage.py cache_stats`` can report figures across all workers.
+"""
+import atexit
+import threading
+import time
+
+from django.core.cache.backends.db import DatabaseCache as _DatabaseCache
+from django.core.cache.backends.filebased import FileBasedCache as _FileBasedCache
+from django.core.cache.backends.locmem import LocMemCache as _LocMemCache
+from django.core.cache.backends.redis import RedisCache as _RedisCache
+
+STATS_PREFIX = "cachestats:"
+STATS_KEYS = ("hits", "misses")
+FLUSH_EVERY_OPS = 200       # fold local counters into the cache after N lookups
+FLUSH_EVERY_SECONDS = 30    # ... or after this many seconds, whichever is first
+
+_MISSING = object()
+_call_depth = threading.local()
+
+
+class StatsMixin:
+    """Count get/get_many hits and misses, flushing to shared counters."""
+
+    _stats_lock = threading.Lock()
+    _pending = {"hits": 0, "misses": 0}
+    _last_flush = time.monotonic()
+    _atexit_registered = False
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        with self._stats_lock:
+            if not StatsMixin._atexit_registered:
+                # Don't lose counts from short-lived processes (commands, shells).
+                atexit.register(self.flush_stats)
+                StatsMixin._atexit_registered = True
+
+    def _record(self, hits, misses):
+        with self._stats_lock:
+            pending = StatsMixin._pending
+            pending["hits"] += hits
+            pending["misses"] += misses
+            due = (
+                pending["hits"] + pending["misses"] >= FLUSH_EVERY_OPS
+                or time.monotonic() - StatsMixin._last_flush >= FLUSH_EVERY_SECONDS
+            )
+            if not due:
+                return
+            snapshot = dict(pending)
+            pending["hits"] = pending["misses"] = 0
+            StatsMixin._last_flush = time.monotonic()
+        self.flush_stats(snapshot)
+
+    def flush_stats(self, counts=None):
+        """Add ``counts`` (or everything pending) to the shared counters."""
+        if counts is None:
+            with self._stats_lock:
+                counts = dict(StatsMixin._pending)
+                StatsMixin._pending["hits"] = StatsMixin._pending["misses"] = 0
+        for name, value in counts.items():
+            if not value:
+                continue
+            key = STATS_PREFIX + name
+            try:
+                self.incr(key, value)
+            except ValueError:
+                self.add(key, value, None)
+            except Exception:
+                # Stats are best-effort; never break a request over them.
+                pass
+
+    def read_stats(self):
+        """Return the shared hit/miss counters."""
+        return {name: self.get(STATS_PREFIX + name, 0) or 0 for name in STATS_KEYS}
+
+    def reset_stats(self):
+        for name in STATS_KEYS:
+            self.delete(STATS_PREFIX + name)
+
+    # Some backends implement get() via get_many() or vice versa, so only
+    # the outermost call on a thread is counted.
+    def _enter(self):
+        depth = getattr(_call_depth, "value", 0)
+        _call_depth.value = depth + 1
+        return depth == 0
+
+    def _exit(self):
+        _call_depth.value -= 1
+
+    def get(self, key, default=None, version=None):
+        outermost = self._enter()
+        try:
+            value = super().get(key, _MISSING, version=version)
+        finally:
+            self._exit()
+        if outermost and not key.startswith(STATS_PREFIX):
+            hit = value is not _MISSING
+            self._record(int(hit), int(not hit))
+        return default if value is _MISSING else value
+
+    def get_many(self, keys, version=None):
+        keys = list(keys)
+        outermost = self._enter()
+        try:
+            found = super().get_many(keys, version=version)
+        finally:
+            self._exit()
+        if outermost:
+            self._record(len(found), len(keys) - len(found))
+        return found
+
+
+class LocMemCache(StatsMixin, _LocMemCache):
+    pass
+
+
+class FileBasedCache(StatsMixin, _FileBasedCache):
+    pass
+
+
+class DatabaseCache(StatsMixin, _DatabaseCache):
+    pass
+
+
+class RedisCache(StatsMixin, _RedisCache):
+    pass
@@ -0,0 +1,61 @@
+"""Report cache backend configuration and hit/miss rates."""
+from pathlib import Path
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.management.base import BaseCommand
+from django.db import connection
+
+
+class Command(BaseCommand):
+    help = "Show the configured cache backend and its shared hit/miss counters."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--reset", action="store_true", help="Reset the hit/miss counters after reporting.")
+
+    def handle(self, *args, **options):
+        conf = settings.CACHES["default"]
+        self.stdout.write(f"Backend:    {conf['BACKEND']}")
+        self.stdout.write(f"Location:   {conf.get('LOCATION', '')}")
+        self.stdout.write(f"Key prefix: {conf.get('KEY_PREFIX', '')} (version {conf.get('VERSION', 1)})")
+        max_entries = conf.get("OPTIONS", {}).get("MAX_ENTRIES")
+        if max_entries:
+            self.stdout.write(f"Max entries: {max_entries}")
+
+        entries = self._entry_count(conf)
+        if entries is not None:
+            self.stdout.write(f"Entries:    {entries}")
+
+        if not hasattr(cache, "read_stats"):
+            self.stdout.write(self.style.WARNING("Backend does not record hit/miss statistics."))
+            return
+
+        cache.flush_stats()
+        stats = cache.read_stats()
+        lookups = stats["hits"] + stats["misses"]
+        rate = (stats["hits"] / lookups * 100) if lookups else 0.0
+        self.stdout.write(f"Hits:       {stats['hits']}")
+        self.stdout.write(f"Misses:     {stats['misses']}")
+        self.stdout.write(self.style.SUCCESS(f"Hit rate:   {rate:.1f}% of {lookups} lookups"))
+
+        if options["reset"]:
+            cache.reset_stats()
+            self.stdout.write("Counters reset.")
+
+    def _entry_count(self, conf):
+        """Best-effort count of stored entries for the shared backends."""
+        backend = conf["BACKEND"]
+        try:
+            if backend.endswith("FileBasedCache"):
+                return sum(1 for _ in Path(conf["LOCATION"]).glob("*.djcache"))
+            if backend.endswith("DatabaseCache"):
+                table = connection.ops.quote_name(conf["LOCATION"])
+                with connection.cursor() as cursor:
+                    cursor.execute(f"SELECT COUNT(*) FROM {table}")
+                    return cursor.fetchone()[0]
+            if backend.endswith("RedisCache"):
+                client = cache._cache.get_client()
+                return client.dbsize()
+        except Exception as e:
+            self.stdout.write(self.style.WARNING(f"Could not count entries: {e}"))
+        return None
@@ -0,0 +1,123 @@
+"""Time the fast projection read path against the DRF serializers.
+
+Output parity is enforced by ``core.tests.test_projections``; this command
+re-checks it on real data before timing, so a benchmark never compares
+paths that disagree.
+"""
+import copy
+import json
+import time
+import uuid
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from rest_framework.renderers import JSONRenderer
+
+from core.models import BlogPost, BookingSlot, Event, Resource, Testimonial
+from core.serializers import (
+    BlogPostListProjection, BlogPostListSerializer,
+    BookingSlotProjection, BookingSlotSerializer,
+    EventProjection, EventSerializer,
+    ResourceProjection, ResourceSerializer,
+    TestimonialProjection, TestimonialSerializer,
+)
+
+CHECKS = [
+    ("blog posts", BlogPost, BlogPostListSerializer, BlogPostListProjection),
+    ("events", Event, EventSerializer, EventProjection),
+    ("testimonials", Testimonial, TestimonialSerializer, TestimonialProjection),
+    ("resources", Resource, ResourceSerializer, ResourceProjection),
+    ("booking slots", BookingSlot, BookingSlotSerializer, BookingSlotProjection),
+]
+
+
+class _Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = (
+        "Report the per-row cost of each Projection and its serializer on this "
+        "database (after confirming both render the same output)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--rows", type=int, default=0,
+            help="Add this many synthetic copies of an existing row per model (rolled back afterwards).",
+        )
+        parser.add_argument("--repeat", type=int, default=5, help="Timed runs per path (default 5).")
+
+    def handle(self, *args, **options):
+        failures = []
+        try:
+            with transaction.atomic():
+                for label, model, serializer_class, projection in CHECKS:
+                    if options["rows"]:
+                        self._add_copies(model, options["rows"])
+                    if not self._check(label, model, serializer_class, projection, options["repeat"]):
+                        failures.append(label)
+                raise _Rollback
+        except _Rollback:
+            pass
+
+        if failures:
+            raise CommandError(f"Projection output differs for: {', '.join(failures)}")
+        self.stdout.write(self.style.SUCCESS("All projections match their serializers."))
+
+    def _check(self, label, model, serializer_class, projection, repeat):
+        queryset = model.objects.all()
+        if model is Resource:
+            queryset = queryset.select_related("category")
+        rows = queryset.count()
+        if not rows:
+            self.stdout.write(f"  {label}: no rows, skipped.")
+            return True
+
+        expected = json.loads(JSONRenderer().render(serializer_class(queryset, many=True).data))
+        actual = json.loads(JSONRenderer().render(projection.serialize(queryset)))
+        if expected != actual:
+            for want, got in zip(expected, actual):
+                if want != got:
+                    diff = {k: (want.get(k), got.get(k)) for k in set(want) | set(got) if want.get(k) != got.get(k)}
+                    self.stdout.write(self.style.ERROR(f"  {label}: first mismatch {diff}"))
+                    break
+            else:
+                self.stdout.write(self.style.ERROR(f"  {label}: {len(expected)} vs {len(actual)} rows"))
+            return False
+
+        slow = self._time(lambda: serializer_class(queryset.all(), many=True).data, repeat)
+        fast = self._time(lambda: projection.serialize(queryset.all()), repeat)
+        self.stdout.write(
+            f"  {label}: {rows} rows identical; serializer {slow / rows * 1e6:.1f} us/row, "
+            f"projection {fast / rows * 1e6:.1f} us/row ({slow / fast:.1f}x)"
+        )
+        return True
+
+    @staticmethod
+    def _time(func, repeat):
+        best = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        return best
+
+    @staticmethod
+    def _add_copies(model, count):
+        template = model.objects.first()
+        if template is None:
+            return
+        unique = [f for f in model._meta.concrete_fields if f.unique and not f.primary_key]
+        copies = []
+        for i in range(count):
+            obj = copy.copy(template)
+            obj.pk = None
+            obj._state.adding = True
+            if isinstance(model._meta.pk.default, type(uuid.uuid4)):
+                obj.pk = uuid.uuid4()
+            for field in unique:
+                setattr(obj, field.attname, f"{getattr(template, field.attname)}-bench-{i}")
+            copies.append(obj)
+        model.objects.bulk_create(copies, batch_size=500)
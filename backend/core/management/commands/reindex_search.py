@@ -0,0 +1,30 @@
+"""Rebuild the site-wide search index (and the SQLite blog full-text table)."""
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+
+from core.models import BlogPost, Event, Resource
+from core.utils import blog_search, site_search
+
+MODELS = {"blog": BlogPost, "resource": Resource, "event": Event}
+
+
+class Command(BaseCommand):
+    help = "Rebuild the SearchTerm inverted index from the published blog posts, resources and events."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--kind", action="append", choices=sorted(MODELS),
+            help="Only rebuild this content type (repeatable; default: all).",
+        )
+
+    def handle(self, *args, **options):
+        for kind in options["kind"] or sorted(MODELS):
+            with transaction.atomic():
+                count = site_search.rebuild(MODELS[kind])
+            self.stdout.write(f"  {kind}: {count} published objects indexed.")
+
+        if connection.vendor == "sqlite" and (not options["kind"] or "blog" in options["kind"]):
+            with transaction.atomic():
+                blog_search.rebuild_sqlite(BlogPost.objects.only("pk", "title", "excerpt", "content").iterator())
+            self.stdout.write("  blog full-text table rebuilt.")
+        self.stdout.write(self.style.SUCCESS("Search index rebuilt."))
@@ -0,0 +1,67 @@
+"""Roll old AIUsageLog rows up into AIUsageDaily and delete them in batches."""
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count, F, Sum
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from core.models import AIUsageLog, AIUsageDaily
+
+
+class Command(BaseCommand):
+    help = (
+        "Aggregate AI usage log rows older than --days into daily totals, "
+        "then delete the raw rows in bounded batches."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--days", type=int, default=30, help="Keep raw rows for this many days (default 30).")
+        parser.add_argument("--batch-size", type=int, default=1000, help="Rows per transaction (default 1000).")
+        parser.add_argument("--dry-run", action="store_true", help="Report how many rows would be rolled up.")
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(days=options["days"])
+        batch_size = options["batch_size"]
+        old_rows = AIUsageLog.objects.filter(created_at__lt=cutoff)
+
+        if options["dry_run"]:
+            self.stdout.write(f"{old_rows.count()} rows older than {cutoff:%Y-%m-%d %H:%M} would be rolled up.")
+            return
+
+        total = 0
+        while True:
+            ids = list(old_rows.order_by("pk").values_list("pk", flat=True)[:batch_size])
+            if not ids:
+                break
+            # One short transaction per batch: aggregate, upsert, delete.
+            with transaction.atomic():
+                self._rollup(ids)
+                AIUsageLog.objects.filter(pk__in=ids).delete()
+            total += len(ids)
+            self.stdout.write(f"  Rolled up {total} rows...")
+
+        self.stdout.write(self.style.SUCCESS(f"Rolled up and deleted {total} AI usage rows."))
+
+    def _rollup(self, ids):
+        groups = (
+            AIUsageLog.objects.filter(pk__in=ids)
+            .annotate(day=TruncDate("created_at"))
+            .values("day", "session_id", "user")
+            .annotate(requests=Count("pk"), tokens=Sum("tokens_used"))
+            .order_by()
+        )
+        for group in groups:
+            updated = AIUsageDaily.objects.filter(date=group["day"], session_id=group["session_id"]).update(
+                requests=F("requests") + group["requests"],
+                tokens_used=F("tokens_used") + (group["tokens"] or 0),
+            )
+            if not updated:
+                AIUsageDaily.objects.create(
+                    date=group["day"],
+                    session_id=group["session_id"],
+                    user_id=group["user"],
+                    requests=group["requests"],
+                    tokens_used=group["tokens"] or 0,
+                )
@@ -0,0 +1,51 @@
+"""Deliver queued emails from the outbox, one SMTP connection per batch."""
+import signal
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from core.models import SystemConfiguration
+from core.utils import outbox
+
+
+class Command(BaseCommand):
+    help = (
+        "Drain the email outbox in batches, reusing one authenticated SMTP "
+        "connection per batch and retrying failures with backoff."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=50, help="Messages per SMTP connection (default 50).")
+        parser.add_argument("--interval", type=float, default=5, help="Seconds to sleep when idle (default 5).")
+        parser.add_argument("--once", action="store_true", help="Drain what is due now, then exit.")
+
+    def handle(self, *args, **options):
+        self._stopping = False
+        signal.signal(signal.SIGTERM, self._stop)
+        signal.signal(signal.SIGINT, self._stop)
+
+        totals = {"sent": 0, "pending": 0, "failed": 0}
+        while not self._stopping:
+            close_old_connections()
+            batch = outbox.claim_batch(options["batch_size"])
+            if batch:
+                counts = outbox.deliver(batch, SystemConfiguration.load())
+                for key, value in counts.items():
+                    totals[key] += value
+                self.stdout.write(
+                    f"  Batch of {len(batch)}: {counts['sent']} sent, "
+                    f"{counts['pending']} to retry, {counts['failed']} failed."
+                )
+                continue
+            if options["once"]:
+                break
+            time.sleep(options["interval"])
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Outbox: {totals['sent']} sent, {totals['pending']} to retry, {totals['failed']} failed."
+        ))
+
+    def _stop(self, signum, frame):
+        # Finish the current batch, then exit.
+        self._stopping = True
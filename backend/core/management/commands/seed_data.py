@@ -268,7 +268,7 @@ class Command(BaseCommand):
             self.stdout.write(self.style.SUCCESS("  Created demo session notes"))
 
         # System config
-        config = SystemConfiguration.load()
+        config = SystemConfiguration.load(cached=False)
         if not config.resend_api_key:
             config.resend_api_key = "re_H8VLx8Ns_6ZwRYxLRCqtL6B8BLXHBixJN"
             config.email_test_mode = True
@@ -1,20 +1,54 @@
-"""Custom middleware for the LiLy Stoica platform."""
+"""Custom middleware for the LiLy Stoica platform.
+
+Every middleware here supports both sync and async requests. Under ASGI a
+single sync-only middleware would run every request, async views included,
+through a thread again.
+"""
 import logging
 import time
 
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.utils.deprecation import MiddlewareMixin
+from whitenoise.middleware import WhiteNoiseMiddleware as BaseWhiteNoiseMiddleware
+
 logger = logging.getLogger("core")
 
 
-class RequestLoggingMiddleware:
-    """Log every request with timing, user and IP."""
+class WhiteNoiseMiddleware(BaseWhiteNoiseMiddleware):
+    """WhiteNoise with an async code path (whitenoise 6.6 is sync-only)."""
 
-    def __init__(self, get_response):
-        self.get_response = get_response
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response=None, settings=settings):
+        super().__init__(get_response, settings)
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
 
     def __call__(self, request):
-        start = time.time()
-        response = self.get_response(request)
-        duration = time.time() - start
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        return super().__call__(request)
+
+    async def __acall__(self, request):
+        if self.autorefresh:
+            static_file = await sync_to_async(self.find_file)(request.path_info)
+        else:
+            static_file = self.files.get(request.path_info)
+        if static_file is not None:
+            return await sync_to_async(self.serve)(static_file, request)
+        return await self.get_response(request)
+
+
+class RequestLoggingMiddleware(MiddlewareMixin):
+    """Log every request with timing, user and IP."""
+
+    def process_request(self, request):
+        request._logging_start = time.time()
+
+    def process_response(self, request, response):
+        duration = time.time() - getattr(request, "_logging_start", time.time())
 
         user = getattr(request, "user", None)
         user_str = str(user) if user and user.is_authenticated else "anonymous"
@@ -35,14 +69,10 @@ class RequestLoggingMiddleware:
         return response
 
 
-class SecurityHeadersMiddleware:
+class SecurityHeadersMiddleware(MiddlewareMixin):
     """Add security headers to every response."""
 
-    def __init__(self, get_response):
-        self.get_response = get_response
-
-    def __call__(self, request):
-        response = self.get_response(request)
+    def process_response(self, request, response):
         response["X-Content-Type-Options"] = "nosniff"
         response["X-Frame-Options"] = "DENY"
         response["Referrer-Policy"] = "strict-origin-when-cross-origin"
@@ -0,0 +1,23 @@
+# Generated by Django 4.2.7 on 2026-10-17 01:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0005_lead_magnet_customisation'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='systemconfiguration',
+            name='ai_rate_per_day',
+            field=models.PositiveIntegerField(default=50, help_text='Max AI messages per 24 hours per visitor.'),
+        ),
+        migrations.AddField(
+            model_name='systemconfiguration',
+            name='ai_rate_per_minute',
+            field=models.PositiveIntegerField(default=5, help_text='Max AI messages per minute per visitor.'),
+        ),
+    ]
@@ -0,0 +1,50 @@
+# Generated by Django 4.2.7 on 2026-10-17 01:12
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0006_systemconfiguration_ai_rate_limits'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AIUsageDaily',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('session_id', models.CharField(blank=True, default='', max_length=100)),
+                ('requests', models.PositiveIntegerField(default=0)),
+                ('tokens_used', models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                'verbose_name_plural': 'AI usage (daily)',
+                'ordering': ['-date'],
+            },
+        ),
+        migrations.AddIndex(
+            model_name='aiusagelog',
+            index=models.Index(fields=['session_id', '-created_at'], name='core_aiusag_session_824e8a_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='aiusagelog',
+            index=models.Index(fields=['user', '-created_at'], name='core_aiusag_user_id_ac7ae7_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='aiusagelog',
+            index=models.Index(fields=['-created_at'], name='core_aiusag_created_d8985b_idx'),
+        ),
+        migrations.AddField(
+            model_name='aiusagedaily',
+            name='user',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='ai_usage_daily', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddConstraint(
+            model_name='aiusagedaily',
+            constraint=models.UniqueConstraint(fields=('date', 'session_id'), name='uniq_ai_usage_daily_session'),
+        ),
+    ]
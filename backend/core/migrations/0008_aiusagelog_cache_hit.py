@@ -0,0 +1,23 @@
+# Generated by Django 4.2.7 on 2026-10-17 01:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0007_aiusagelog_indexes_aiusagedaily'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='aiusagelog',
+            name='cache_hit',
+            field=models.BooleanField(default=False, help_text='Answered from the answer cache, not Gemini.'),
+        ),
+        migrations.AddField(
+            model_name='aiusagelog',
+            name='prompt_version',
+            field=models.CharField(blank=True, default='', help_text='Hash of the system prompt and token limit used.', max_length=16),
+        ),
+    ]
@@ -0,0 +1,35 @@
+"""Backfill BlogPost.word_count/reading_time in batches."""
+import re
+
+from django.db import migrations
+
+BATCH_SIZE = 200
+
+
+def backfill(apps, schema_editor):
+    BlogPost = apps.get_model("core", "BlogPost")
+    last_pk = None
+    while True:
+        batch = BlogPost.objects.order_by("pk").only("pk", "content")
+        if last_pk is not None:
+            batch = batch.filter(pk__gt=last_pk)
+        batch = list(batch[:BATCH_SIZE])
+        if not batch:
+            break
+        for post in batch:
+            # Same formula as BlogPost.reading_stats (historical models have no methods).
+            post.word_count = len(re.findall(r"\w+", post.content or ""))
+            post.reading_time = max(1, round(post.word_count / 200))
+        BlogPost.objects.bulk_update(batch, ["word_count", "reading_time"])
+        last_pk = batch[-1].pk
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0010_blogpost_word_count"),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill, migrations.RunPython.noop),
+    ]
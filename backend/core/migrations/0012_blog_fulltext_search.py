@@ -0,0 +1,86 @@
+"""Full-text index for blog posts: tsvector + trigger + GIN on PostgreSQL, FTS5 on SQLite.
+
+The SQL is written out here rather than imported from ``core.utils.blog_search``
+so that later changes to the search module cannot alter what this migration does.
+"""
+from django.db import migrations
+from django.utils.html import strip_tags
+
+FTS_TABLE = "core_blogpost_fts"
+PG_WEIGHTED_VECTOR = (
+    "setweight(to_tsvector('english', coalesce({row}.title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce({row}.excerpt, '')), 'B') || "
+    "setweight(to_tsvector('english', coalesce({row}.content, '')), 'C')"
+)
+FTS_INSERT = f"INSERT INTO {FTS_TABLE} (post_id, title, excerpt, content) VALUES (%s, %s, %s, %s)"
+
+
+def install_postgres(schema_editor):
+    schema_editor.execute("ALTER TABLE core_blogpost ADD COLUMN IF NOT EXISTS search_vector tsvector")
+    schema_editor.execute(f"""
+        CREATE OR REPLACE FUNCTION core_blogpost_search_vector_update() RETURNS trigger AS $$
+        BEGIN
+            NEW.search_vector := {PG_WEIGHTED_VECTOR.format(row='NEW')};
+            RETURN NEW;
+        END
+        $$ LANGUAGE plpgsql
+    """)
+    schema_editor.execute("DROP TRIGGER IF EXISTS core_blogpost_search_vector_trigger ON core_blogpost")
+    schema_editor.execute("""
+        CREATE TRIGGER core_blogpost_search_vector_trigger
+        BEFORE INSERT OR UPDATE OF title, excerpt, content ON core_blogpost
+        FOR EACH ROW EXECUTE FUNCTION core_blogpost_search_vector_update()
+    """)
+    schema_editor.execute(
+        f"UPDATE core_blogpost SET search_vector = {PG_WEIGHTED_VECTOR.format(row='core_blogpost')}"
+    )
+    schema_editor.execute(
+        "CREATE INDEX IF NOT EXISTS core_blogpost_search_vector_gin ON core_blogpost USING gin (search_vector)"
+    )
+
+
+def install_sqlite(apps, schema_editor):
+    BlogPost = apps.get_model("core", "BlogPost")
+    schema_editor.execute(
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5("
+        "post_id UNINDEXED, title, excerpt, content, "
+        "tokenize = 'porter unicode61 remove_diacritics 2')"
+    )
+    schema_editor.execute(f"DELETE FROM {FTS_TABLE}")
+    rows = [
+        [post.pk.hex, post.title, strip_tags(post.excerpt or ""), strip_tags(post.content or "")]
+        for post in BlogPost.objects.only("pk", "title", "excerpt", "content").iterator(chunk_size=200)
+    ]
+    if rows:
+        with schema_editor.connection.cursor() as cursor:
+            cursor.executemany(FTS_INSERT, rows)
+
+
+def install(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == "postgresql":
+        install_postgres(schema_editor)
+    elif vendor == "sqlite":
+        install_sqlite(apps, schema_editor)
+
+
+def uninstall(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == "postgresql":
+        schema_editor.execute("DROP TRIGGER IF EXISTS core_blogpost_search_vector_trigger ON core_blogpost")
+        schema_editor.execute("DROP FUNCTION IF EXISTS core_blogpost_search_vector_update()")
+        schema_editor.execute("DROP INDEX IF EXISTS core_blogpost_search_vector_gin")
+        schema_editor.execute("ALTER TABLE core_blogpost DROP COLUMN IF EXISTS search_vector")
+    elif vendor == "sqlite":
+        schema_editor.execute(f"DROP TABLE IF EXISTS {FTS_TABLE}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0011_backfill_blogpost_word_count"),
+    ]
+
+    operations = [
+        migrations.RunPython(install, uninstall),
+    ]
@@ -0,0 +1,95 @@
+# Generated by Django 4.2.7 on 2026-10-17 01:31
+
+import math
+import re
+import unicodedata
+from collections import Counter, defaultdict
+
+from django.db import migrations, models
+from django.utils.html import strip_tags
+
+# The initial index build is a frozen copy of core.utils.site_search as of
+# this migration, so later changes to that module cannot alter what it does.
+# ``manage.py reindex_search`` rebuilds with the current rules.
+
+STOP_WORDS = frozenset("""
+    a an and are as at be but by for from has have how i if in into is it its
+    my of on or our so than that the their them then there these they this to
+    was we what when where which who will with you your
+""".split())
+SOURCES = {
+    "blog": ("BlogPost", [("title", 10.0), ("tags", 5.0), ("excerpt", 4.0), ("content", 1.0)]),
+    "resource": ("Resource", [("title", 10.0), ("description", 4.0), ("content", 1.0)]),
+    "event": ("Event", [("title", 10.0), ("location", 3.0), ("description", 2.0)]),
+}
+MAX_TERM_LENGTH = 64
+
+
+def _stem(word):
+    for suffix in ("ing", "edly", "ed", "ies", "es", "s"):
+        if word.endswith(suffix) and len(word) - len(suffix) >= 3 and not word.endswith("ss"):
+            word = word[: -len(suffix)]
+            return word + "y" if suffix == "ies" else word
+    return word
+
+
+def _terms(text):
+    text = unicodedata.normalize("NFKD", strip_tags(text or "")).encode("ascii", "ignore").decode().lower()
+    return [
+        _stem(word)[:MAX_TERM_LENGTH]
+        for word in re.findall(r"[a-z0-9]+", text)
+        if word not in STOP_WORDS and len(word) > 1
+    ]
+
+
+def _postings(obj, fields):
+    weights = defaultdict(float)
+    for field, field_weight in fields:
+        value = getattr(obj, field)
+        if isinstance(value, (list, tuple)):
+            value = " ".join(str(item) for item in value)
+        for term, count in Counter(_terms(value)).items():
+            weights[term] += field_weight * (1 + math.log(count))
+    return weights
+
+
+def build_index(apps, schema_editor):
+    SearchTerm = apps.get_model("core", "SearchTerm")
+    for kind, (model_name, fields) in SOURCES.items():
+        model = apps.get_model("core", model_name)
+        names = [field for field, _weight in fields]
+        rows = []
+        for obj in model.objects.filter(is_published=True).only("pk", *names).iterator(chunk_size=200):
+            rows.extend(
+                SearchTerm(term=term, kind=kind, object_id=str(obj.pk), weight=round(weight, 4))
+                for term, weight in _postings(obj, fields).items()
+            )
+        SearchTerm.objects.bulk_create(rows, batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0012_blog_fulltext_search'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchTerm',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('term', models.CharField(db_index=True, max_length=64)),
+                ('kind', models.CharField(choices=[('blog', 'Blog post'), ('resource', 'Resource'), ('event', 'Event')], max_length=10)),
+                ('object_id', models.CharField(help_text='Primary key of the indexed object, as text', max_length=36)),
+                ('weight', models.FloatField(help_text='Field-weighted term frequency score')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['kind', 'object_id'], name='core_search_kind_afb622_idx')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='searchterm',
+            constraint=models.UniqueConstraint(fields=('term', 'kind', 'object_id'), name='uniq_search_term_posting'),
+        ),
+        migrations.RunPython(build_index, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,57 @@
+# Generated by Django 4.2.7 on 2026-10-17 01:32
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def backfill_tags(apps, schema_editor):
+    # Same rules as BlogPost.clean_tag_names / sync_tags (historical models have no methods).
+    BlogPost = apps.get_model("core", "BlogPost")
+    Tag = apps.get_model("core", "Tag")
+    BlogPostTag = apps.get_model("core", "BlogPostTag")
+    counts = {}
+    links = []
+    for pk, tags, is_published in BlogPost.objects.values_list("pk", "tags", "is_published").iterator():
+        names = [str(tag).strip()[:100] for tag in tags] if isinstance(tags, list) else []
+        for name in dict.fromkeys(name for name in names if name):
+            counts[name] = counts.get(name, 0) + int(is_published)
+            links.append((pk, name))
+    Tag.objects.bulk_create([Tag(name=name, published_count=n) for name, n in counts.items()], batch_size=500)
+    tag_ids = dict(Tag.objects.values_list("name", "pk"))
+    BlogPostTag.objects.bulk_create(
+        [BlogPostTag(post_id=pk, tag_id=tag_ids[name]) for pk, name in links], batch_size=500,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0013_searchterm'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Tag',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100, unique=True)),
+                ('published_count', models.PositiveIntegerField(default=0, help_text='Published posts carrying this tag')),
+            ],
+            options={
+                'ordering': ['name'],
+            },
+        ),
+        migrations.CreateModel(
+            name='BlogPostTag',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('post', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='tag_links', to='core.blogpost')),
+                ('tag', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='post_links', to='core.tag')),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='blogposttag',
+            constraint=models.UniqueConstraint(fields=('post', 'tag'), name='uniq_blog_post_tag'),
+        ),
+        migrations.RunPython(backfill_tags, migrations.RunPython.noop),
+    ]
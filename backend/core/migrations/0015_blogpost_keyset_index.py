@@ -0,0 +1,17 @@
+# Generated by Django 4.2.7 on 2026-10-17 01:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0014_blog_tag_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='blogpost',
+            index=models.Index(fields=['is_published', '-is_pinned', '-published_at', '-created_at', '-id'], name='blogpost_keyset_idx'),
+        ),
+    ]
@@ -0,0 +1,51 @@
+# Generated by Django 4.2.7 on 2026-10-17 01:39
+
+import logging
+
+from django.db import migrations, models
+from django.db.models import Count
+
+logger = logging.getLogger("core")
+
+ACTIVE = ["pending", "confirmed", "completed"]
+PRECEDENCE = {"completed": 0, "confirmed": 1, "pending": 2}
+
+
+def cancel_double_bookings(apps, schema_editor):
+    """Keep one active booking per slot so the constraint can be added.
+
+    The old read-then-write booking race could book a slot twice. The
+    booking that went furthest (completed, then confirmed, then the earliest
+    pending) is kept; the others are cancelled and logged.
+    """
+    Booking = apps.get_model("core", "Booking")
+    slots = (
+        Booking.objects.filter(status__in=ACTIVE, slot__isnull=False)
+        .values("slot").annotate(n=Count("pk")).filter(n__gt=1).values_list("slot", flat=True)
+    )
+    for slot_id in list(slots):
+        bookings = sorted(
+            Booking.objects.filter(slot_id=slot_id, status__in=ACTIVE),
+            key=lambda b: (PRECEDENCE[b.status], b.created_at, b.pk),
+        )
+        keep, extra = bookings[0], bookings[1:]
+        Booking.objects.filter(pk__in=[b.pk for b in extra]).update(status="cancelled")
+        logger.warning(
+            "Slot #%s was booked %d times: kept booking #%s, cancelled %s.",
+            slot_id, len(bookings), keep.pk, ", ".join(f"#{b.pk}" for b in extra),
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0015_blogpost_keyset_index'),
+    ]
+
+    operations = [
+        migrations.RunPython(cancel_double_bookings, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='booking',
+            constraint=models.UniqueConstraint(condition=models.Q(('status__in', ['pending', 'confirmed', 'completed'])), fields=('slot',), name='uniq_active_booking_per_slot'),
+        ),
+    ]
@@ -0,0 +1,56 @@
+# Generated by Django 4.2.7 on 2026-10-17 01:41
+
+import logging
+
+from django.db import migrations, models
+
+logger = logging.getLogger("core")
+
+ACTIVE = ["pending", "confirmed", "completed"]
+PRECEDENCE = {"completed": 0, "confirmed": 1, "pending": 2}
+
+
+def merge_duplicate_slots(apps, schema_editor):
+    # Older bulk runs and admin_create_slot could create the same slot twice.
+    # Keep the oldest row, move bookings onto it and drop the rest. A slot can
+    # hold one active booking (0016), so when both copies were booked the
+    # booking that went furthest is kept and the others are cancelled.
+    BookingSlot = apps.get_model("core", "BookingSlot")
+    Booking = apps.get_model("core", "Booking")
+    seen = {}
+    for slot in BookingSlot.objects.order_by("pk").iterator():
+        key = (slot.date, slot.start_time, slot.end_time, slot.session_type)
+        keeper = seen.setdefault(key, slot)
+        if keeper is slot:
+            continue
+        active = sorted(
+            Booking.objects.filter(slot_id__in=[keeper.pk, slot.pk], status__in=ACTIVE),
+            key=lambda b: (PRECEDENCE[b.status], b.created_at, b.pk),
+        )
+        if len(active) > 1:
+            keep, extra = active[0], active[1:]
+            Booking.objects.filter(pk__in=[b.pk for b in extra]).update(status="cancelled")
+            logger.warning(
+                "Slot #%s duplicated slot #%s and both were booked: kept booking #%s, cancelled %s.",
+                slot.pk, keeper.pk, keep.pk, ", ".join(f"#{b.pk}" for b in extra),
+            )
+        Booking.objects.filter(slot_id=slot.pk).update(slot_id=keeper.pk)
+        if not slot.is_available and keeper.is_available:
+            keeper.is_available = False
+            keeper.save(update_fields=["is_available"])
+        slot.delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0016_booking_active_slot_unique'),
+    ]
+
+    operations = [
+        migrations.RunPython(merge_duplicate_slots, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='bookingslot',
+            constraint=models.UniqueConstraint(fields=('date', 'start_time', 'end_time', 'session_type'), name='uniq_booking_slot'),
+        ),
+    ]
@@ -0,0 +1,85 @@
+# Generated by Django 4.2.7 on 2026-10-17 01:42
+
+import logging
+
+from django.db import migrations, models
+
+logger = logging.getLogger("core")
+
+CONSTRAINT = "booking_slot_no_overlap"
+ACTIVE = ["pending", "confirmed", "completed"]
+OVERLAPS_SQL = """
+    SELECT a.id, b.id FROM core_bookingslot a
+    JOIN core_bookingslot b
+      ON b.date = a.date AND b.id > a.id
+     AND a.start_time < b.end_time AND b.start_time < a.end_time
+    ORDER BY a.date, a.start_time
+"""
+
+
+def remove_overlaps(apps, overlaps):
+    """Delete one slot of each overlapping pair so the constraint can be added.
+
+    The slot without an active booking goes (the newer one if neither has
+    one). A pair where both slots are booked cannot be resolved here, so the
+    migration fails and names them before anything is deleted.
+    """
+    BookingSlot = apps.get_model("core", "BookingSlot")
+    Booking = apps.get_model("core", "Booking")
+    booked = set(
+        Booking.objects.filter(status__in=ACTIVE, slot__isnull=False).values_list("slot_id", flat=True)
+    )
+    removed, conflicts = set(), []
+    for a, b in overlaps:
+        if a in removed or b in removed:
+            continue
+        if a in booked and b in booked:
+            conflicts.append((a, b))
+        else:
+            removed.add(a if b in booked else b)
+    if conflicts:
+        raise RuntimeError(
+            f"Cannot add {CONSTRAINT}: {len(conflicts)} pair(s) of overlapping slots both have active "
+            f"bookings ({', '.join(f'#{a} and #{b}' for a, b in conflicts[:10])}). "
+            "Move or cancel one booking of each pair, then run the migration again."
+        )
+    if removed:
+        BookingSlot.objects.filter(pk__in=removed).delete()
+        logger.warning(
+            "Deleted %d unbooked slot(s) that overlapped another slot: %s.",
+            len(removed), ", ".join(f"#{pk}" for pk in sorted(removed)),
+        )
+
+
+def add_exclusion(apps, schema_editor):
+    # Any two slots whose [start, end) ranges on the same day intersect are
+    # rejected, whatever their session type. Touching slots are allowed.
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(OVERLAPS_SQL)
+        remove_overlaps(apps, cursor.fetchall())
+    schema_editor.execute(
+        f"ALTER TABLE core_bookingslot ADD CONSTRAINT {CONSTRAINT} "
+        "EXCLUDE USING gist (tsrange(date + start_time, date + end_time) WITH &&)"
+    )
+
+
+def drop_exclusion(apps, schema_editor):
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.execute(f"ALTER TABLE core_bookingslot DROP CONSTRAINT IF EXISTS {CONSTRAINT}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0017_booking_slot_unique'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='bookingslot',
+            constraint=models.CheckConstraint(check=models.Q(('end_time__gt', models.F('start_time'))), name='booking_slot_end_after_start'),
+        ),
+        migrations.RunPython(add_exclusion, drop_exclusion),
+    ]
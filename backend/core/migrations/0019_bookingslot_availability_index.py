@@ -0,0 +1,17 @@
+# Generated by Django 4.2.7 on 2026-10-17 01:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0018_booking_slot_no_overlap'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='bookingslot',
+            index=models.Index(fields=['is_available', 'date', 'start_time'], name='bookingslot_avail_idx'),
+        ),
+    ]
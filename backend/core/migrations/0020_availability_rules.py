@@ -0,0 +1,42 @@
+# Generated by Django 4.2.7 on 2026-10-17 01:45
+
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0019_bookingslot_availability_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AvailabilityRule',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('weekday', models.PositiveSmallIntegerField(choices=[(0, 'Monday'), (1, 'Tuesday'), (2, 'Wednesday'), (3, 'Thursday'), (4, 'Friday'), (5, 'Saturday'), (6, 'Sunday')])),
+                ('start_time', models.TimeField()),
+                ('end_time', models.TimeField()),
+                ('session_type', models.CharField(choices=[('discovery', 'Discovery call'), ('standard', 'Standard session'), ('intensive', 'Intensive session')], default='standard', max_length=20)),
+                ('valid_from', models.DateField(default=django.utils.timezone.localdate)),
+                ('valid_until', models.DateField(blank=True, help_text='Last date the rule applies (blank = open-ended)', null=True)),
+                ('exceptions', models.JSONField(blank=True, default=list, help_text='Dates (YYYY-MM-DD) the rule does not apply')),
+                ('is_active', models.BooleanField(default=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'ordering': ['weekday', 'start_time'],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='availabilityrule',
+            constraint=models.CheckConstraint(check=models.Q(('end_time__gt', models.F('start_time'))), name='availability_rule_end_after_start'),
+        ),
+        migrations.AddField(
+            model_name='bookingslot',
+            name='rule',
+            field=models.ForeignKey(blank=True, help_text='The rule this slot was materialised from when booked', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='slots', to='core.availabilityrule'),
+        ),
+    ]
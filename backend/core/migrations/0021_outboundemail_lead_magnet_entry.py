@@ -0,0 +1,19 @@
+# Generated by Django 4.2.7 on 2026-10-17 02:00
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0020_availability_rules'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='outboundemail',
+            name='lead_magnet_entry',
+            field=models.ForeignKey(blank=True, help_text='Marked delivered when this email is sent.', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='emails', to='core.leadmagnetentry'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 4.2.7 on 2026-10-17 02:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0021_outboundemail_lead_magnet_entry'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='systemconfiguration',
+            name='ai_rate_per_day',
+            field=models.PositiveIntegerField(default=50, help_text='Max AI messages per 24 hours per visitor (0 for no limit).'),
+        ),
+        migrations.AlterField(
+            model_name='systemconfiguration',
+            name='ai_rate_per_minute',
+            field=models.PositiveIntegerField(default=5, help_text='Max AI messages per minute per visitor (0 for no limit).'),
+        ),
+    ]
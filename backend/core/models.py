@@ -1,14 +1,19 @@
 """
 Core models for the LiLy Stoica platform.
 Email-based custom User, booking system, blog, events, testimonials,
-lead magnet, AI usage, video rooms, system configuration.
+lead magnet, AI usage, video rooms, email outbox, site search index,
+system configuration.
 """
+import re
 import uuid
 from django.conf import settings
 from django.contrib.auth.models import AbstractBaseUser, BaseUserManager, PermissionsMixin
 from django.db import models
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 
+from .utils import config_cache
+
 
 # ---------------------------------------------------------------------------
 # User
@@ -77,24 +82,86 @@ class User(AbstractBaseUser, PermissionsMixin):
 # ---------------------------------------------------------------------------
 # Booking system
 # ---------------------------------------------------------------------------
-class BookingSlot(models.Model):
-    """An available time slot created by the admin."""
+SESSION_TYPE_CHOICES = [
+    ("discovery", "Discovery call"),
+    ("standard", "Standard session"),
+    ("intensive", "Intensive session"),
+]
+
+
+class AvailabilityRule(models.Model):
+    """A standing weekly opening, expanded into bookable times on demand.
 
-    SESSION_TYPE_CHOICES = [
-        ("discovery", "Discovery call"),
-        ("standard", "Standard session"),
-        ("intensive", "Intensive session"),
+    No rows are stored per occurrence: ``core.utils.availability`` expands
+    the rules for whatever window is requested, and a ``BookingSlot`` is
+    created only when an occurrence is booked.
+    """
+
+    WEEKDAY_CHOICES = [
+        (0, "Monday"), (1, "Tuesday"), (2, "Wednesday"), (3, "Thursday"),
+        (4, "Friday"), (5, "Saturday"), (6, "Sunday"),
     ]
 
+    weekday = models.PositiveSmallIntegerField(choices=WEEKDAY_CHOICES)
+    start_time = models.TimeField()
+    end_time = models.TimeField()
+    session_type = models.CharField(max_length=20, choices=SESSION_TYPE_CHOICES, default="standard")
+    valid_from = models.DateField(default=timezone.localdate)
+    valid_until = models.DateField(null=True, blank=True, help_text="Last date the rule applies (blank = open-ended)")
+    exceptions = models.JSONField(default=list, blank=True, help_text="Dates (YYYY-MM-DD) the rule does not apply")
+    is_active = models.BooleanField(default=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ["weekday", "start_time"]
+        constraints = [
+            models.CheckConstraint(check=models.Q(end_time__gt=models.F("start_time")), name="availability_rule_end_after_start"),
+        ]
+
+    def __str__(self):
+        return f"{self.get_weekday_display()} {self.start_time}-{self.end_time} ({self.session_type})"
+
+    def occurs_on(self, day):
+        """True if the rule offers a time on ``day`` (a date)."""
+        return (
+            self.is_active
+            and day.weekday() == self.weekday
+            and day >= self.valid_from
+            and (self.valid_until is None or day <= self.valid_until)
+            and day.isoformat() not in self.exceptions
+        )
+
+
+class BookingSlot(models.Model):
+    """A bookable time: a one-off slot created by the admin, or a booked rule occurrence."""
+
+    SESSION_TYPE_CHOICES = SESSION_TYPE_CHOICES
+
     date = models.DateField()
     start_time = models.TimeField()
     end_time = models.TimeField()
     session_type = models.CharField(max_length=20, choices=SESSION_TYPE_CHOICES, default="standard")
     is_available = models.BooleanField(default=True)
+    rule = models.ForeignKey(
+        AvailabilityRule, on_delete=models.SET_NULL, null=True, blank=True, related_name="slots",
+        help_text="The rule this slot was materialised from when booked",
+    )
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
         ordering = ["date", "start_time"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["date", "start_time", "end_time", "session_type"], name="uniq_booking_slot",
+            ),
+            models.CheckConstraint(check=models.Q(end_time__gt=models.F("start_time")), name="booking_slot_end_after_start"),
+            # PostgreSQL also gets an exclusion constraint against overlapping
+            # slots (migration 0018); elsewhere the views' overlap check applies.
+        ]
+        indexes = [
+            # Availability listings and the month calendar: WHERE is_available AND date BETWEEN ...
+            models.Index(fields=["is_available", "date", "start_time"], name="bookingslot_avail_idx"),
+        ]
 
     def __str__(self):
         return f"{self.date} {self.start_time}-{self.end_time} ({self.session_type})"
@@ -121,6 +188,14 @@ class Booking(models.Model):
 
     class Meta:
         ordering = ["-created_at"]
+        constraints = [
+            # At most one live booking per slot; cancelled ones keep their slot for history.
+            models.UniqueConstraint(
+                fields=["slot"],
+                condition=models.Q(status__in=["pending", "confirmed", "completed"]),
+                name="uniq_active_booking_per_slot",
+            ),
+        ]
 
     def __str__(self):
         return f"Booking #{self.pk} - {self.client.full_name} ({self.status})"
@@ -171,6 +246,8 @@ class BlogPost(models.Model):
     is_published = models.BooleanField(default=False)
     is_pinned = models.BooleanField(default=False, help_text="Pin to top of blog listing")
     view_count = models.PositiveIntegerField(default=0)
+    word_count = models.PositiveIntegerField(default=0, editable=False)
+    reading_time = models.PositiveSmallIntegerField(default=1, editable=False, help_text="Minutes, computed on save")
     seo_title = models.CharField(max_length=300, blank=True, default="", help_text="Override browser tab title")
     seo_description = models.TextField(blank=True, default="", help_text="Override meta description")
     published_at = models.DateTimeField(null=True, blank=True)
@@ -183,17 +260,30 @@ class BlogPost(models.Model):
             models.Index(fields=["-published_at"]),
             models.Index(fields=["slug"]),
             models.Index(fields=["is_published", "-published_at"]),
+            # Keyset pagination walks this in order (see core.views.blog).
+            models.Index(
+                fields=["is_published", "-is_pinned", "-published_at", "-created_at", "-id"],
+                name="blogpost_keyset_idx",
+            ),
         ]
 
     def __str__(self):
         return self.title
 
-    @property
-    def reading_time(self):
-        """Estimate reading time in minutes based on ~200 words per minute."""
-        import re
-        word_count = len(re.findall(r"\w+", self.content))
-        return max(1, round(word_count / 200))
+    def save(self, *args, **kwargs):
+        # word_count/reading_time are denormalised so listings never need the body.
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None or "content" in update_fields:
+            self.word_count, self.reading_time = self.reading_stats(self.content)
+            if update_fields is not None:
+                kwargs["update_fields"] = set(update_fields) | {"word_count", "reading_time"}
+        super().save(*args, **kwargs)
+
+    @staticmethod
+    def reading_stats(content):
+        """Return (word_count, reading_time in minutes at ~200 words per minute)."""
+        word_count = len(re.findall(r"\w+", content or ""))
+        return word_count, max(1, round(word_count / 200))
 
     @property
     def featured_image_url(self):
@@ -201,6 +291,68 @@ class BlogPost(models.Model):
             return self.featured_image.url
         return ""
 
+    @staticmethod
+    def clean_tag_names(tags):
+        """Distinct, stripped tag names from the ``tags`` JSON, in order."""
+        if not isinstance(tags, list):
+            return []
+        names = (str(tag).strip()[:100] for tag in tags)
+        return list(dict.fromkeys(name for name in names if name))
+
+    def sync_tags(self):
+        """Mirror ``tags`` into Tag/BlogPostTag and refresh the affected tag counts."""
+        names = self.clean_tag_names(self.tags)
+        Tag.objects.bulk_create([Tag(name=name) for name in names], ignore_conflicts=True)
+        wanted = set(Tag.objects.filter(name__in=names).values_list("pk", flat=True))
+        current = set(self.tag_links.values_list("tag_id", flat=True))
+        if current - wanted:
+            self.tag_links.filter(tag_id__in=current - wanted).delete()
+        BlogPostTag.objects.bulk_create(
+            [BlogPostTag(post=self, tag_id=tag_id) for tag_id in wanted - current], ignore_conflicts=True,
+        )
+        Tag.refresh_counts(current | wanted)
+
+
+class Tag(models.Model):
+    """A blog tag, normalised out of ``BlogPost.tags`` for indexed listing and filtering."""
+
+    name = models.CharField(max_length=100, unique=True)
+    published_count = models.PositiveIntegerField(default=0, help_text="Published posts carrying this tag")
+
+    class Meta:
+        ordering = ["name"]
+
+    def __str__(self):
+        return self.name
+
+    @classmethod
+    def refresh_counts(cls, tag_ids):
+        """Recount published posts for the given tags in one UPDATE."""
+        if not tag_ids:
+            return
+        published = (
+            BlogPostTag.objects.filter(tag=models.OuterRef("pk"), post__is_published=True)
+            .order_by().values("tag").annotate(n=models.Count("pk")).values("n")
+        )
+        cls.objects.filter(pk__in=list(tag_ids)).update(
+            published_count=Coalesce(models.Subquery(published), 0),
+        )
+
+
+class BlogPostTag(models.Model):
+    """Through table linking a post to each of its tags (kept in step by ``sync_tags``)."""
+
+    post = models.ForeignKey(BlogPost, on_delete=models.CASCADE, related_name="tag_links")
+    tag = models.ForeignKey(Tag, on_delete=models.CASCADE, related_name="post_links")
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["post", "tag"], name="uniq_blog_post_tag"),
+        ]
+
+    def __str__(self):
+        return f"{self.post_id} #{self.tag_id}"
+
 
 # ---------------------------------------------------------------------------
 # Resource Hub
@@ -399,10 +551,41 @@ class AIUsageLog(models.Model):
     prompt = models.TextField()
     response = models.TextField()
     tokens_used = models.PositiveIntegerField(default=0)
+    cache_hit = models.BooleanField(default=False, help_text="Answered from the answer cache, not Gemini.")
+    prompt_version = models.CharField(
+        max_length=16, blank=True, default="", help_text="Hash of the system prompt and token limit used.",
+    )
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["session_id", "-created_at"]),
+            models.Index(fields=["user", "-created_at"]),
+            models.Index(fields=["-created_at"]),
+        ]
+
+
+class AIUsageDaily(models.Model):
+    """Per-day rollup of AIUsageLog rows, kept after the raw rows are pruned."""
+
+    date = models.DateField()
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True, blank=True, related_name="ai_usage_daily"
+    )
+    session_id = models.CharField(max_length=100, blank=True, default="")
+    requests = models.PositiveIntegerField(default=0)
+    tokens_used = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        ordering = ["-date"]
+        verbose_name_plural = "AI usage (daily)"
+        constraints = [
+            models.UniqueConstraint(fields=["date", "session_id"], name="uniq_ai_usage_daily_session"),
+        ]
+
+    def __str__(self):
+        return f"{self.date} {self.session_id}: {self.requests} requests"
 
 
 # ---------------------------------------------------------------------------
@@ -444,6 +627,74 @@ class VideoSignal(models.Model):
         ordering = ["created_at"]
 
 
+# ---------------------------------------------------------------------------
+# Email outbox
+# ---------------------------------------------------------------------------
+class OutboundEmail(models.Model):
+    """An email queued for delivery by the ``run_outbox`` worker."""
+
+    STATUS_CHOICES = [
+        ("pending", "Pending"),
+        ("sending", "Sending"),
+        ("sent", "Sent"),
+        ("failed", "Failed"),
+    ]
+
+    to_email = models.EmailField()
+    subject = models.CharField(max_length=300)
+    html_body = models.TextField()
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default="pending")
+    attempts = models.PositiveSmallIntegerField(default=0)
+    last_error = models.TextField(blank=True, default="")
+    next_attempt_at = models.DateTimeField(
+        default=timezone.now, help_text="Not retried before this time (also the claim lease while sending).",
+    )
+    sent_at = models.DateTimeField(null=True, blank=True)
+    lead_magnet_entry = models.ForeignKey(
+        LeadMagnetEntry, on_delete=models.SET_NULL, null=True, blank=True, related_name="emails",
+        help_text="Marked delivered when this email is sent.",
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["status", "next_attempt_at"]),
+        ]
+
+    def __str__(self):
+        return f"{self.subject} -> {self.to_email} ({self.status})"
+
+
+# ---------------------------------------------------------------------------
+# Site search
+# ---------------------------------------------------------------------------
+class SearchTerm(models.Model):
+    """One posting in the site-wide inverted index (see ``core.utils.site_search``)."""
+
+    KIND_CHOICES = [
+        ("blog", "Blog post"),
+        ("resource", "Resource"),
+        ("event", "Event"),
+    ]
+
+    term = models.CharField(max_length=64, db_index=True)
+    kind = models.CharField(max_length=10, choices=KIND_CHOICES)
+    object_id = models.CharField(max_length=36, help_text="Primary key of the indexed object, as text")
+    weight = models.FloatField(help_text="Field-weighted term frequency score")
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["term", "kind", "object_id"], name="uniq_search_term_posting"),
+        ]
+        indexes = [
+            models.Index(fields=["kind", "object_id"]),
+        ]
+
+    def __str__(self):
+        return f"{self.term} -> {self.kind}:{self.object_id}"
+
+
 # ---------------------------------------------------------------------------
 # System configuration (singleton)
 # ---------------------------------------------------------------------------
@@ -502,6 +753,12 @@ class SystemConfiguration(models.Model):
         ),
     )
     ai_max_tokens = models.PositiveIntegerField(default=512)
+    ai_rate_per_minute = models.PositiveIntegerField(
+        default=5, help_text="Max AI messages per minute per visitor (0 for no limit).",
+    )
+    ai_rate_per_day = models.PositiveIntegerField(
+        default=50, help_text="Max AI messages per 24 hours per visitor (0 for no limit).",
+    )
 
     # Feature flags
     beta_mode = models.BooleanField(
@@ -561,7 +818,17 @@ class SystemConfiguration(models.Model):
         super().save(*args, **kwargs)
 
     @classmethod
-    def load(cls):
+    def load(cls, cached=True):
+        """Return the singleton, served from the config cache by default.
+
+        Pass ``cached=False`` when the caller is about to modify the row.
+        """
+        if not cached:
+            return cls._load_from_db()
+        return config_cache.get_config(cls._load_from_db)
+
+    @classmethod
+    def _load_from_db(cls):
         obj, _ = cls.objects.get_or_create(pk=1)
         return obj
 
@@ -2,11 +2,13 @@
 import html
 import bleach
 from django.contrib.auth import get_user_model
+from django.db.models import Q
 from django.utils import timezone
 from rest_framework import serializers
 
+from .utils.projection import Projection, file_url, model_property
 from .models import (
-    BookingSlot, Booking, Testimonial, BlogPost, Event,
+    AvailabilityRule, BookingSlot, Booking, Testimonial, BlogPost, Event,
     LeadMagnetEntry, ContactMessage, AIUsageLog, VideoRoomEvent,
     VideoSignal, SystemConfiguration, ResourceCategory, Resource,
     Goal, SessionNote,
@@ -99,20 +101,67 @@ class BookingSerializer(serializers.ModelSerializer):
 
 
 class CreateBookingSerializer(serializers.Serializer):
-    slot_id = serializers.IntegerField()
+    """Book a stored slot (``slot_id``) or a rule occurrence (``rule_id`` + ``date``)."""
+
+    slot_id = serializers.IntegerField(required=False)
+    rule_id = serializers.IntegerField(required=False)
+    date = serializers.DateField(required=False)
     session_type = serializers.ChoiceField(choices=["discovery", "standard", "intensive"])
     notes = serializers.CharField(required=False, default="", allow_blank=True)
 
-    def validate_slot_id(self, value):
-        try:
-            slot = BookingSlot.objects.get(pk=value, is_available=True)
-        except BookingSlot.DoesNotExist:
-            raise serializers.ValidationError("This slot is no longer available.")
-        return value
+    # Slot availability is not checked here: create_booking claims the slot
+    # atomically, which is the only check that holds under concurrency.
 
     def validate_notes(self, value):
         return _clean(value)
 
+    def validate(self, attrs):
+        if "slot_id" in attrs:
+            if "rule_id" in attrs or "date" in attrs:
+                raise serializers.ValidationError("Send either slot_id, or rule_id and date.")
+        elif "rule_id" not in attrs or "date" not in attrs:
+            raise serializers.ValidationError("Send either slot_id, or rule_id and date.")
+        return attrs
+
+
+class AvailabilityRuleSerializer(serializers.ModelSerializer):
+    exceptions = serializers.ListField(child=serializers.DateField(), required=False)
+
+    class Meta:
+        model = AvailabilityRule
+        fields = "__all__"
+        read_only_fields = ["id", "created_at"]
+
+    def validate_exceptions(self, value):
+        return sorted({day.isoformat() for day in value})
+
+    def validate(self, attrs):
+        def get(name):
+            return attrs.get(name, getattr(self.instance, name, None))
+
+        start, end = get("start_time"), get("end_time")
+        if start and end and end <= start:
+            raise serializers.ValidationError({"end_time": "end_time must be after start_time."})
+        valid_from, valid_until = get("valid_from") or timezone.localdate(), get("valid_until")
+        if valid_until and valid_until < valid_from:
+            raise serializers.ValidationError({"valid_until": "valid_until must not be before valid_from."})
+
+        # Rules are weekly offers on one calendar, so two active rules may not
+        # overlap on the same weekday while both are valid.
+        if get("is_active") is not False:
+            others = AvailabilityRule.objects.filter(
+                is_active=True, weekday=get("weekday"), start_time__lt=end, end_time__gt=start,
+            )
+            if valid_until:
+                others = others.filter(valid_from__lte=valid_until)
+            others = others.filter(Q(valid_until__isnull=True) | Q(valid_until__gte=valid_from))
+            if self.instance is not None:
+                others = others.exclude(pk=self.instance.pk)
+            clash = others.first()
+            if clash is not None:
+                raise serializers.ValidationError(f"Overlaps the existing rule #{clash.pk} ({clash}).")
+        return attrs
+
 
 # ---------------------------------------------------------------------------
 # Testimonials
@@ -127,7 +176,6 @@ class TestimonialSerializer(serializers.ModelSerializer):
 # Blog
 # ---------------------------------------------------------------------------
 class BlogPostListSerializer(serializers.ModelSerializer):
-    reading_time = serializers.ReadOnlyField()
     featured_image_url = serializers.ReadOnlyField()
 
     class Meta:
@@ -140,7 +188,6 @@ class BlogPostListSerializer(serializers.ModelSerializer):
 
 
 class BlogPostDetailSerializer(serializers.ModelSerializer):
-    reading_time = serializers.ReadOnlyField()
     featured_image_url = serializers.ReadOnlyField()
 
     class Meta:
@@ -155,7 +202,6 @@ class BlogPostDetailSerializer(serializers.ModelSerializer):
 
 
 class AdminBlogPostSerializer(serializers.ModelSerializer):
-    reading_time = serializers.ReadOnlyField()
     featured_image_url = serializers.ReadOnlyField()
 
     class Meta:
@@ -164,11 +210,11 @@ class AdminBlogPostSerializer(serializers.ModelSerializer):
             "id", "title", "slug", "excerpt", "content",
             "featured_image", "featured_image_url", "tags",
             "author", "author_name", "is_published", "is_pinned",
-            "view_count", "reading_time",
+            "view_count", "word_count", "reading_time",
             "seo_title", "seo_description",
             "published_at", "created_at", "updated_at",
         ]
-        read_only_fields = ["id", "view_count", "reading_time", "created_at", "updated_at"]
+        read_only_fields = ["id", "view_count", "word_count", "reading_time", "created_at", "updated_at"]
 
     def validate_title(self, value):
         return _clean(value)
@@ -270,7 +316,9 @@ class ResourceCategorySerializer(serializers.ModelSerializer):
         fields = ["id", "name", "slug", "description", "icon", "order", "resource_count"]
 
     def get_resource_count(self, obj):
-        return obj.resources.filter(is_published=True).count()
+        # List views annotate the count (see views.resources); a freshly created category is not annotated.
+        count = getattr(obj, "published_resource_count", None)
+        return count if count is not None else obj.resources.filter(is_published=True).count()
 
 
 class ResourceSerializer(serializers.ModelSerializer):
@@ -286,7 +334,8 @@ class ResourceSerializer(serializers.ModelSerializer):
         ]
 
     def get_category_name(self, obj):
-        return obj.category.name if obj.category else ""
+        # Callers select_related("category") so this never costs a query per row.
+        return obj.category.name if obj.category_id else ""
 
 
 class AdminResourceSerializer(serializers.ModelSerializer):
@@ -343,3 +392,23 @@ class SessionNoteSerializer(serializers.ModelSerializer):
 
     def validate_content(self, value):
         return _clean(value)
+
+
+# ---------------------------------------------------------------------------
+# Projections (fast read path for public list endpoints)
+# ---------------------------------------------------------------------------
+BookingSlotProjection = Projection(BookingSlotSerializer)
+
+TestimonialProjection = Projection(TestimonialSerializer)
+
+BlogPostListProjection = Projection(BlogPostListSerializer, computed={
+    "featured_image_url": (("featured_image",), file_url(BlogPost, "featured_image")),
+})
+
+EventProjection = Projection(EventSerializer, computed={
+    "spots_remaining": (("max_spots", "spots_taken"), model_property(Event, "spots_remaining")),
+})
+
+ResourceProjection = Projection(ResourceSerializer, computed={
+    "category_name": (("category__name",), lambda r: r.category__name or ""),
+})
@@ -0,0 +1,83 @@
+"""Signal receivers for the core app."""
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import (
+    SystemConfiguration, AvailabilityRule, BlogPost, BookingSlot, Event, Testimonial, Resource, ResourceCategory, Tag,
+)
+from .utils import blog_search, config_cache, response_cache, site_search
+
+# Model -> response-cache group whose cached listings it affects.
+RESPONSE_CACHE_GROUPS = {
+    BlogPost: "blog",
+    Event: "events",
+    Testimonial: "testimonials",
+    Resource: "resources",
+    ResourceCategory: "resources",
+    SystemConfiguration: "settings",
+    # Bulk inserts and availability UPDATEs bypass signals; views.bookings
+    # invalidates "slots" itself for those.
+    BookingSlot: "slots",
+    AvailabilityRule: "slots",
+}
+
+
+@receiver(post_save, sender=SystemConfiguration)
+@receiver(post_delete, sender=SystemConfiguration)
+def invalidate_system_configuration(sender, **kwargs):
+    """Make every worker reload the configuration once the write commits."""
+    transaction.on_commit(config_cache.invalidate)
+
+
+@receiver(post_save, sender=BlogPost, dispatch_uid="blog-search-index")
+def index_blog_post(sender, instance, update_fields=None, **kwargs):
+    """Keep the SQLite full-text table in step (PostgreSQL uses a trigger)."""
+    if update_fields is None or {"title", "excerpt", "content"} & set(update_fields):
+        blog_search.index_post(instance)
+
+
+@receiver(post_save, sender=BlogPost, dispatch_uid="blog-tags-sync")
+def sync_blog_post_tags(sender, instance, update_fields=None, **kwargs):
+    """Keep the normalised tag index and per-tag counts in step with ``tags``."""
+    if update_fields is None or {"tags", "is_published"} & set(update_fields):
+        instance.sync_tags()
+
+
+@receiver(post_delete, sender=BlogPost, dispatch_uid="blog-tags-recount")
+def recount_blog_post_tags(sender, instance, **kwargs):
+    # The links cascaded away with the post; recount the tags it carried.
+    names = BlogPost.clean_tag_names(instance.tags)
+    Tag.refresh_counts(set(Tag.objects.filter(name__in=names).values_list("pk", flat=True)))
+
+
+@receiver(post_delete, sender=BlogPost, dispatch_uid="blog-search-remove")
+def unindex_blog_post(sender, instance, **kwargs):
+    blog_search.remove_post(instance)
+
+
+def update_site_search(sender, instance, update_fields=None, **kwargs):
+    """Re-index an object in the site-wide search when its text or visibility changes."""
+    kind = site_search.KIND_FOR_MODEL[sender.__name__]
+    if update_fields is None or (site_search.INDEXED_FIELDS[kind] | {"is_published"}) & set(update_fields):
+        site_search.index_object(instance)
+
+
+def remove_from_site_search(sender, instance, **kwargs):
+    site_search.remove_object(instance)
+
+
+for _model in (BlogPost, Resource, Event):
+    post_save.connect(update_site_search, sender=_model, dispatch_uid=f"site-search-save-{_model.__name__}")
+    post_delete.connect(remove_from_site_search, sender=_model, dispatch_uid=f"site-search-delete-{_model.__name__}")
+
+
+def invalidate_cached_responses(sender, **kwargs):
+    """Drop cached public responses built from ``sender``'s table."""
+    group = RESPONSE_CACHE_GROUPS[sender]
+    transaction.on_commit(lambda: response_cache.invalidate(group))
+
+
+for _model in RESPONSE_CACHE_GROUPS:
+    post_save.connect(invalidate_cached_responses, sender=_model, dispatch_uid=f"respcache-save-{_model.__name__}")
+    post_delete.connect(invalidate_cached_responses, sender=_model, dispatch_uid=f"respcache-delete-{_model.__name__}")
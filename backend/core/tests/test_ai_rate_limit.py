@@ -0,0 +1,33 @@
+"""AI chat rate limiting: only valid requests count, and 0 disables a limit."""
+from django.core.cache import cache
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from core.models import SystemConfiguration
+from core.utils import rate_limit
+from core.views.ai import _check_rate_limit
+
+
+class AIRateLimitTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        config = SystemConfiguration.load(cached=False)
+        config.ai_enabled = True
+        config.gemini_api_key = "test-key"
+        config.ai_rate_per_minute = 1
+        config.save()
+        self.client = APIClient(HTTP_HOST="localhost")
+
+    def test_invalid_requests_do_not_use_quota(self):
+        for _ in range(3):
+            self.assertEqual(self.client.post("/api/ai/chat/", {}, format="json").status_code, 400)
+        # The quota of one is still unused.
+        config = SystemConfiguration.load()
+        request = self.client.post("/api/ai/chat/", {}, format="json").wsgi_request
+        self.assertIsNone(_check_rate_limit(request, config))
+        self.assertEqual(_check_rate_limit(request, config).status_code, 429)
+
+    def test_zero_means_no_limit(self):
+        limits = [rate_limit.Limit("minute", 0, 60)]
+        for _ in range(20):
+            self.assertIsNone(rate_limit.hit("test", "ident", limits))
@@ -0,0 +1,48 @@
+"""Concurrent bookings of one slot: exactly one succeeds."""
+import datetime
+import threading
+
+from django.db import connection
+from django.test import TransactionTestCase
+from rest_framework.test import APIClient
+
+from core.models import Booking, BookingSlot, User
+
+THREADS = 8
+
+
+class ConcurrentBookingTests(TransactionTestCase):
+    def setUp(self):
+        self.slot = BookingSlot.objects.create(
+            date=datetime.date.today() + datetime.timedelta(days=7),
+            start_time=datetime.time(10), end_time=datetime.time(11),
+        )
+        self.users = [
+            User.objects.create_user(email=f"client{i}@example.com", password="x") for i in range(THREADS)
+        ]
+
+    def book(self, user, barrier, statuses):
+        client = APIClient(HTTP_HOST="localhost")
+        client.force_authenticate(user)
+        try:
+            barrier.wait()
+            response = client.post(
+                "/api/bookings/create/", {"slot_id": self.slot.pk, "session_type": "standard"}, format="json",
+            )
+            statuses.append(response.status_code)
+        finally:
+            connection.close()
+
+    def test_one_booking_per_slot(self):
+        barrier = threading.Barrier(THREADS)
+        statuses = []
+        threads = [threading.Thread(target=self.book, args=(user, barrier, statuses)) for user in self.users]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(sorted(statuses), [201] + [409] * (THREADS - 1))
+        self.assertEqual(Booking.objects.filter(slot=self.slot).count(), 1)
+        self.slot.refresh_from_db()
+        self.assertFalse(self.slot.is_available)
@@ -0,0 +1,101 @@
+"""Each Projection must render exactly what its DRF serializer renders."""
+import datetime
+import json
+from decimal import Decimal
+
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIRequestFactory
+
+from core.models import BlogPost, BookingSlot, Event, Resource, ResourceCategory, Testimonial
+from core.serializers import (
+    BlogPostListProjection, BlogPostListSerializer,
+    BookingSlotProjection, BookingSlotSerializer,
+    EventProjection, EventSerializer,
+    ResourceProjection, ResourceSerializer,
+    TestimonialProjection, TestimonialSerializer,
+)
+
+CASES = [
+    ("blog posts", BlogPost, BlogPostListSerializer, BlogPostListProjection),
+    ("events", Event, EventSerializer, EventProjection),
+    ("testimonials", Testimonial, TestimonialSerializer, TestimonialProjection),
+    ("resources", Resource, ResourceSerializer, ResourceProjection),
+    ("booking slots", BookingSlot, BookingSlotSerializer, BookingSlotProjection),
+]
+
+
+def _render(data):
+    return json.loads(JSONRenderer().render(data))
+
+
+class ProjectionParityTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        published = timezone.make_aware(datetime.datetime(2026, 3, 29, 0, 30))     # DST change in London
+        BlogPost.objects.create(
+            title="Calm breathing", slug="calm-breathing", excerpt="Short", content="One two three",
+            tags=["breath", "sleep"], is_published=True, published_at=published,
+            featured_image="blog/featured/calm.jpg",
+        )
+        BlogPost.objects.create(
+            title="Ünïcødé draft", slug="unicode-draft", content="", tags=[], author_name="",
+        )
+
+        Event.objects.create(
+            title="Workshop", description="In person", date=datetime.date(2026, 11, 2),
+            start_time=datetime.time(18, 30), end_time=datetime.time(20, 0),
+            price=Decimal("12.50"), max_spots=10, spots_taken=12,
+        )
+        Event.objects.create(
+            title="Online talk", description="", date=datetime.date(2026, 11, 3),
+            start_time=datetime.time(9, 0, 15), is_online=True, ticket_url="https://example.com/t",
+        )
+
+        Testimonial.objects.create(name="A", content="Lovely", rating=4, is_featured=True)
+        Testimonial.objects.create(name="B", role="Workshop Attendee", content="", is_published=False)
+
+        category = ResourceCategory.objects.create(name="Guides", slug="guides")
+        Resource.objects.create(
+            title="Sleep guide", slug="sleep-guide", category=category,
+            file="resources/sleep.pdf", thumbnail="resources/thumbnails/sleep.png",
+        )
+        Resource.objects.create(title="Loose link", slug="loose-link", external_url="https://example.com/r")
+
+        BookingSlot.objects.create(
+            date=datetime.date(2026, 11, 4), start_time=datetime.time(10), end_time=datetime.time(11),
+        )
+        BookingSlot.objects.create(
+            date=datetime.date(2026, 11, 4), start_time=datetime.time(11, 15), end_time=datetime.time(12, 45, 30),
+            session_type="discovery", is_available=False,
+        )
+
+    def assert_parity(self, context=None):
+        for label, model, serializer_class, projection in CASES:
+            with self.subTest(label):
+                queryset = model.objects.all()
+                if model is Resource:
+                    queryset = queryset.select_related("category")
+                expected = _render(serializer_class(queryset, many=True, context=context or {}).data)
+                actual = _render(projection.serialize(queryset.all(), context=context))
+                self.assertTrue(expected)
+                self.assertEqual(actual, expected)
+
+    def test_matches_serializer(self):
+        self.assert_parity()
+
+    def test_matches_serializer_with_request(self):
+        request = APIRequestFactory().get("/api/", HTTP_HOST="localhost")
+        self.assert_parity({"request": request})
+
+    def test_matches_serializer_in_other_timezone(self):
+        with timezone.override("America/New_York"):
+            self.assert_parity()
+
+    def test_extra_columns(self):
+        queryset = Event.objects.order_by("date")
+        rows = EventProjection.serialize(queryset, extra={"title_again": ("title", str.upper)})
+        self.assertEqual([row["title_again"] for row in rows], ["WORKSHOP", "ONLINE TALK"])
+        for row, item in zip(rows, _render(EventSerializer(queryset, many=True).data)):
+            self.assertEqual({k: v for k, v in row.items() if k != "title_again"}, item)
@@ -0,0 +1,58 @@
+"""Resource list endpoints run a fixed number of queries, however many categories exist."""
+from django.core.cache import cache
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from core.models import Resource, ResourceCategory, User
+
+
+class ResourceQueryCountTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_user(email="admin@example.com", password="x", role="admin")
+
+    def setUp(self):
+        cache.clear()       # public lists are response-cached
+        self.client = APIClient(HTTP_HOST="localhost")
+
+    def make_categories(self, count):
+        Resource.objects.all().delete()
+        ResourceCategory.objects.all().delete()
+        cache.clear()
+        for i in range(count):
+            category = ResourceCategory.objects.create(name=f"Category {i}", slug=f"category-{i}", order=i)
+            for j in range(3):
+                Resource.objects.create(
+                    title=f"Resource {i}.{j}", slug=f"resource-{i}-{j}", category=category,
+                    is_published=j != 2,
+                )
+
+    def assert_queries(self, expected, path):
+        with self.assertNumQueries(expected):
+            response = self.client.get(path)
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def test_list_resource_categories(self):
+        for count in (1, 12):
+            with self.subTest(categories=count):
+                self.make_categories(count)
+                data = self.assert_queries(1, "/api/resources/categories/")
+                self.assertEqual(len(data), count)
+                self.assertEqual({item["resource_count"] for item in data}, {2})
+
+    def test_admin_resource_categories(self):
+        self.client.force_authenticate(self.admin)
+        for count in (1, 12):
+            with self.subTest(categories=count):
+                self.make_categories(count)
+                data = self.assert_queries(1, "/api/admin/resources/categories/")
+                self.assertEqual(len(data), count)
+
+    def test_list_resources(self):
+        for count in (1, 12):
+            with self.subTest(categories=count):
+                self.make_categories(count)
+                data = self.assert_queries(1, "/api/resources/")
+                self.assertEqual(len(data), count * 2)
+                self.assertTrue(all(item["category_name"].startswith("Category ") for item in data))
@@ -0,0 +1,28 @@
+"""Cached public responses behave like the uncached view."""
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+from core.models import BlogPost
+from core.utils import counters
+
+
+class ResponseCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient(HTTP_HOST="localhost")
+        self.post = BlogPost.objects.create(title="Calm", slug="calm", content="Breathe", is_published=True)
+
+    def test_hit_still_authenticates(self):
+        self.assertEqual(self.client.get("/api/blog/").status_code, 200)
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer not-a-token")
+        self.assertEqual(self.client.get("/api/blog/").status_code, 401)
+        self.client.credentials()
+        self.assertEqual(self.client.get("/api/blog/").status_code, 200)
+
+    @override_settings(COUNTER_CACHE_BUFFER=False, COUNTER_FLUSH_THRESHOLD=1000, COUNTER_FLUSH_INTERVAL=600)
+    def test_counter_flush_invalidates_list(self):
+        self.assertEqual(self.client.get("/api/blog/").json()["results"][0]["view_count"], 0)
+        counters.increment("blog_views", self.post.pk, by=3)
+        counters.flush("blog_views")
+        self.assertEqual(self.client.get("/api/blog/").json()["results"][0]["view_count"], 3)
@@ -3,7 +3,7 @@ from django.urls import path
 from .views import (
     health, auth, bookings, testimonials, blog, events,
     lead_magnet, contact, ai, video, settings, resources,
-    profile, goals, notes,
+    profile, goals, notes, search,
 )
 
 urlpatterns = [
@@ -19,6 +19,7 @@ urlpatterns = [
 
     # Bookings (client)
     path("bookings/slots/", bookings.available_slots, name="available-slots"),
+    path("bookings/calendar/", bookings.availability_calendar, name="availability-calendar"),
     path("bookings/create/", bookings.create_booking, name="create-booking"),
     path("bookings/mine/", bookings.my_bookings, name="my-bookings"),
     path("bookings/<int:booking_id>/cancel/", bookings.cancel_booking, name="cancel-booking"),
@@ -30,6 +31,8 @@ urlpatterns = [
     path("admin/bookings/slots/create/", bookings.admin_create_slot, name="admin-create-slot"),
     path("admin/bookings/slots/bulk/", bookings.admin_bulk_create_slots, name="admin-bulk-create-slots"),
     path("admin/bookings/slots/<int:slot_id>/delete/", bookings.admin_delete_slot, name="admin-delete-slot"),
+    path("admin/bookings/rules/", bookings.admin_availability_rules, name="admin-availability-rules"),
+    path("admin/bookings/rules/<int:rule_id>/", bookings.admin_availability_rule_detail, name="admin-availability-rule-detail"),
 
     # Testimonials
     path("testimonials/", testimonials.list_testimonials, name="list-testimonials"),
@@ -57,6 +60,9 @@ urlpatterns = [
     path("admin/events/create/", events.admin_create_event, name="admin-create-event"),
     path("admin/events/<int:event_id>/", events.admin_event_detail, name="admin-event-detail"),
 
+    # Site search
+    path("search/", search.site_search_view, name="site-search"),
+
     # Resources (public)
     path("resources/categories/", resources.list_resource_categories, name="list-resource-categories"),
     path("resources/", resources.list_resources, name="list-resources"),
@@ -77,6 +83,7 @@ urlpatterns = [
     # AI
     path("ai/status/", ai.ai_status, name="ai-status"),
     path("ai/chat/", ai.ai_chat, name="ai-chat"),
+    path("ai/chat/stream/", ai.ai_chat_stream, name="ai-chat-stream"),
     path("ai/test/", ai.test_gemini, name="test-gemini"),
 
     # Video
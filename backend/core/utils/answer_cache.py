@@ -0,0 +1,282 @@
+"""
+Answer cache for the AI assistant.
+
+Most visitor questions are the same handful of FAQs asked against a fixed
+system prompt, so answers are reused instead of calling Gemini again:
+
+1. Exact tier - keyed on the normalised question and the "answer version"
+   (a hash of the system prompt and max_tokens). A small in-process LRU sits
+   in front of the shared Django cache; both expire after ANSWER_TTL.
+2. Near-duplicate tier (optional) - a MinHash signature over character
+   shingles of each past question, bucketed with LSH bands, finds earlier
+   questions whose estimated Jaccard similarity is at least NEAR_MATCH.
+   New answers are added to the index as they are stored; it is rebuilt
+   from recent AIUsageLog rows for the current answer version when the
+   version changes and every INDEX_REFRESH seconds, so every worker
+   converges on the same history. Rebuilds run on a background thread and
+   reuse known signatures; lookups never wait for one.
+
+Only short messages are cached: long ones are more likely to be personal.
+"""
+import hashlib
+import logging
+import random
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import NamedTuple, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection
+
+logger = logging.getLogger("core")
+
+ANSWER_KEY = "aianswer:{digest}"
+MAX_CACHEABLE_LENGTH = 300     # characters of (normalised) question
+LOCAL_CAPACITY = 256           # LRU entries per process
+SHINGLE_SIZE = 4               # characters per shingle
+NUM_PERM = 64                  # MinHash signature length
+BANDS = 16                     # LSH bands (NUM_PERM / BANDS rows each)
+INDEX_SIZE = 500               # past questions kept in the near-duplicate index
+INDEX_REFRESH = 300            # seconds between index rebuilds from the DB
+
+_PRIME = (1 << 61) - 1
+_rng = random.Random(1729)     # fixed seed: signatures must match across workers
+_PERMS = [(_rng.randrange(1, _PRIME), _rng.randrange(0, _PRIME)) for _ in range(NUM_PERM)]
+_ROWS = NUM_PERM // BANDS
+
+
+class CachedAnswer(NamedTuple):
+    text: str
+    tokens: int
+    match: str          # "exact" or "similar"
+
+
+def answer_ttl() -> int:
+    return getattr(settings, "AI_ANSWER_CACHE_TTL", 60 * 60 * 24)
+
+
+def near_match_threshold() -> float:
+    return getattr(settings, "AI_ANSWER_NEAR_MATCH", 0.85)
+
+
+def normalise(message: str) -> str:
+    """Lower-case, drop punctuation and collapse whitespace."""
+    return " ".join(re.sub(r"[^\w\s£$€]", " ", message.lower()).split())
+
+
+def answer_version(config) -> str:
+    """Identify the prompt/settings an answer was generated with."""
+    raw = f"{config.ai_system_prompt}|{config.ai_max_tokens}"
+    return hashlib.sha256(raw.encode()).hexdigest()[:16]
+
+
+def _exact_key(question: str, version: str) -> str:
+    return ANSWER_KEY.format(digest=hashlib.sha256(f"{version}|{question}".encode()).hexdigest())
+
+
+# ── MinHash / LSH ───────────────────────────────────────────────────────────
+
+def _shingles(question: str):
+    padded = f" {question} "
+    if len(padded) <= SHINGLE_SIZE:
+        return {padded}
+    return {padded[i:i + SHINGLE_SIZE] for i in range(len(padded) - SHINGLE_SIZE + 1)}
+
+
+def signature(question: str):
+    hashes = [
+        int.from_bytes(hashlib.blake2b(s.encode(), digest_size=8).digest(), "big")
+        for s in _shingles(question)
+    ]
+    return tuple(min((a * h + b) % _PRIME for h in hashes) for a, b in _PERMS)
+
+
+def _similarity(sig_a, sig_b) -> float:
+    return sum(1 for x, y in zip(sig_a, sig_b) if x == y) / NUM_PERM
+
+
+def _bands(sig):
+    return [(i, sig[i * _ROWS:(i + 1) * _ROWS]) for i in range(BANDS)]
+
+
+class _NearDuplicateIndex:
+    """In-process LSH index over recent questions for one answer version.
+
+    Entries are ``question -> (signature, text, tokens, log_id)``. Rows loaded
+    from the DB leave ``text`` empty and fetch the response on their first hit.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.version = None
+        self.attempt = (None, 0.0)        # (version, monotonic time) of the last rebuild started
+        self.added = []                   # answers stored since that rebuild started
+        self.entries = OrderedDict()
+        self.buckets = {}                 # (band, rows) -> set(question)
+
+    @staticmethod
+    def _add(entries, buckets, question, sig, text, tokens, log_id=None):
+        if question in entries:
+            entries.move_to_end(question)
+            return
+        entries[question] = (sig, text, tokens, log_id)
+        for band in _bands(sig):
+            buckets.setdefault(band, set()).add(question)
+        while len(entries) > INDEX_SIZE:
+            old_q, (old_sig, _, _, _) = entries.popitem(last=False)
+            for band in _bands(old_sig):
+                bucket = buckets.get(band)
+                if bucket:
+                    bucket.discard(old_q)
+                    if not bucket:
+                        del buckets[band]
+
+    def _refresh_if_due(self, version):
+        """Start a background rebuild for ``version`` unless one is recent. Call with the lock held."""
+        attempted, started = self.attempt
+        if attempted == version and time.monotonic() - started < INDEX_REFRESH:
+            return
+        self.attempt = (version, time.monotonic())
+        self.added = []
+        threading.Thread(target=self._rebuild, args=(version,), daemon=True).start()
+
+    def _rebuild(self, version):
+        from ..models import AIUsageLog
+
+        try:
+            rows = list(
+                AIUsageLog.objects.filter(prompt_version=version, cache_hit=False)
+                .exclude(response="")
+                .order_by("-created_at")
+                .values_list("pk", "prompt", "tokens_used")[:INDEX_SIZE]
+            )
+            with self.lock:
+                known = {question: entry[0] for question, entry in self.entries.items()}
+            entries, buckets = OrderedDict(), {}
+            for pk, prompt, tokens in reversed(rows):
+                question = normalise(prompt)
+                if len(question) <= MAX_CACHEABLE_LENGTH:
+                    self._add(entries, buckets, question, known.get(question) or signature(question), None, tokens, pk)
+            with self.lock:
+                if self.attempt[0] != version:      # superseded by a rebuild for a newer version
+                    return
+                # Answers stored while the rows were read are newer than all of them.
+                for question, sig, text, tokens in self.added:
+                    self._add(entries, buckets, question, sig, text, tokens)
+                self.added = []
+                self.entries, self.buckets, self.version = entries, buckets, version
+        except Exception as e:
+            logger.warning("AI answer index rebuild failed: %s", str(e))
+        finally:
+            connection.close()
+
+    def add(self, question, version, text, tokens):
+        sig = signature(question)
+        with self.lock:
+            if self.attempt[0] == version:
+                self.added.append((question, sig, text, tokens))
+            if self.version == version:
+                self._add(self.entries, self.buckets, question, sig, text, tokens)
+
+    def lookup(self, question, version, threshold):
+        sig = signature(question)
+        with self.lock:
+            self._refresh_if_due(version)
+            if self.version != version:
+                return None
+            candidates = set()
+            for band in _bands(sig):
+                candidates |= self.buckets.get(band, set())
+            best, best_score = None, threshold
+            for candidate in candidates:
+                score = _similarity(sig, self.entries[candidate][0])
+                if score >= best_score:
+                    best, best_score = candidate, score
+            if best is None:
+                return None
+            _, text, tokens, log_id = self.entries[best]
+        if not text:
+            from ..models import AIUsageLog
+
+            text = AIUsageLog.objects.filter(pk=log_id).values_list("response", flat=True).first()
+            if not text:
+                return None
+            with self.lock:
+                entry = self.entries.get(best)
+                if entry and entry[3] == log_id:
+                    self.entries[best] = (entry[0], text, entry[2], log_id)
+        return text, tokens
+
+
+_index = _NearDuplicateIndex()
+_local_lock = threading.Lock()
+_local = OrderedDict()                   # key -> (expires, text, tokens)
+
+
+def _local_get(key):
+    with _local_lock:
+        item = _local.get(key)
+        if item is None:
+            return None
+        if item[0] < time.monotonic():
+            del _local[key]
+            return None
+        _local.move_to_end(key)
+        return item[1], item[2]
+
+
+def _local_set(key, text, tokens, ttl):
+    with _local_lock:
+        _local[key] = (time.monotonic() + ttl, text, tokens)
+        _local.move_to_end(key)
+        while len(_local) > LOCAL_CAPACITY:
+            _local.popitem(last=False)
+
+
+# ── Public API ──────────────────────────────────────────────────────────────
+
+def lookup(message: str, config) -> Optional[CachedAnswer]:
+    """Return a cached answer for ``message``, or None on a miss."""
+    ttl = answer_ttl()
+    question = normalise(message)
+    if not ttl or not question or len(question) > MAX_CACHEABLE_LENGTH:
+        return None
+    version = answer_version(config)
+    key = _exact_key(question, version)
+
+    try:
+        found = _local_get(key)
+        if found is None:
+            found = cache.get(key)
+            if found is not None:
+                _local_set(key, found[0], found[1], ttl)
+        if found is not None:
+            return CachedAnswer(found[0], found[1], "exact")
+
+        threshold = near_match_threshold()
+        if threshold:
+            found = _index.lookup(question, version, threshold)
+            if found is not None:
+                return CachedAnswer(found[0], found[1], "similar")
+    except Exception as e:
+        logger.warning("AI answer cache lookup failed: %s", str(e))
+    return None
+
+
+def store(message: str, config, text: str, tokens: int):
+    """Remember a freshly generated answer."""
+    ttl = answer_ttl()
+    question = normalise(message)
+    if not ttl or not text or not question or len(question) > MAX_CACHEABLE_LENGTH:
+        return
+    version = answer_version(config)
+    key = _exact_key(question, version)
+    try:
+        _local_set(key, text, tokens, ttl)
+        cache.set(key, (text, tokens), ttl)
+        _index.add(question, version, text, tokens)
+    except Exception as e:
+        logger.warning("AI answer cache store failed: %s", str(e))
@@ -0,0 +1,83 @@
+"""
+Async counterpart to DRF's ``@api_view`` for I/O-bound endpoints.
+
+DRF 3.14 dispatches synchronously, so a view waiting on Gemini or SMTP holds
+a worker thread for the whole call. ``@async_api_view`` builds an APIView
+whose dispatch is a coroutine: authentication, permission and throttle
+checks (which may hit the database) run through ``sync_to_async``, then the
+async handler awaits its upstream calls without blocking the event loop.
+
+Under ASGI (uvicorn workers) these views run natively on the event loop.
+Under WSGI Django wraps them with ``async_to_sync``, so the same URLconf
+works in both deployment modes.
+
+Usage mirrors DRF::
+
+    @async_api_view(["POST"])
+    @permission_classes([AllowAny])
+    async def my_view(request):
+        ...
+"""
+from asgiref.sync import sync_to_async
+from rest_framework.views import APIView
+
+_POLICY_ATTRS = (
+    "renderer_classes",
+    "parser_classes",
+    "authentication_classes",
+    "throttle_classes",
+    "permission_classes",
+)
+
+
+class AsyncAPIView(APIView):
+    """APIView with an async dispatch; every handler must be a coroutine."""
+
+    async def dispatch(self, request, *args, **kwargs):
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+
+        try:
+            await sync_to_async(self.initial)(request, *args, **kwargs)
+            if request.method.lower() in self.http_method_names:
+                handler = getattr(self, request.method.lower(), None)
+            else:
+                handler = None
+            if handler is None:
+                self.http_method_not_allowed(request, *args, **kwargs)
+            response = await handler(request, *args, **kwargs)
+        except Exception as exc:
+            response = self.handle_exception(exc)
+
+        self.response = self.finalize_response(request, response, *args, **kwargs)
+        return self.response
+
+    async def options(self, request, *args, **kwargs):
+        return super().options(request, *args, **kwargs)
+
+
+def async_api_view(http_method_names):
+    """Decorator turning an ``async def`` view function into an AsyncAPIView."""
+
+    def decorator(func):
+        async def handler(self, *args, **kwargs):
+            return await func(*args, **kwargs)
+
+        attrs = {
+            "__doc__": func.__doc__,
+            "__module__": func.__module__,
+            "http_method_names": [method.lower() for method in http_method_names] + ["options"],
+        }
+        for method in http_method_names:
+            attrs[method.lower()] = handler
+        for name in _POLICY_ATTRS:
+            if hasattr(func, name):
+                attrs[name] = getattr(func, name)
+
+        view_class = type(func.__name__, (AsyncAPIView,), attrs)
+        return view_class.as_view()
+
+    return decorator
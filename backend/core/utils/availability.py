@@ -0,0 +1,150 @@
+"""
+Bookable times: one-off slots merged with recurring availability rules.
+
+A standing weekly schedule is stored as a handful of ``AvailabilityRule``
+rows rather than a ``BookingSlot`` per occurrence. ``bookable`` expands the
+rules for the requested window only, drops occurrences that overlap any
+stored slot on the same day (a booked occurrence, or a one-off slot which
+takes precedence over the rule) and merges the rest with the open one-off
+slots. The work is one query for the rules, one for the window's slots and
+one for the open slots' output, whatever the size of the schedule.
+
+Occurrences that have not been booked have no id; they are identified by
+``(rule, date)``. ``materialize`` turns one into a ``BookingSlot`` at
+booking time.
+"""
+import datetime
+
+from django.db.models import Q
+from django.utils import timezone
+
+from . import scheduling
+
+MAX_WINDOW_DAYS = 92
+ONE_WEEK = datetime.timedelta(days=7)
+
+
+class Unavailable(Exception):
+    """The requested occurrence cannot be booked (answer with 409)."""
+
+
+def _models():
+    from ..models import AvailabilityRule, BookingSlot
+    return AvailabilityRule, BookingSlot
+
+
+def _not_started(day, start_time, now):
+    return day > now.date() or (day == now.date() and start_time > now.time())
+
+
+def active_rules(start, end, session_type=None):
+    """Active rules whose validity overlaps ``start`` .. ``end``."""
+    AvailabilityRule, _ = _models()
+    rules = AvailabilityRule.objects.filter(is_active=True, valid_from__lte=end).filter(
+        Q(valid_until__isnull=True) | Q(valid_until__gte=start)
+    )
+    if session_type:
+        rules = rules.filter(session_type=session_type)
+    return rules
+
+
+def occurrences(rule, start, end):
+    """Yield the dates in ``start`` .. ``end`` on which ``rule`` applies."""
+    first = max(start, rule.valid_from)
+    last = end if rule.valid_until is None else min(end, rule.valid_until)
+    day = first + datetime.timedelta(days=(rule.weekday - first.weekday()) % 7)
+    exceptions = set(rule.exceptions)
+    while day <= last:
+        if day.isoformat() not in exceptions:
+            yield day
+        day += ONE_WEEK
+
+
+def _stored_intervals(start, end):
+    _, BookingSlot = _models()
+    rows = BookingSlot.objects.filter(date__range=(start, end)).values_list(
+        "date", "start_time", "end_time", "session_type", "id",
+    )
+    return [scheduling.Interval(*row) for row in rows]
+
+
+def _open_slots(start, end, session_type, now):
+    from ..serializers import BookingSlotProjection
+
+    _, BookingSlot = _models()
+    queryset = BookingSlot.objects.filter(is_available=True, date__range=(start, end)).exclude(
+        date=now.date(), start_time__lte=now.time(),
+    )
+    if session_type:
+        queryset = queryset.filter(session_type=session_type)
+    return BookingSlotProjection.serialize(queryset.order_by("date", "start_time", "id"))
+
+
+def bookable(start, end, session_type=None, now=None):
+    """Open one-off slots and free rule occurrences in ``start`` .. ``end``, in time order.
+
+    Occurrences are shaped like serialised slots with ``id`` None and
+    ``rule`` set.
+    """
+    now = now or timezone.localtime()
+    start = max(start, now.date())
+    if end < start:
+        return []
+    slots = _open_slots(start, end, session_type, now)
+    rules = list(active_rules(start, end, session_type))
+    if not rules:
+        return slots
+
+    proposed = {}
+    for rule in rules:
+        for day in occurrences(rule, start, end):
+            if _not_started(day, rule.start_time, now):
+                interval = scheduling.Interval(day, rule.start_time, rule.end_time, rule.session_type)
+                proposed[interval] = rule
+    # An occurrence overlapping any stored slot (of any type) is not offered.
+    blocked = set()
+    for a, b in scheduling.overlapping_pairs([*proposed, *_stored_intervals(start, end)]):
+        if (a.id is None) != (b.id is None):
+            blocked.add(a if a.id is None else b)
+
+    free = [
+        {
+            "id": None,
+            "date": interval.date.isoformat(),
+            "start_time": interval.start_time.isoformat(),
+            "end_time": interval.end_time.isoformat(),
+            "session_type": interval.session_type,
+            "is_available": True,
+            "created_at": None,
+            "rule": rule.pk,
+        }
+        for interval, rule in proposed.items()
+        if interval not in blocked
+    ]
+    return sorted([*slots, *free], key=lambda slot: (slot["date"], slot["start_time"]))
+
+
+def materialize(rule_id, day, now=None):
+    """Create the (already taken) ``BookingSlot`` for one rule occurrence.
+
+    Call inside the booking transaction. Raises ``Unavailable`` if the rule
+    does not apply on ``day``, the time has passed or a stored slot overlaps
+    it; a concurrent booking of the same occurrence fails on the slot's
+    unique constraint instead.
+    """
+    AvailabilityRule, BookingSlot = _models()
+    now = now or timezone.localtime()
+    rule = AvailabilityRule.objects.filter(pk=rule_id).first()
+    if rule is None or not rule.occurs_on(day) or not _not_started(day, rule.start_time, now):
+        raise Unavailable
+    occurrence = scheduling.Interval(day, rule.start_time, rule.end_time, rule.session_type)
+    if scheduling.conflicts([occurrence], _stored_intervals(day, day)):
+        raise Unavailable
+    return BookingSlot.objects.create(
+        date=day,
+        start_time=rule.start_time,
+        end_time=rule.end_time,
+        session_type=rule.session_type,
+        is_available=False,
+        rule=rule,
+    )
@@ -0,0 +1,155 @@
+"""
+Full-text search for blog posts.
+
+The search index lives outside the ORM model and is chosen by database
+vendor:
+
+* PostgreSQL - a ``search_vector tsvector`` column on ``core_blogpost`` with
+  a GIN index, kept current by a trigger installed by migration 0012
+  (title weighted A, excerpt B, content C; the English parser skips HTML
+  tags). Ranked with ``ts_rank``,
+  snippets from ``ts_headline``.
+* SQLite (development) - an FTS5 table ``core_blogpost_fts`` holding the
+  tag-stripped text, maintained from the BlogPost save/delete signals.
+  Ranked with ``bm25`` using the same title > excerpt > content weighting,
+  snippets from ``snippet()``.
+* Anything else falls back to case-insensitive substring matching.
+
+User input never reaches the query syntax directly: it is reduced to word
+tokens, all of which must match, and the last one is a prefix so results
+update as the visitor types.
+
+``search()`` returns the queryset filtered to matches and annotated with
+``search_rank`` (higher is better) and ``search_snippet``; pass the latter
+through ``highlight()`` to get HTML-safe text with ``<mark>`` around hits.
+"""
+import re
+
+from django.db import connection
+from django.db.models import BooleanField, FloatField, Q, TextField, Value
+from django.db.models.expressions import RawSQL
+from django.utils.html import escape, strip_tags
+
+MAX_TERMS = 8
+SNIPPET_WORDS = 24
+_START, _STOP = "\x02", "\x03"      # highlight sentinels, replaced after escaping
+
+FTS_TABLE = "core_blogpost_fts"
+
+
+def terms(text: str):
+    return re.findall(r"\w+", text.lower())[:MAX_TERMS]
+
+
+def search(queryset, text: str):
+    """Filter ``queryset`` (of BlogPost) to posts matching ``text``, best first."""
+    words = terms(text)
+    if not words:
+        return queryset.none()
+    vendor = connection.vendor
+    if vendor == "postgresql":
+        return _search_postgres(queryset, words)
+    if vendor == "sqlite":
+        return _search_sqlite(queryset, words)
+    query = Q()
+    for word in words:
+        query &= Q(title__icontains=word) | Q(excerpt__icontains=word) | Q(content__icontains=word)
+    return queryset.filter(query).annotate(
+        search_rank=Value(0.0, output_field=FloatField()),
+        search_snippet=Value("", output_field=TextField()),
+    )
+
+
+def highlight(snippet: str) -> str:
+    """Escape a raw snippet and wrap matched terms in <mark>."""
+    if not snippet:
+        return ""
+    text = escape(strip_tags(snippet))
+    return text.replace(_START, "<mark>").replace(_STOP, "</mark>")
+
+
+# ── PostgreSQL ──────────────────────────────────────────────────────────────
+
+def _search_postgres(queryset, words):
+    tsquery = " & ".join(words[:-1] + [f"{words[-1]}:*"])
+    headline_options = f"StartSel={_START}, StopSel={_STOP}, MaxWords={SNIPPET_WORDS}, MinWords=12, MaxFragments=2"
+    return (
+        queryset
+        .filter(RawSQL(
+            "core_blogpost.search_vector @@ to_tsquery('english', %s)", [tsquery], output_field=BooleanField(),
+        ))
+        .annotate(
+            search_rank=RawSQL(
+                "ts_rank(core_blogpost.search_vector, to_tsquery('english', %s))", [tsquery],
+                output_field=FloatField(),
+            ),
+            search_snippet=RawSQL(
+                "ts_headline('english', regexp_replace(core_blogpost.content, '<[^>]*>', ' ', 'g'), "
+                "to_tsquery('english', %s), %s)",
+                [tsquery, headline_options], output_field=TextField(),
+            ),
+        )
+        .order_by("-search_rank", *queryset.query.order_by or queryset.model._meta.ordering)
+    )
+
+
+# ── SQLite FTS5 ─────────────────────────────────────────────────────────────
+
+def _search_sqlite(queryset, words):
+    match = " ".join(f'"{word}"' for word in words) + " *"
+    matched = f"SELECT 1 FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s AND post_id = core_blogpost.id"
+    return (
+        queryset
+        .filter(RawSQL(f"EXISTS ({matched})", [match], output_field=BooleanField()))
+        .annotate(
+            # bm25 is lower-is-better; negate so both backends sort descending.
+            search_rank=RawSQL(
+                f"(SELECT -bm25({FTS_TABLE}, 0.0, 10.0, 4.0, 1.0) FROM {FTS_TABLE} "
+                f"WHERE {FTS_TABLE} MATCH %s AND post_id = core_blogpost.id)",
+                [match], output_field=FloatField(),
+            ),
+            search_snippet=RawSQL(
+                f"(SELECT snippet({FTS_TABLE}, -1, char(2), char(3), '…', {SNIPPET_WORDS}) FROM {FTS_TABLE} "
+                f"WHERE {FTS_TABLE} MATCH %s AND post_id = core_blogpost.id)",
+                [match], output_field=TextField(),
+            ),
+        )
+        .order_by("-search_rank", *queryset.query.order_by or queryset.model._meta.ordering)
+    )
+
+
+def _sqlite_row(post):
+    return [post.pk.hex, post.title, strip_tags(post.excerpt or ""), strip_tags(post.content or "")]
+
+
+def index_post(post):
+    """Refresh one post in the SQLite index (PostgreSQL uses its trigger)."""
+    if connection.vendor != "sqlite":
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {FTS_TABLE} WHERE post_id = %s", [post.pk.hex])
+        cursor.execute(
+            f"INSERT INTO {FTS_TABLE} (post_id, title, excerpt, content) VALUES (%s, %s, %s, %s)",
+            _sqlite_row(post),
+        )
+
+
+def remove_post(post):
+    if connection.vendor != "sqlite":
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {FTS_TABLE} WHERE post_id = %s", [post.pk.hex])
+
+
+def rebuild_sqlite(posts, batch_size=200):
+    """Re-index every post in ``posts`` (an iterable of objects with the text fields)."""
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {FTS_TABLE}")
+        batch = []
+        for post in posts:
+            batch.append(_sqlite_row(post))
+            if len(batch) >= batch_size:
+                cursor.executemany(f"INSERT INTO {FTS_TABLE} (post_id, title, excerpt, content) VALUES (%s, %s, %s, %s)", batch)
+                batch = []
+        if batch:
+            cursor.executemany(f"INSERT INTO {FTS_TABLE} (post_id, title, excerpt, content) VALUES (%s, %s, %s, %s)", batch)
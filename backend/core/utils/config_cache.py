@@ -0,0 +1,78 @@
+"""
+Two-tier cache for the SystemConfiguration singleton.
+
+Each worker keeps an in-process copy for LOCAL_TTL seconds. After that it
+checks a version counter in Django's shared cache and only reloads (from the
+shared cache, then the database) when another worker has bumped the version.
+"""
+import copy
+import logging
+import threading
+import time
+
+from django.core.cache import cache
+
+logger = logging.getLogger("core")
+
+VERSION_KEY = "sysconfig:version"
+OBJECT_KEY = "sysconfig:obj:{version}"
+LOCAL_TTL = 5            # seconds a worker trusts its in-process copy
+SHARED_TTL = 60 * 60     # seconds the shared copy lives in the cache
+
+_lock = threading.Lock()
+_local = {"obj": None, "version": None, "expires": 0.0}
+
+
+def _shared_version():
+    """Return the current config version, seeding it if the cache is cold."""
+    version = cache.get(VERSION_KEY)
+    if version is None:
+        # Seed with a timestamp so a version evicted from the cache never
+        # collides with an older one still holding a stale object.
+        cache.add(VERSION_KEY, int(time.time()), None)
+        version = cache.get(VERSION_KEY)
+    return version
+
+
+def get_config(loader):
+    """Return a private copy of the cached configuration.
+
+    ``loader`` is called to fetch the row from the database on a miss.
+    """
+    now = time.monotonic()
+    with _lock:
+        if _local["obj"] is not None and now < _local["expires"]:
+            return copy.copy(_local["obj"])
+
+    try:
+        version = _shared_version()
+    except Exception as e:
+        logger.warning("Config cache unavailable, reading from DB: %s", str(e))
+        return loader()
+
+    with _lock:
+        if _local["obj"] is not None and _local["version"] == version:
+            _local["expires"] = now + LOCAL_TTL
+            return copy.copy(_local["obj"])
+
+    key = OBJECT_KEY.format(version=version)
+    obj = cache.get(key)
+    if obj is None:
+        obj = loader()
+        cache.set(key, obj, SHARED_TTL)
+
+    with _lock:
+        _local.update(obj=obj, version=version, expires=now + LOCAL_TTL)
+    return copy.copy(obj)
+
+
+def invalidate():
+    """Drop this worker's copy and bump the shared version for all workers."""
+    with _lock:
+        _local.update(obj=None, version=None, expires=0.0)
+    try:
+        cache.incr(VERSION_KEY)
+    except ValueError:
+        cache.add(VERSION_KEY, int(time.time()), None)
+    except Exception as e:
+        logger.warning("Could not bump config cache version: %s", str(e))
@@ -0,0 +1,254 @@
+"""
+Write-behind counters for hot, approximate totals (blog views, downloads).
+
+An increment never touches the database. It bumps a per-object delta in the
+shared cache with an atomic ``incr``; the first increment of an object since
+the last flush also appends its id to a journal (a sequence number plus one
+key per entry) so the flusher knows which deltas to collect.
+
+A flush runs when ``COUNTER_FLUSH_THRESHOLD`` increments are pending or
+``COUNTER_FLUSH_INTERVAL`` seconds have passed, in whichever request hits
+the trigger, or on demand via ``manage.py flush_counters``. It takes a short
+cache lock, subtracts each delta it read (so concurrent increments survive)
+and writes them with one ``UPDATE ... SET field = field + n`` per distinct
+delta. Readers show ``stored + pending``.
+
+The shared cache path relies on ``incr`` being atomic, which holds for
+redis and, within one process, for ``locmem`` (each worker then flushes its
+own counts). Django's generic ``incr`` used by the db and file caches is a
+get followed by a set, so concurrent increments would overwrite each other.
+With those backends (``COUNTER_CACHE_BUFFER`` off) each worker buffers its
+deltas in process memory instead, under a lock, and flushes them on the
+same threshold and interval and at exit. Readers then see their own
+worker's pending counts; a killed worker loses at most one batch. The
+generic ``incr`` also re-sets the key with the default timeout, so keys are
+re-``touch``ed after each bump.
+
+Deltas are counts for display only: an evicted cache entry loses at most
+the increments it held. The journal recovers from eviction: a restarted
+sequence resets the flushed position, and an object's journal mark lasts
+only one flush interval, so a lost journal entry is re-created by the
+object's next increment.
+"""
+import atexit
+import logging
+import threading
+import time
+from collections import defaultdict
+
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DatabaseError, transaction
+from django.db.models import F
+
+from . import response_cache
+
+logger = logging.getLogger("core")
+
+# counter name -> (model label, integer field, response cache group showing it)
+COUNTERS = {
+    "blog_views": ("core.BlogPost", "view_count", "blog"),
+    "resource_downloads": ("core.Resource", "download_count", "resources"),
+}
+
+KEY_TTL = 60 * 60 * 24
+LOCK_TTL = 30
+DELTA_KEY = "counter:{name}:delta:{pk}"
+MARK_KEY = "counter:{name}:mark:{pk}"
+JOURNAL_KEY = "counter:{name}:journal:{seq}"
+SEQ_KEY = "counter:{name}:seq"
+FLUSHED_KEY = "counter:{name}:flushed"
+PENDING_KEY = "counter:{name}:pending"
+TIMER_KEY = "counter:{name}:timer"
+LOCK_KEY = "counter:{name}:lock"
+
+
+def _incr(key, delta=1):
+    """Add ``delta`` to ``key``; return ``(value, created)``."""
+    created = cache.add(key, 0, KEY_TTL)
+    try:
+        value = cache.incr(key, delta)
+    except ValueError:
+        # Evicted between add() and incr(); start again from this delta.
+        cache.set(key, delta, KEY_TTL)
+        return delta, True
+    cache.touch(key, KEY_TTL)
+    return value, created
+
+
+def _journal(name, pk):
+    """Record that ``pk`` has a delta to flush, at most once per flush interval."""
+    if cache.add(MARK_KEY.format(name=name, pk=pk), 1, settings.COUNTER_FLUSH_INTERVAL):
+        seq, restarted = _incr(SEQ_KEY.format(name=name))
+        if restarted:
+            # The sequence was lost: entries from 1 on are new again.
+            cache.set(FLUSHED_KEY.format(name=name), 0, None)
+        cache.set(JOURNAL_KEY.format(name=name, seq=seq), pk, KEY_TTL)
+
+
+# ── Process buffer (db and file caches) ─────────────────────────────────────
+
+_local_lock = threading.Lock()
+_local = defaultdict(lambda: defaultdict(int))      # name -> {pk: delta}
+_local_flushed = defaultdict(time.monotonic)        # name -> time of the last flush
+
+
+def _local_increment(name, pk, by):
+    with _local_lock:
+        deltas = _local[name]
+        deltas[pk] += by
+        delta = deltas[pk]
+        due = (
+            sum(deltas.values()) >= settings.COUNTER_FLUSH_THRESHOLD
+            or time.monotonic() - _local_flushed[name] >= settings.COUNTER_FLUSH_INTERVAL
+        )
+    if due:
+        _local_flush(name)
+    return delta
+
+
+def _local_flush(name):
+    with _local_lock:
+        deltas = dict(_local.pop(name, {}))
+        _local_flushed[name] = time.monotonic()
+    if not deltas:
+        return {}
+    try:
+        _write(name, deltas)
+    except DatabaseError:
+        logger.exception("Counter flush for %s failed; keeping %d deltas pending", name, len(deltas))
+        with _local_lock:
+            for pk, value in deltas.items():
+                _local[name][pk] += value
+        return {}
+    logger.info("Flushed %d %s for %d objects", sum(deltas.values()), name, len(deltas))
+    return deltas
+
+
+@atexit.register
+def _flush_at_exit():
+    for name in list(_local):
+        try:
+            _local_flush(name)
+        except Exception:
+            pass
+
+
+def _write(name, deltas):
+    """Add ``{pk: delta}`` to the stored counts, one UPDATE per distinct delta.
+
+    ``update()`` sends no signals, so cached responses showing the counts
+    are invalidated here.
+    """
+    label, field, group = COUNTERS[name]
+    model = apps.get_model(label)
+    by_delta = defaultdict(list)
+    for pk, value in deltas.items():
+        by_delta[value].append(pk)
+    with transaction.atomic():
+        for value, pks in by_delta.items():
+            model.objects.filter(pk__in=pks).update(**{field: F(field) + value})
+    response_cache.invalidate(group)
+
+
+def increment(name: str, pk, by: int = 1) -> int:
+    """Count ``by`` against object ``pk``.
+
+    Returns the object's pending delta including this increment, i.e. what
+    to add to a value read from the database just before the call.
+    """
+    pk = str(pk)
+    if not settings.COUNTER_CACHE_BUFFER:
+        return _local_increment(name, pk, by)
+    delta, _ = _incr(DELTA_KEY.format(name=name, pk=pk), by)
+    _journal(name, pk)
+    pending, _ = _incr(PENDING_KEY.format(name=name), by)
+
+    if pending >= settings.COUNTER_FLUSH_THRESHOLD or cache.add(
+        TIMER_KEY.format(name=name), 1, settings.COUNTER_FLUSH_INTERVAL,
+    ):
+        flush(name)
+    return delta
+
+
+def pending_for(name: str, pk) -> int:
+    if not settings.COUNTER_CACHE_BUFFER:
+        with _local_lock:
+            return _local[name].get(str(pk), 0)
+    return cache.get(DELTA_KEY.format(name=name, pk=str(pk))) or 0
+
+
+def pending_many(name: str, pks) -> dict:
+    """Return ``{str(pk): delta}`` for the given objects (missing means 0)."""
+    if not settings.COUNTER_CACHE_BUFFER:
+        with _local_lock:
+            deltas = _local[name]
+            return {str(pk): deltas[str(pk)] for pk in pks if deltas.get(str(pk))}
+    keys = {DELTA_KEY.format(name=name, pk=str(pk)): str(pk) for pk in pks}
+    return {keys[key]: value for key, value in cache.get_many(list(keys)).items() if value}
+
+
+def add_pending(name: str, items, field: str, id_key: str = "id"):
+    """Add pending deltas to ``field`` in already-serialised ``items`` (in place)."""
+    deltas = pending_many(name, (item[id_key] for item in items))
+    for item in items:
+        item[field] += deltas.get(str(item[id_key]), 0)
+    return items
+
+
+def flush(name: str) -> dict:
+    """Write pending deltas for ``name`` to the database; return ``{pk: delta}`` written.
+
+    With the process buffer this only flushes the calling process.
+    """
+    if not settings.COUNTER_CACHE_BUFFER:
+        return _local_flush(name)
+    lock = LOCK_KEY.format(name=name)
+    if not cache.add(lock, 1, LOCK_TTL):
+        return {}
+    try:
+        return _flush(name)
+    finally:
+        cache.delete(lock)
+
+
+def _flush(name):
+    start = cache.get(FLUSHED_KEY.format(name=name)) or 0
+    end = cache.get(SEQ_KEY.format(name=name)) or 0
+    if end < start:
+        start = 0       # the sequence restarted since the last flush
+    journal = [JOURNAL_KEY.format(name=name, seq=seq) for seq in range(start + 1, end + 1)]
+    pks = list(dict.fromkeys(cache.get_many(journal).values()))
+
+    # Unmark first: an increment from here on re-journals its object.
+    cache.delete_many([MARK_KEY.format(name=name, pk=pk) for pk in pks])
+    deltas = {}
+    for pk, value in pending_many(name, pks).items():
+        try:
+            cache.decr(DELTA_KEY.format(name=name, pk=pk), value)
+        except ValueError:
+            continue
+        deltas[pk] = value
+
+    try:
+        _write(name, deltas)
+    except DatabaseError:
+        logger.exception("Counter flush for %s failed; keeping %d deltas pending", name, len(deltas))
+        for pk, value in deltas.items():
+            _incr(DELTA_KEY.format(name=name, pk=pk), value)
+            _journal(name, pk)
+        deltas = {}
+
+    cache.set(FLUSHED_KEY.format(name=name), end, None)
+    cache.delete_many(journal)
+    written = sum(deltas.values())
+    if written:
+        pending = PENDING_KEY.format(name=name)
+        try:
+            if cache.decr(pending, written) < 0:
+                cache.set(pending, 0, KEY_TTL)
+        except ValueError:
+            pass
+        logger.info("Flushed %d %s for %d objects", written, name, len(deltas))
+    return deltas
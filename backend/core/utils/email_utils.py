@@ -1,6 +1,7 @@
 """
 Email utilities for the LiLy Stoica platform.
-Sends branded HTML emails via Resend SMTP.
+Builds branded HTML emails and queues them in the outbox; the ``run_outbox``
+worker delivers them via Resend SMTP.
 """
 import logging
 import smtplib
@@ -8,11 +9,14 @@ from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 
 from django.conf import settings as dj_settings
-from ..models import SystemConfiguration
+from ..models import OutboundEmail, SystemConfiguration
 
 logger = logging.getLogger("core")
 
 BRAND_COLOUR = "#4F8A6E"
+SMTP_HOST = "smtp.resend.com"
+SMTP_PORT = 587
+SMTP_TIMEOUT = 30
 
 def _site_url():
     return getattr(dj_settings, "FRONTEND_URL", "https://calm-lily.co.uk").rstrip("/")
@@ -22,36 +26,47 @@ def _get_config():
     return SystemConfiguration.load()
 
 
-def _send_email(to_email: str, subject: str, html_body: str):
-    """Send an email via Resend SMTP."""
-    config = _get_config()
-    api_key = config.resend_api_key
+def _send_email(to_email: str, subject: str, html_body: str, lead_magnet_entry=None):
+    """Queue an email for delivery by the ``run_outbox`` worker.
 
-    if not api_key:
-        logger.warning("No Resend API key configured. Email not sent to %s", to_email)
-        return
+    Only an INSERT happens in the request; SMTP runs in the worker. Created
+    inside the caller's transaction, so mail for a rolled-back change is
+    never sent.
+    """
+    config = _get_config()
 
     # Test mode: redirect to admin
     if config.email_test_mode and config.email_test_recipient:
         to_email = config.email_test_recipient
         subject = f"[TEST] {subject}"
 
-    from_email = config.email_from
+    email = OutboundEmail.objects.create(
+        to_email=to_email, subject=subject[:300], html_body=html_body,
+        lead_magnet_entry=lead_magnet_entry,
+    )
+    logger.info("Email #%d queued for %s: %s", email.pk, to_email, subject)
+    return email
+
 
+def build_message(config, to_email: str, subject: str, html_body: str) -> MIMEMultipart:
     msg = MIMEMultipart("alternative")
-    msg["From"] = f"LiLy Stoica <{from_email}>"
+    msg["From"] = f"LiLy Stoica <{config.email_from}>"
     msg["To"] = to_email
     msg["Subject"] = subject
     msg.attach(MIMEText(html_body, "html"))
+    return msg
+
 
+def open_smtp(config) -> smtplib.SMTP:
+    """Open an authenticated Resend SMTP connection (caller must quit it)."""
+    server = smtplib.SMTP(SMTP_HOST, SMTP_PORT, timeout=SMTP_TIMEOUT)
     try:
-        with smtplib.SMTP("smtp.resend.com", 587) as server:
-            server.starttls()
-            server.login("resend", api_key)
-            server.send_message(msg)
-        logger.info("Email sent to %s: %s", to_email, subject)
-    except Exception as e:
-        logger.error("Failed to send email to %s: %s", to_email, str(e))
+        server.starttls()
+        server.login("resend", config.resend_api_key)
+    except Exception:
+        server.close()
+        raise
+    return server
 
 
 def _wrap_html(title: str, body: str) -> str:
@@ -129,8 +144,10 @@ def send_booking_confirmation(booking):
 
 
 def send_lead_magnet_delivery(entry, config=None):
-    """Send the free resource download link using admin-configured content."""
-    from ..models import SystemConfiguration
+    """Send the free resource download link using admin-configured content.
+
+    ``entry.delivered`` is set by the outbox once the email has been sent.
+    """
     if config is None:
         config = SystemConfiguration.load()
 
@@ -177,6 +194,7 @@ def send_lead_magnet_delivery(entry, config=None):
         to_email=entry.email,
         subject=subject,
         html_body=_wrap_html("Your free resource is ready", body),
+        lead_magnet_entry=entry,
     )
 
 
@@ -5,32 +5,202 @@ Uses Vertex AI endpoint (same as SNF Gateway Hub):
 - Model: gemini-2.0-flash
 - Auth: x-goog-api-key header
 - Endpoint: us-central1-aiplatform.googleapis.com
+
+Requests go through a keep-alive ``requests.Session`` per thread (sessions
+are not thread-safe under gthread workers), so the TCP+TLS handshake to
+Vertex is paid once per thread rather than once per message. Transient
+upstream failures (429/5xx, failure to connect) are retried with jittered
+exponential backoff. A read timeout is not retried: the generation may
+still be running upstream, and retrying it would hold the worker for up to
+``MAX_ATTEMPTS * READ_TIMEOUT`` seconds.
+
+``acall_gemini`` is the async equivalent for views served on the ASGI event
+loop; it uses one pooled ``httpx.AsyncClient`` per running loop.
 """
+import asyncio
 import json
 import logging
+import random
+import threading
+import time
+
+import httpx
 import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
 
-from typing import Tuple
+from typing import Iterator, Tuple
 
 logger = logging.getLogger("core")
 
-VERTEX_URL = (
+VERTEX_MODEL_URL = (
     "https://us-central1-aiplatform.googleapis.com/v1"
     "/projects/perennix-experiments/locations/us-central1"
-    "/publishers/google/models/gemini-2.0-flash:generateContent"
+    "/publishers/google/models/gemini-2.0-flash"
 )
 
+CONNECT_TIMEOUT = 5        # seconds to establish the connection
+READ_TIMEOUT = 30          # seconds to wait for the generation
+POOL_SIZE = 4              # keep-alive connections per thread
+MAX_ATTEMPTS = 3
+BACKOFF_BASE = 0.5         # seconds; doubled per attempt, with full jitter
+MAX_BACKOFF = 5            # never hold a request thread longer than this per retry
+RETRY_STATUSES = {429, 500, 502, 503, 504}
 
-def call_gemini(
-    user_message: str,
-    system_prompt: str,
-    api_key: str,
-    max_tokens: int = 512,
-) -> Tuple[str, int]:
+_local = threading.local()
+_async_clients = {}        # event loop -> (httpx.AsyncClient, closing task)
+_metrics_lock = threading.Lock()
+_metrics = {"calls": 0, "errors": 0, "retries": 0, "total_ms": 0.0, "last_ms": 0.0}
+
+
+def model_url() -> str:
+    """Base model URL, overridable with GEMINI_MODEL_URL (e.g. a local stand-in)."""
+    return (getattr(settings, "GEMINI_MODEL_URL", "") or VERTEX_MODEL_URL).rstrip("/")
+
+
+def get_session() -> requests.Session:
+    """Return this thread's pooled keep-alive session."""
+    session = getattr(_local, "session", None)
+    if session is None:
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=POOL_SIZE, max_retries=0)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        _local.session = session
+    return session
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """Return the pooled async client for the running event loop.
+
+    httpx clients are bound to the loop they were first used on, so each
+    loop (one per uvicorn worker, or one per call under ``async_to_sync``)
+    gets its own, closed when the loop shuts down.
     """
-    Call Gemini 2.0 Flash via Vertex AI and return (response_text, tokens_used).
+    loop = asyncio.get_running_loop()
+    entry = _async_clients.get(loop)
+    if entry is None or entry[0].is_closed:
+        client = httpx.AsyncClient(
+            timeout=httpx.Timeout(READ_TIMEOUT, connect=CONNECT_TIMEOUT),
+            limits=httpx.Limits(max_connections=POOL_SIZE * 4, max_keepalive_connections=POOL_SIZE),
+        )
+        entry = _async_clients[loop] = (client, loop.create_task(_close_with_loop(loop, client)))
+    return entry[0]
+
+
+async def _close_with_loop(loop, client: httpx.AsyncClient):
+    """Keep ``client`` until its loop shuts down, then close it.
+
+    ``asyncio.run`` (which ``async_to_sync`` uses for every call under WSGI)
+    cancels the tasks still pending when it finishes, which lands here.
     """
-    payload = {
+    try:
+        await asyncio.Event().wait()
+    finally:
+        if _async_clients.get(loop, (None,))[0] is client:
+            del _async_clients[loop]
+        await client.aclose()
+
+
+def get_metrics() -> dict:
+    """Snapshot of upstream call metrics for this process."""
+    with _metrics_lock:
+        snapshot = dict(_metrics)
+    snapshot["avg_ms"] = snapshot["total_ms"] / snapshot["calls"] if snapshot["calls"] else 0.0
+    return snapshot
+
+
+def _record(elapsed_ms: float, ok: bool, retries: int):
+    with _metrics_lock:
+        _metrics["calls"] += 1
+        _metrics["retries"] += retries
+        _metrics["total_ms"] += elapsed_ms
+        _metrics["last_ms"] = elapsed_ms
+        if not ok:
+            _metrics["errors"] += 1
+
+
+def _backoff(attempt: int, retry_after: str = "") -> float:
+    if retry_after.isdigit():
+        return min(float(retry_after), MAX_BACKOFF)
+    return min(random.uniform(0, BACKOFF_BASE * (2 ** attempt)), MAX_BACKOFF)
+
+
+def post_with_retries(url: str, payload: dict, api_key: str, stream: bool = False) -> requests.Response:
+    """POST to Vertex through the pooled session, retrying transient failures."""
+    headers = {
+        "Content-Type": "application/json",
+        "x-goog-api-key": api_key,
+    }
+    session = get_session()
+    start = time.monotonic()
+    retries = 0
+    for attempt in range(MAX_ATTEMPTS):
+        last = attempt == MAX_ATTEMPTS - 1
+        try:
+            response = session.post(
+                url, json=payload, headers=headers,
+                timeout=(CONNECT_TIMEOUT, READ_TIMEOUT), stream=stream,
+            )
+        except requests.ReadTimeout as e:
+            _record((time.monotonic() - start) * 1000, False, retries)
+            raise RuntimeError(f"Gemini request timed out: {e}") from e
+        except requests.ConnectionError as e:     # includes ConnectTimeout
+            if last:
+                _record((time.monotonic() - start) * 1000, False, retries)
+                raise RuntimeError(f"Gemini request failed: {e}") from e
+            logger.warning("Gemini request failed (attempt %d): %s", attempt + 1, str(e))
+        else:
+            if response.status_code not in RETRY_STATUSES or last:
+                elapsed_ms = (time.monotonic() - start) * 1000
+                _record(elapsed_ms, response.ok, retries)
+                logger.info("Gemini HTTP %s in %.0f ms (%d retries)", response.status_code, elapsed_ms, retries)
+                return response
+            logger.warning("Gemini HTTP %s (attempt %d), retrying", response.status_code, attempt + 1)
+            retry_after = response.headers.get("Retry-After", "")
+            response.close()
+            time.sleep(_backoff(attempt, retry_after))
+            retries += 1
+            continue
+        time.sleep(_backoff(attempt))
+        retries += 1
+
+
+async def apost_with_retries(url: str, payload: dict, api_key: str) -> httpx.Response:
+    """Async twin of ``post_with_retries`` that yields to the loop while waiting."""
+    headers = {
+        "Content-Type": "application/json",
+        "x-goog-api-key": api_key,
+    }
+    client = get_async_client()
+    start = time.monotonic()
+    retries = 0
+    for attempt in range(MAX_ATTEMPTS):
+        last = attempt == MAX_ATTEMPTS - 1
+        try:
+            response = await client.post(url, json=payload, headers=headers)
+        except (httpx.ConnectError, httpx.ConnectTimeout) as e:
+            if last:
+                _record((time.monotonic() - start) * 1000, False, retries)
+                raise RuntimeError(f"Gemini request failed: {e}") from e
+            logger.warning("Gemini request failed (attempt %d): %s", attempt + 1, str(e))
+            await asyncio.sleep(_backoff(attempt))
+        except httpx.TransportError as e:     # read timeout or dropped response: not retried
+            _record((time.monotonic() - start) * 1000, False, retries)
+            raise RuntimeError(f"Gemini request failed: {e}") from e
+        else:
+            if response.status_code not in RETRY_STATUSES or last:
+                elapsed_ms = (time.monotonic() - start) * 1000
+                _record(elapsed_ms, response.is_success, retries)
+                logger.info("Gemini HTTP %s in %.0f ms (%d retries)", response.status_code, elapsed_ms, retries)
+                return response
+            logger.warning("Gemini HTTP %s (attempt %d), retrying", response.status_code, attempt + 1)
+            await asyncio.sleep(_backoff(attempt, response.headers.get("Retry-After", "")))
+        retries += 1
+
+
+def build_payload(user_message: str, system_prompt: str, max_tokens: int) -> dict:
+    return {
         "contents": [
             {
                 "role": "user",
@@ -45,25 +215,45 @@ def call_gemini(
         },
     }
 
-    headers = {
-        "Content-Type": "application/json",
-        "x-goog-api-key": api_key,
-    }
 
-    response = requests.post(
-        VERTEX_URL, json=payload, headers=headers, timeout=30,
-    )
+def call_gemini(
+    user_message: str,
+    system_prompt: str,
+    api_key: str,
+    max_tokens: int = 512,
+) -> Tuple[str, int]:
+    """
+    Call Gemini 2.0 Flash via Vertex AI and return (response_text, tokens_used).
+    """
+    payload = build_payload(user_message, system_prompt, max_tokens)
+    response = post_with_retries(f"{model_url()}:generateContent", payload, api_key)
+    return _parse_reply(response.status_code, response.text)
+
 
+async def acall_gemini(
+    user_message: str,
+    system_prompt: str,
+    api_key: str,
+    max_tokens: int = 512,
+) -> Tuple[str, int]:
+    """Async version of ``call_gemini`` for views running on the event loop."""
+    payload = build_payload(user_message, system_prompt, max_tokens)
+    response = await apost_with_retries(f"{model_url()}:generateContent", payload, api_key)
+    return _parse_reply(response.status_code, response.text)
+
+
+def _parse_reply(status_code: int, body: str) -> Tuple[str, int]:
+    """Extract (text, tokens) from a generateContent response body."""
     try:
-        data = json.loads(response.text)
-    except json.JSONDecodeError:
-        logger.error("Gemini returned non-JSON: %s", response.text[:500])
-        raise RuntimeError(f"Gemini returned non-JSON response (HTTP {response.status_code})")
+        data = json.loads(body)
+    except ValueError:
+        logger.error("Gemini returned non-JSON: %s", body[:500])
+        raise RuntimeError(f"Gemini returned non-JSON response (HTTP {status_code})")
 
-    if not response.ok:
-        error_msg = data.get("error", {}).get("message", response.text[:300])
-        logger.error("Gemini API error %s: %s", response.status_code, error_msg)
-        raise RuntimeError(f"Gemini API error ({response.status_code}): {error_msg}")
+    if not 200 <= status_code < 400:
+        error_msg = data.get("error", {}).get("message", body[:300])
+        logger.error("Gemini API error %s: %s", status_code, error_msg)
+        raise RuntimeError(f"Gemini API error ({status_code}): {error_msg}")
 
     text = ""
     tokens = 0
@@ -80,6 +270,49 @@ def call_gemini(
     return text, tokens
 
 
+def stream_gemini(
+    user_message: str,
+    system_prompt: str,
+    api_key: str,
+    max_tokens: int = 512,
+) -> Iterator[Tuple[str, int]]:
+    """
+    Stream a Gemini reply via ``streamGenerateContent`` (server-sent events).
+
+    Yields ``(text_delta, tokens_used)`` pairs; ``tokens_used`` is the latest
+    usage total reported upstream and is complete on the final pair.
+    """
+    payload = build_payload(user_message, system_prompt, max_tokens)
+    response = post_with_retries(f"{model_url()}:streamGenerateContent?alt=sse", payload, api_key, stream=True)
+    try:
+        if not response.ok:
+            try:
+                error_msg = response.json().get("error", {}).get("message", "")
+            except ValueError:
+                error_msg = response.text[:300]
+            logger.error("Gemini stream error %s: %s", response.status_code, error_msg)
+            raise RuntimeError(f"Gemini API error ({response.status_code}): {error_msg}")
+
+        tokens = 0
+        for line in response.iter_lines(decode_unicode=True):
+            if not line or not line.startswith("data:"):
+                continue
+            try:
+                chunk = json.loads(line[5:])
+            except json.JSONDecodeError:
+                logger.warning("Skipping malformed Gemini stream chunk: %s", line[:200])
+                continue
+            tokens = chunk.get("usageMetadata", {}).get("totalTokenCount", tokens)
+            text = ""
+            candidates = chunk.get("candidates", [])
+            if candidates:
+                parts = candidates[0].get("content", {}).get("parts", [])
+                text = "".join(part.get("text", "") for part in parts)
+            yield text, tokens
+    finally:
+        response.close()
+
+
 def test_connection(api_key: str) -> str:
     """Send a simple test prompt to verify the Vertex AI key works."""
     text, _ = call_gemini(
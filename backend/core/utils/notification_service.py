@@ -3,23 +3,12 @@ Notification service for the LiLy Stoica platform.
 Handles admin notifications for key events.
 """
 import logging
-import threading
 
 from .email_utils import _send_email, _wrap_html, _get_config
 
 logger = logging.getLogger("core")
 
 
-def _send_async(to_email: str, subject: str, html_body: str):
-    """Send email in a daemon thread to avoid blocking the request."""
-    thread = threading.Thread(
-        target=_send_email,
-        args=(to_email, subject, html_body),
-        daemon=True,
-    )
-    thread.start()
-
-
 def notify_admin_new_booking(booking):
     """Notify admin of a new booking that needs confirmation."""
     slot = booking.slot
@@ -53,7 +42,7 @@ def notify_admin_new_booking(booking):
     config = _get_config()
     admin_email = config.email_test_recipient or config.email_from
 
-    _send_async(
+    _send_email(
         to_email=admin_email,
         subject=f"New booking from {booking.client.full_name}",
         html_body=_wrap_html("New booking requires confirmation", body),
@@ -0,0 +1,139 @@
+"""
+Delivery side of the email outbox (see ``OutboundEmail``).
+
+``claim_batch`` leases due messages by switching them to "sending" and
+moving ``next_attempt_at`` to the end of the lease, so a worker that dies
+mid-batch only delays those messages until the lease lapses. ``deliver``
+sends a claimed batch over a single authenticated SMTP connection and
+records each outcome; transient failures are rescheduled with exponential
+backoff, permanent ones (5xx replies, refused recipients) fail immediately.
+"""
+import logging
+import random
+import smtplib
+from datetime import timedelta
+
+from django.db import connection, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from ..models import LeadMagnetEntry, OutboundEmail, SystemConfiguration
+from .email_utils import build_message, open_smtp
+
+logger = logging.getLogger("core")
+
+LEASE = timedelta(minutes=5)
+MAX_ATTEMPTS = 6
+BACKOFF_BASE = 60              # seconds before the first retry, doubled per attempt
+MAX_BACKOFF = 60 * 60 * 6
+
+
+def claim_batch(batch_size: int):
+    """Lease up to ``batch_size`` due messages for this worker."""
+    now = timezone.now()
+    lease_until = now + LEASE
+    due = Q(status__in=["pending", "sending"], next_attempt_at__lte=now)
+    with transaction.atomic():
+        queryset = OutboundEmail.objects.filter(due).order_by("next_attempt_at")
+        if connection.features.has_select_for_update_skip_locked:
+            queryset = queryset.select_for_update(skip_locked=True)
+        ids = list(queryset.values_list("pk", flat=True)[:batch_size])
+        # Re-check ``due`` so two workers without SKIP LOCKED cannot both win.
+        OutboundEmail.objects.filter(due, pk__in=ids).update(status="sending", next_attempt_at=lease_until)
+    return list(
+        OutboundEmail.objects.filter(pk__in=ids, status="sending", next_attempt_at=lease_until)
+        .order_by("created_at")
+    )
+
+
+def _text(value) -> str:
+    return value.decode(errors="replace") if isinstance(value, bytes) else str(value)
+
+
+def _backoff(attempts: int) -> timedelta:
+    delay = min(BACKOFF_BASE * (2 ** (attempts - 1)), MAX_BACKOFF)
+    return timedelta(seconds=delay * random.uniform(0.8, 1.2))
+
+
+def _retry(email: OutboundEmail, error: str) -> str:
+    email.attempts += 1
+    email.last_error = error
+    if email.attempts >= MAX_ATTEMPTS:
+        email.status = "failed"
+        logger.error("Email #%d to %s failed permanently: %s", email.pk, email.to_email, error)
+    else:
+        email.status = "pending"
+        email.next_attempt_at = timezone.now() + _backoff(email.attempts)
+        logger.warning("Email #%d to %s failed (attempt %d), retrying: %s",
+                       email.pk, email.to_email, email.attempts, error)
+    email.save(update_fields=["status", "attempts", "last_error", "next_attempt_at"])
+    return email.status
+
+
+def _fail(email: OutboundEmail, error: str) -> str:
+    email.attempts += 1
+    email.status = "failed"
+    email.last_error = error
+    email.save(update_fields=["status", "attempts", "last_error"])
+    logger.error("Email #%d to %s rejected: %s", email.pk, email.to_email, error)
+    return email.status
+
+
+def _sent(email: OutboundEmail) -> str:
+    email.attempts += 1
+    email.status = "sent"
+    email.last_error = ""
+    email.sent_at = timezone.now()
+    email.save(update_fields=["status", "attempts", "last_error", "sent_at"])
+    if email.lead_magnet_entry_id:
+        LeadMagnetEntry.objects.filter(pk=email.lead_magnet_entry_id).update(delivered=True)
+    logger.info("Email #%d sent to %s: %s", email.pk, email.to_email, email.subject)
+    return email.status
+
+
+def deliver(emails, config=None) -> dict:
+    """Send claimed ``emails`` over one SMTP connection; return status counts."""
+    counts = {"sent": 0, "pending": 0, "failed": 0}
+    if not emails:
+        return counts
+    config = config or SystemConfiguration.load()
+
+    if not config.resend_api_key:
+        for email in emails:
+            counts[_retry(email, "No Resend API key configured.")] += 1
+        return counts
+
+    try:
+        server = open_smtp(config)
+    except (smtplib.SMTPException, OSError) as e:
+        for email in emails:
+            counts[_retry(email, f"SMTP connection failed: {e}")] += 1
+        return counts
+
+    remaining = list(emails)
+    try:
+        while remaining:
+            email = remaining.pop(0)
+            try:
+                server.send_message(build_message(config, email.to_email, email.subject, email.html_body))
+            except smtplib.SMTPRecipientsRefused as e:
+                counts[_fail(email, f"Recipient refused: {e.recipients}")] += 1
+            except smtplib.SMTPResponseException as e:
+                error = f"{e.smtp_code} {_text(e.smtp_error)}"
+                if e.smtp_code >= 500:
+                    counts[_fail(email, error)] += 1
+                else:
+                    counts[_retry(email, error)] += 1
+            except (smtplib.SMTPException, OSError) as e:
+                # Connection-level problem: give the rest of the batch back too.
+                for pending in [email] + remaining:
+                    counts[_retry(pending, f"SMTP error: {e}")] += 1
+                remaining = []
+            else:
+                counts[_sent(email)] += 1
+    finally:
+        try:
+            server.quit()
+        except (smtplib.SMTPException, OSError):
+            server.close()
+    return counts
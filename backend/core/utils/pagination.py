@@ -0,0 +1,285 @@
+"""
+Keyset (cursor) pagination for list endpoints.
+
+A ``KeysetPaginator`` is declared with an ordering whose last field is the
+primary key, so every row has a unique position. A page is found with a
+``WHERE (ordering) after (cursor row)`` condition that walks the index, so
+the thousandth page costs the same as the first; nothing is skipped with
+``OFFSET``. Cursors are opaque base64 tokens carrying the direction and the
+boundary row's ordering values.
+
+NULLs sort as if greater than every value (PostgreSQL's default, so the
+ORDER BY matches plain b-tree indexes there): first in descending fields,
+last in ascending ones.
+
+``window``/``date_window`` and ``since`` apply the ``?from=&to=`` /
+``?since=`` filters shared by the bounded list endpoints.
+
+For backwards compatibility a numbered ``?page=`` is still accepted and
+served with an offset; every response also carries ``next``/``previous``
+cursors so clients can move over. Totals come from a ``COUNT(*)`` cached
+for ``count_ttl`` seconds per distinct query, so they are approximate.
+"""
+import base64
+import binascii
+import datetime
+import decimal
+import hashlib
+import json
+import uuid
+from typing import NamedTuple, Optional
+
+from django.core.cache import cache
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db.models import F, Q
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+
+COUNT_KEY = "pagecount:{digest}"
+
+
+class QueryParamError(ValueError):
+    """Malformed list query parameter (answer with 400)."""
+
+
+class CursorError(QueryParamError):
+    """Malformed ``cursor``, ``page`` or ``page_size`` parameter."""
+
+
+class Page(NamedTuple):
+    queryset: object                # this page's rows, in order
+    next: Optional[str]
+    previous: Optional[str]
+    count: int
+    page: Optional[int]             # set only for ?page= requests
+    page_size: int
+
+    @property
+    def total_pages(self):
+        return (self.count + self.page_size - 1) // self.page_size
+
+
+def _dump(value):
+    if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, (uuid.UUID, decimal.Decimal)):
+        return str(value)
+    return value
+
+
+class KeysetPaginator:
+    """Cursor pagination over ``ordering`` (e.g. ``["-created_at", "-id"]``)."""
+
+    def __init__(self, ordering, page_size=20, max_page_size=100, count_ttl=60):
+        if ordering[-1].lstrip("-") not in ("id", "pk"):
+            raise ValueError("The last ordering field must be the primary key.")
+        self.ordering = list(ordering)
+        self.page_size = page_size
+        self.max_page_size = max_page_size
+        self.count_ttl = count_ttl
+
+    # ── public API ───────────────────────────────────────────────────────
+
+    def paginate(self, request, queryset) -> Page:
+        """Return the page selected by ``?cursor=``/``?page=``/``?page_size=``."""
+        params = request.query_params
+        size = self._int(params.get("page_size"), self.page_size, "page_size")
+        size = min(size, self.max_page_size)
+        fields = [name.lstrip("-") for name in self.ordering]
+        count = self._count(queryset)
+
+        page = None
+        if params.get("cursor"):
+            backwards, values = self._decode(params["cursor"], queryset.model)
+            ordering = self._reversed() if backwards else self.ordering
+            keys = list(
+                queryset.filter(self._after(values, ordering, queryset.model))
+                .order_by(*self._order_by(ordering, queryset.model))
+                .values_list(*fields)[:size + 1]
+            )
+            more = len(keys) > size
+            keys = keys[:size]
+            if backwards:
+                keys.reverse()
+            has_next, has_previous = (True, more) if backwards else (more, True)
+        else:
+            page = self._int(params.get("page"), 1, "page")
+            start = (page - 1) * size
+            keys = list(
+                queryset.order_by(*self._order_by(self.ordering, queryset.model))
+                .values_list(*fields)[start:start + size + 1]
+            )
+            has_next, has_previous = len(keys) > size, page > 1
+            keys = keys[:size]
+
+        rows = queryset.filter(pk__in=[key[-1] for key in keys]).order_by(
+            *self._order_by(self.ordering, queryset.model)
+        )
+        return Page(
+            queryset=rows,
+            next=self._encode(False, keys[-1]) if keys and has_next else None,
+            previous=self._encode(True, keys[0]) if keys and has_previous else None,
+            count=count,
+            page=page,
+            page_size=size,
+        )
+
+    # ── helpers ──────────────────────────────────────────────────────────
+
+    @staticmethod
+    def _int(raw, default, name):
+        if raw in (None, ""):
+            return default
+        try:
+            value = int(raw)
+        except (TypeError, ValueError):
+            raise CursorError(f"{name} must be a positive integer.")
+        if value < 1:
+            raise CursorError(f"{name} must be a positive integer.")
+        return value
+
+    def _reversed(self):
+        return [name[1:] if name.startswith("-") else f"-{name}" for name in self.ordering]
+
+    @staticmethod
+    def _field(model, name):
+        try:
+            return model._meta.get_field("id" if name == "pk" else name)
+        except FieldDoesNotExist:
+            return None         # an annotation
+
+    def _order_by(self, ordering, model):
+        expressions = []
+        for name in ordering:
+            descending, field_name = name.startswith("-"), name.lstrip("-")
+            field = self._field(model, field_name)
+            if field is not None and field.null:
+                expressions.append(
+                    F(field_name).desc(nulls_first=True) if descending else F(field_name).asc(nulls_last=True)
+                )
+            else:
+                expressions.append(F(field_name).desc() if descending else F(field_name).asc())
+        return expressions
+
+    def _after(self, values, ordering, model):
+        """Rows strictly after ``values`` in ``ordering`` (lexicographic, NULL greatest)."""
+        condition = Q(pk__in=[])
+        equal = Q()
+        for name, value in zip(ordering, values):
+            descending, field_name = name.startswith("-"), name.lstrip("-")
+            field = self._field(model, field_name)
+            nullable = field is not None and field.null
+            if value is None:
+                beyond = Q(**{f"{field_name}__isnull": False}) if descending else None
+                same = Q(**{f"{field_name}__isnull": True})
+            else:
+                beyond = Q(**{f"{field_name}__{'lt' if descending else 'gt'}": value})
+                if nullable and not descending:
+                    beyond |= Q(**{f"{field_name}__isnull": True})
+                same = Q(**{field_name: value})
+            if beyond is not None:
+                condition |= equal & beyond
+            equal &= same
+        return condition
+
+    def _encode(self, backwards, key):
+        payload = json.dumps(["p" if backwards else "n", [_dump(value) for value in key]], separators=(",", ":"))
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+    def _decode(self, token, model):
+        try:
+            raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+            direction, values = json.loads(raw)
+            if direction not in ("n", "p") or len(values) != len(self.ordering):
+                raise ValueError
+            decoded = []
+            for name, value in zip(self.ordering, values):
+                field = self._field(model, name.lstrip("-"))
+                if value is not None:
+                    value = field.to_python(value) if field is not None else float(value)
+                decoded.append(value)
+        except (binascii.Error, ValueError, TypeError, ValidationError):
+            raise CursorError("Invalid cursor.")
+        return direction == "p", decoded
+
+    def _count(self, queryset):
+        sql, params = queryset.order_by().query.sql_with_params()
+        digest = hashlib.md5(f"{sql}|{params!r}".encode()).hexdigest()
+        key = COUNT_KEY.format(digest=digest)
+        count = cache.get(key)
+        if count is None:
+            count = queryset.count()
+            cache.set(key, count, self.count_ttl)
+        return count
+
+
+def page_response(page: Page, results) -> dict:
+    """Standard body for a paginated list."""
+    body = {
+        "results": results,
+        "count": page.count,
+        "next": page.next,
+        "previous": page.previous,
+        "total_pages": page.total_pages,
+    }
+    if page.page is not None:
+        body["page"] = page.page
+    return body
+
+
+# ── Window filters ──────────────────────────────────────────────────────────
+
+def _date_param(request, name):
+    raw = request.query_params.get(name)
+    if not raw:
+        return None
+    try:
+        value = parse_date(raw)
+    except ValueError:
+        value = None
+    if value is None:
+        raise QueryParamError(f"{name} must be a date (YYYY-MM-DD).")
+    return value
+
+
+def window(request, default_from=None, default_days=None):
+    """Return ``(start, end)`` from ``?from=`` / ``?to=`` (YYYY-MM-DD); either may be None.
+
+    Without ``?to=``, ``default_days`` (if given) closes the window that many
+    days after its start.
+    """
+    start = _date_param(request, "from") or default_from
+    end = _date_param(request, "to")
+    if end is None and start and default_days:
+        end = start + datetime.timedelta(days=default_days)
+    if start and end and end < start:
+        raise QueryParamError("to must not be before from.")
+    return start, end
+
+
+def date_window(request, queryset, field, default_from=None, default_days=None):
+    """Filter a DateField to ``?from=`` .. ``?to=`` (inclusive); see ``window``."""
+    start, end = window(request, default_from, default_days)
+    if start:
+        queryset = queryset.filter(**{f"{field}__gte": start})
+    if end:
+        queryset = queryset.filter(**{f"{field}__lte": end})
+    return queryset
+
+
+def since(request, queryset, field):
+    """Filter a DateTimeField to rows at or after ``?since=`` (ISO date or datetime)."""
+    raw = request.query_params.get("since")
+    if not raw:
+        return queryset
+    try:
+        value = parse_datetime(raw)
+        if value is None and parse_date(raw) is not None:
+            value = datetime.datetime.combine(parse_date(raw), datetime.time.min)
+    except ValueError:
+        value = None
+    if value is None:
+        raise QueryParamError("since must be an ISO date or datetime.")
+    if timezone.is_naive(value):
+        value = timezone.make_aware(value)
+    return queryset.filter(**{f"{field}__gte": value})
@@ -0,0 +1,222 @@
+"""
+Projection-based fast path for read-only list endpoints.
+
+A ``Projection`` wraps an existing ModelSerializer and reproduces its output
+without building model instances or running the per-field serializer
+machinery for every row:
+
+* the queryset is narrowed with ``values_list()`` to exactly the columns the
+  serializer reads (related values such as ``category__name`` are joined in
+  the same query);
+* each row tuple is unpacked into a small ``__slots__`` record;
+* a row function generated once per serializer turns the record into the
+  output dict, calling a converter only for fields whose representation
+  differs from the raw column value (dates, decimals, files, UUIDs). The
+  common converters are specialised once from the field's settings;
+  anything else calls the DRF field's own ``to_representation``.
+
+Fields backed by model properties or ``SerializerMethodField`` cannot be
+derived from the serializer alone; they are declared in ``computed`` as
+``name -> (columns, function(record))``. The serializer remains the
+reference implementation: ``core.tests.test_projections`` asserts that
+both paths agree, and ``manage.py check_projections`` times them.
+"""
+import decimal
+import threading
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.utils import timezone
+from rest_framework import ISO_8601, serializers
+from rest_framework.settings import api_settings
+
+# DRF fields whose to_representation() is the identity for values that come
+# straight out of the database driver.
+_IDENTITY_FIELDS = (
+    serializers.BooleanField,
+    serializers.CharField,          # includes Email/Slug/URL/RegexField
+    serializers.ChoiceField,
+    serializers.IntegerField,
+    serializers.JSONField,
+    serializers.PrimaryKeyRelatedField,
+)
+
+
+def _file_url(storage):
+    """Converter for a FileField column holding the stored file name."""
+    def convert(name, context):
+        if not name:
+            return None
+        url = storage.url(name)
+        request = context.get("request")
+        return request.build_absolute_uri(url) if request is not None else url
+    return convert
+
+
+def _iso_datetime(value, tz):
+    # DateTimeField.to_representation with the default ISO-8601 format;
+    # ``tz`` is the current timezone, looked up once per serialize() call.
+    value = value.astimezone(tz).isoformat()
+    return value[:-6] + "Z" if value.endswith("+00:00") else value
+
+
+def _iso(value):
+    return value.isoformat()
+
+
+def _decimal(field):
+    # DecimalField.to_representation with coerce_to_string and no localize.
+    quantum = decimal.Decimal(".1") ** field.decimal_places
+    context = decimal.Context(prec=field.max_digits, rounding=field.rounding)
+
+    def convert(value):
+        if not isinstance(value, decimal.Decimal):
+            value = decimal.Decimal(str(value).strip())
+        return "{:f}".format(value.quantize(quantum, context=context))
+    return convert
+
+
+def _converter(field):
+    """Return a value converter equivalent to ``field.to_representation``, or None for identity."""
+    if isinstance(field, _IDENTITY_FIELDS):
+        return None
+    if type(field) is serializers.UUIDField and field.uuid_format == "hex_verbose":
+        return str
+    if type(field) is serializers.DateTimeField:
+        if (getattr(field, "format", api_settings.DATETIME_FORMAT) or "").lower() == ISO_8601 \
+                and not hasattr(field, "timezone") and settings.USE_TZ:
+            return _iso_datetime
+    elif type(field) is serializers.DateField:
+        if (getattr(field, "format", api_settings.DATE_FORMAT) or "").lower() == ISO_8601:
+            return _iso
+    elif type(field) is serializers.TimeField:
+        if (getattr(field, "format", api_settings.TIME_FORMAT) or "").lower() == ISO_8601:
+            return _iso
+    elif type(field) is serializers.DecimalField:
+        if getattr(field, "coerce_to_string", api_settings.COERCE_DECIMAL_TO_STRING) \
+                and not field.localize and field.decimal_places is not None:
+            return _decimal(field)
+    # Anything unusual: defer to DRF itself.
+    return field.to_representation
+
+
+class Projection:
+    """Fast, output-identical read path for one ModelSerializer."""
+
+    def __init__(self, serializer_class, computed=None):
+        self.serializer_class = serializer_class
+        self.computed = computed or {}
+        self._compiled = None
+        self._lock = threading.Lock()
+
+    def serialize(self, queryset, context=None, extra=None):
+        """Return the list of dicts ``serializer_class(queryset, many=True).data`` would.
+
+        ``extra`` maps additional output keys to ``(annotation, function(value))``
+        for per-query values such as search ranks and snippets.
+        """
+        columns, make_record, to_dict = self._compile()
+        context = context or {}
+        tz = timezone.get_current_timezone()
+        if not extra:
+            return [to_dict(make_record(row), context, tz) for row in queryset.values_list(*columns)]
+        width = len(columns)
+        extras = list(extra.items())
+        results = []
+        for row in queryset.values_list(*columns, *(annotation for _, (annotation, _f) in extras)):
+            item = to_dict(make_record(row[:width]), context, tz)
+            for offset, (key, (_annotation, func)) in enumerate(extras, start=width):
+                item[key] = func(row[offset])
+            results.append(item)
+        return results
+
+    # ── compilation ──────────────────────────────────────────────────────
+
+    def _compile(self):
+        if self._compiled is None:
+            with self._lock:
+                if self._compiled is None:
+                    self._compiled = self._build()
+        return self._compiled
+
+    def _build(self):
+        serializer = self.serializer_class()
+        model = serializer.Meta.model
+        columns = []
+        outputs = []            # (output name, expression source)
+        namespace = {}
+
+        def column(name):
+            if name not in columns:
+                columns.append(name)
+            return name
+
+        for name, field in serializer.fields.items():
+            if field.write_only:
+                continue
+            if name in self.computed:
+                needed, func = self.computed[name]
+                for col in needed:
+                    column(col)
+                namespace[f"f_{name}"] = func
+                outputs.append((name, f"f_{name}(r)"))
+                continue
+            if isinstance(field, (serializers.ReadOnlyField, serializers.SerializerMethodField)):
+                raise ImproperlyConfigured(
+                    f"{self.serializer_class.__name__}.{name} needs an entry in Projection(computed=...)."
+                )
+
+            model_field = model._meta.get_field(field.source)
+            attr = column(model_field.attname)
+            value = f"r.{attr}"
+
+            if isinstance(field, serializers.FileField):
+                namespace[f"c_{name}"] = _file_url(model_field.storage)
+                outputs.append((name, f"c_{name}({value}, context)"))
+                continue
+            convert = _converter(field)
+            if convert is None:
+                outputs.append((name, value))
+            elif convert is _iso_datetime:
+                namespace[f"c_{name}"] = convert
+                outputs.append((name, f"(None if {value} is None else c_{name}({value}, tz))"))
+            else:
+                namespace[f"c_{name}"] = convert
+                outputs.append((name, f"(None if {value} is None else c_{name}({value}))"))
+
+        record = type(f"{model.__name__}Record", (), {"__slots__": tuple(columns)})
+        namespace["Record"] = record
+        namespace["new"] = object.__new__
+        targets = ", ".join(f"r.{col}" for col in columns)
+        body = ",\n        ".join(f"{name!r}: {expr}" for name, expr in outputs)
+        source = (
+            "def make_record(row):\n"
+            "    r = new(Record)\n"
+            f"    {targets}{',' if len(columns) == 1 else ''} = row\n"
+            "    return r\n"
+            "\n"
+            "def to_dict(r, context, tz):\n"
+            "    return {\n"
+            f"        {body}\n"
+            "    }\n"
+        )
+        exec(compile(source, f"<projection {self.serializer_class.__name__}>", "exec"), namespace)
+        return tuple(columns), namespace["make_record"], namespace["to_dict"]
+
+
+def model_property(model, name):
+    """Reuse a model @property on a projection record (it must only read columns)."""
+    prop = getattr(model, name)
+    if not isinstance(prop, property):
+        raise ImproperlyConfigured(f"{model.__name__}.{name} is not a property.")
+    return prop.fget
+
+
+def file_url(model, name, empty=""):
+    """Computed helper mirroring a ``<file>.url if <file> else ""`` model property."""
+    storage = model._meta.get_field(name).storage
+
+    def get(record):
+        value = getattr(record, name)
+        return storage.url(value) if value else empty
+    return get
@@ -0,0 +1,103 @@
+"""
+Sliding-window rate limiter backed by the shared cache.
+
+Each limit keeps one counter per fixed window. The effective count is the
+current window's counter plus the previous window's counter weighted by how
+much of it still overlaps the sliding window, which approximates a true
+sliding log with two integers and no database access:
+
+    estimate = previous * (1 - elapsed / window) + current
+
+Counters are bumped with ``incr`` and expire after two windows. Django's
+``incr`` is a get followed by a set with the *default* timeout, so every
+bump and rollback re-applies the counter's own expiry with ``touch``;
+otherwise a day counter on the db/file cache would lapse after
+``CACHE_DEFAULT_TIMEOUT`` seconds of quiet. ``incr`` is only atomic on
+redis: on the db/file backends simultaneous hits can overwrite each other
+and undercount a burst by a few requests, so use redis where a limit has to
+be exact.
+"""
+import logging
+import math
+import time
+from typing import NamedTuple, Optional, Sequence
+
+from django.core.cache import cache
+
+logger = logging.getLogger("core")
+
+KEY = "ratelimit:{scope}:{ident}:{window}:{bucket}"
+
+
+class Limit(NamedTuple):
+    """At most ``limit`` hits per ``window`` seconds; a ``limit`` of 0 means no limit."""
+    name: str
+    limit: int
+    window: int
+
+
+class RateLimitExceeded(NamedTuple):
+    limit: Limit
+    retry_after: int
+
+
+def _key(scope, ident, window, bucket):
+    return KEY.format(scope=scope, ident=ident, window=window, bucket=bucket)
+
+
+def _incr(key, timeout, delta=1):
+    cache.add(key, 0, timeout)
+    try:
+        value = cache.incr(key, delta)
+    except ValueError:
+        # Evicted between add() and incr(); start again from this hit.
+        cache.set(key, max(delta, 0), timeout)
+        return max(delta, 0)
+    cache.touch(key, timeout)
+    return value
+
+
+def _retry_after(limit: Limit, previous: int, current: int, elapsed: float) -> int:
+    """Seconds until one more hit fits under ``limit`` (``current`` excludes it)."""
+    window, allowed = limit.window, limit.limit - 1
+    if current <= allowed and previous:
+        # Wait for enough of the previous window to slide out.
+        wait = window * (1 - (allowed - current) / previous) - elapsed
+    else:
+        # The current window alone is full: wait for it to become the
+        # "previous" window and decay far enough.
+        wait = (window - elapsed) + window * (1 - allowed / max(current, 1))
+    return max(1, math.ceil(wait))
+
+
+def hit(scope: str, ident: str, limits: Sequence[Limit]) -> Optional[RateLimitExceeded]:
+    """Record one hit for ``ident`` and return the first limit exceeded, if any.
+
+    A rejected hit is rolled back so it does not count against the caller.
+    Limits of 0 are skipped.
+    """
+    now = time.time()
+    consumed = []
+    exceeded = None
+    try:
+        for limit in limits:
+            if limit.limit <= 0:
+                continue
+            bucket = int(now // limit.window)
+            elapsed = now - bucket * limit.window
+            cur_key = _key(scope, ident, limit.window, bucket)
+            current = _incr(cur_key, limit.window * 2)
+            consumed.append((cur_key, limit.window * 2))
+            previous = cache.get(_key(scope, ident, limit.window, bucket - 1), 0)
+            estimate = previous * (1 - elapsed / limit.window) + current
+            if estimate > limit.limit:
+                exceeded = RateLimitExceeded(limit, _retry_after(limit, previous, current - 1, elapsed))
+                break
+        if exceeded:
+            for key, timeout in consumed:
+                _incr(key, timeout, -1)
+    except Exception as e:
+        # Fail open: a cache outage should not take the feature down.
+        logger.warning("Rate limiter unavailable for %s: %s", scope, str(e))
+        return None
+    return exceeded
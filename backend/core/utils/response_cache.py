@@ -0,0 +1,133 @@
+"""
+Response cache for public, read-only API views.
+
+``cache_response`` wraps an ``@api_view`` function and stores its rendered
+body in the shared cache, keyed on path + query string and on the version of
+every content group it depends on. Model signals bump a group's version
+(see ``core.signals``), which orphans all entries built from the old data.
+Every cached response carries a strong ETag and Last-Modified header so
+browsers can revalidate with a 304.
+
+A hit is only served once the view's own DRF checks (authentication,
+permissions, throttles) pass; otherwise the request goes through the view,
+which answers it as it would uncached (e.g. 401 for an expired token).
+"""
+import functools
+import hashlib
+import logging
+import time
+
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date
+from rest_framework.exceptions import APIException
+
+logger = logging.getLogger("core")
+
+RESPONSE_TTL = 60 * 10          # seconds; signals normally invalidate sooner
+VERSION_KEY = "respcache:ver:{group}"
+ENTRY_KEY = "respcache:{digest}"
+STORED_HEADERS = ("Content-Type", "Vary", "Allow")
+
+
+def _group_versions(groups):
+    keys = [VERSION_KEY.format(group=g) for g in groups]
+    found = cache.get_many(keys)
+    versions = []
+    for key in keys:
+        version = found.get(key)
+        if version is None:
+            # Timestamp seed so an evicted counter never reuses an old version.
+            cache.add(key, int(time.time()), None)
+            version = cache.get(key)
+        versions.append(str(version))
+    return versions
+
+
+def _entry_key(request, groups):
+    query = sorted(request.GET.lists())
+    raw = "|".join([request.path, repr(query), *groups, *_group_versions(groups)])
+    return ENTRY_KEY.format(digest=hashlib.sha256(raw.encode()).hexdigest())
+
+
+def _finalise(request, response, entry):
+    response["ETag"] = entry["etag"]
+    response["Last-Modified"] = http_date(entry["last_modified"])
+    patch_cache_control(response, public=True, no_cache=True)
+    return get_conditional_response(
+        request,
+        etag=entry["etag"],
+        last_modified=entry["last_modified"],
+        response=response,
+    )
+
+
+def _passes_checks(view, request, args, kwargs):
+    """Run the DRF view's ``initial()`` checks without calling its handler."""
+    instance = view.cls(**view.initkwargs)
+    instance.args, instance.kwargs = args, kwargs
+    drf_request = instance.initialize_request(request, *args, **kwargs)
+    instance.request = drf_request
+    instance.headers = instance.default_response_headers
+    try:
+        instance.initial(drf_request, *args, **kwargs)
+    except APIException:
+        return False
+    return True
+
+
+def cache_response(*groups, timeout=RESPONSE_TTL):
+    """Cache a public GET view's JSON body, invalidated per content group.
+
+    Must be applied *above* ``@api_view`` so it sees the rendered response.
+    """
+    def decorator(view):
+        @functools.wraps(view)
+        def wrapper(request, *args, **kwargs):
+            # Only plain JSON GETs; the browsable API and writes go straight through.
+            if request.method != "GET" or "text/html" in request.META.get("HTTP_ACCEPT", ""):
+                return view(request, *args, **kwargs)
+
+            try:
+                key = _entry_key(request, groups)
+                entry = cache.get(key)
+            except Exception as e:
+                logger.warning("Response cache unavailable: %s", str(e))
+                return view(request, *args, **kwargs)
+
+            if entry is not None and _passes_checks(view, request, args, kwargs):
+                response = HttpResponse(entry["body"])
+                for name, value in entry["headers"].items():
+                    response[name] = value
+                return _finalise(request, response, entry)
+
+            response = view(request, *args, **kwargs)
+            if response.status_code != 200 or response.streaming:
+                return response
+            if hasattr(response, "render") and not response.is_rendered:
+                response.render()
+
+            entry = {
+                "body": response.content,
+                "headers": {h: response[h] for h in STORED_HEADERS if h in response},
+                "etag": '"%s"' % hashlib.sha1(response.content).hexdigest(),
+                "last_modified": int(time.time()),
+            }
+            cache.set(key, entry, timeout)
+            return _finalise(request, response, entry)
+
+        return wrapper
+    return decorator
+
+
+def invalidate(*groups):
+    """Bump the version of each group so its cached responses are ignored."""
+    for group in groups:
+        key = VERSION_KEY.format(group=group)
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.add(key, int(time.time()), None)
+        except Exception as e:
+            logger.warning("Could not invalidate response cache group %s: %s", group, str(e))
@@ -0,0 +1,107 @@
+"""
+Wake-ups for long-polling WebRTC signalling (``signal_poll?wait=N``).
+
+A waiting poll parks on an ``asyncio.Event`` registered for its room.
+``notify`` (called when a signal is stored) sets every event registered for
+the room in this process, from whatever thread it runs in, so a sender and
+receiver on the same worker see each other within milliseconds.
+
+Receivers on other workers cannot be reached that way, so each waiter also
+checks a per-room version every ``SIGNAL_WAIT_CHECK_INTERVAL`` seconds.
+With Redis (``SIGNAL_BUS_CACHE``) ``notify`` bumps that version in the cache
+and the check never touches the database. On the db and file caches a cache
+read would be a query anyway, so the version is the room's newest
+``VideoSignal`` id instead: one indexed lookup per check, and the interval
+defaults to 5 s rather than 1 s.
+
+A wake-up only means "look again": the caller re-reads the database, so a
+spurious or missed notification costs latency, never correctness.
+"""
+import asyncio
+import logging
+import threading
+import time
+from collections import defaultdict
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+
+logger = logging.getLogger("core")
+
+VERSION_KEY = "videosignal:ver:{room_id}"
+VERSION_TTL = 60 * 60 * 6
+
+_waiters = defaultdict(set)     # room_id -> {(loop, event)}
+_lock = threading.Lock()
+
+
+def version(room_id: str):
+    """Current notification version for ``room_id`` (None until the first signal)."""
+    if not settings.SIGNAL_BUS_CACHE:
+        from ..models import VideoSignal
+
+        return VideoSignal.objects.filter(room_id=room_id).order_by("-pk").values_list("pk", flat=True).first()
+    try:
+        return cache.get(VERSION_KEY.format(room_id=room_id))
+    except Exception as e:
+        logger.warning("Signal bus cache unavailable: %s", str(e))
+        return None
+
+
+def notify(room_id: str):
+    """Wake every poll waiting on ``room_id`` (this process now, others at their next check)."""
+    if settings.SIGNAL_BUS_CACHE:
+        _bump(room_id)
+
+    with _lock:
+        waiters = list(_waiters.get(room_id, ()))
+    for loop, event in waiters:
+        try:
+            loop.call_soon_threadsafe(event.set)
+        except RuntimeError:        # loop already closed (request finished)
+            pass
+
+
+def _bump(room_id: str):
+    key = VERSION_KEY.format(room_id=room_id)
+    try:
+        if not cache.add(key, int(time.time() * 1000), VERSION_TTL):
+            cache.incr(key)
+    except ValueError:
+        cache.set(key, int(time.time() * 1000), VERSION_TTL)
+    except Exception as e:
+        logger.warning("Could not publish signal for room %s: %s", room_id, str(e))
+
+
+async def wait(room_id: str, timeout: float, seen_version) -> bool:
+    """Wait up to ``timeout`` seconds for a signal in ``room_id``.
+
+    ``seen_version`` is ``version(room_id)`` read *before* the caller last
+    queried the database, so a signal stored in between is not missed.
+    Returns True if woken, False on timeout.
+    """
+    loop = asyncio.get_running_loop()
+    event = asyncio.Event()
+    waiter = (loop, event)
+    with _lock:
+        _waiters[room_id].add(waiter)
+    try:
+        deadline = loop.time() + timeout
+        interval = settings.SIGNAL_WAIT_CHECK_INTERVAL
+        while True:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return False
+            try:
+                await asyncio.wait_for(event.wait(), min(interval, remaining))
+                return True
+            except asyncio.TimeoutError:
+                pass
+            if await sync_to_async(version)(room_id) != seen_version:
+                return True
+    finally:
+        with _lock:
+            _waiters[room_id].discard(waiter)
+            if not _waiters[room_id]:
+                del _waiters[room_id]
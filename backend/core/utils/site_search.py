@@ -0,0 +1,232 @@
+"""
+Site-wide search over blog posts, resources and events.
+
+Every published object is broken into normalised terms and stored as
+``SearchTerm`` postings ``(term, kind, object_id, weight)``. The weight is
+the field-weighted, log-damped term frequency, so a word in a title counts
+for far more than the same word deep in an article body. The index is kept
+current from the save/delete signals in ``core.signals`` and can be rebuilt
+with ``manage.py reindex_search``.
+
+A query is answered with one grouped query on the term index: every query
+word must match (the last one as a prefix, for search-as-you-type) and hits
+are ranked by the summed weight of their matching postings. Only the page
+of results being returned is then loaded from the content tables.
+"""
+import math
+import re
+import unicodedata
+from collections import Counter, defaultdict
+
+from django.db.models import Case, IntegerField, Max, Q, Sum, When
+from django.utils.html import strip_tags
+from django.utils.text import Truncator
+
+MAX_QUERY_TERMS = 8
+MAX_TERM_LENGTH = 64
+SUMMARY_WORDS = 30
+
+STOP_WORDS = frozenset("""
+    a an and are as at be but by for from has have how i if in into is it its
+    my of on or our so than that the their them then there these they this to
+    was we what when where which who will with you your
+""".split())
+
+# kind -> (model name, [(field, weight)]). Text fields may contain HTML.
+SOURCES = {
+    "blog": ("BlogPost", [("title", 10.0), ("tags", 5.0), ("excerpt", 4.0), ("content", 1.0)]),
+    "resource": ("Resource", [("title", 10.0), ("description", 4.0), ("content", 1.0)]),
+    "event": ("Event", [("title", 10.0), ("location", 3.0), ("description", 2.0)]),
+}
+KIND_FOR_MODEL = {model_name: kind for kind, (model_name, _fields) in SOURCES.items()}
+INDEXED_FIELDS = {kind: {field for field, _weight in fields} for kind, (_model, fields) in SOURCES.items()}
+
+
+# ── Text normalisation ──────────────────────────────────────────────────────
+
+def _stem(word: str) -> str:
+    """Very light English suffix stripping, applied identically to documents and queries."""
+    for suffix in ("ing", "edly", "ed", "ies", "es", "s"):
+        if word.endswith(suffix) and len(word) - len(suffix) >= 3 and not word.endswith("ss"):
+            word = word[: -len(suffix)]
+            return word + "y" if suffix == "ies" else word
+    return word
+
+
+def terms(text: str):
+    """Normalised, stemmed terms of ``text`` in order (stop words dropped)."""
+    text = unicodedata.normalize("NFKD", strip_tags(text or "")).encode("ascii", "ignore").decode().lower()
+    return [
+        _stem(word)[:MAX_TERM_LENGTH]
+        for word in re.findall(r"[a-z0-9]+", text)
+        if word not in STOP_WORDS and len(word) > 1
+    ]
+
+
+def postings(obj, kind: str) -> dict:
+    """Return ``{term: weight}`` for one object."""
+    weights = defaultdict(float)
+    for field, field_weight in SOURCES[kind][1]:
+        value = getattr(obj, field)
+        if isinstance(value, (list, tuple)):
+            value = " ".join(str(item) for item in value)
+        for term, count in Counter(terms(value)).items():
+            weights[term] += field_weight * (1 + math.log(count))
+    return weights
+
+
+# ── Index maintenance ───────────────────────────────────────────────────────
+
+def _index_model():
+    from ..models import SearchTerm
+    return SearchTerm
+
+
+def _rows(obj, kind, SearchTerm):
+    object_id = str(obj.pk)
+    return [
+        SearchTerm(term=term, kind=kind, object_id=object_id, weight=round(weight, 4))
+        for term, weight in postings(obj, kind).items()
+    ]
+
+
+def index_object(obj, SearchTerm=None):
+    """(Re)index one object; unpublished objects are removed from the index."""
+    SearchTerm = SearchTerm or _index_model()
+    kind = KIND_FOR_MODEL[type(obj).__name__]
+    SearchTerm.objects.filter(kind=kind, object_id=str(obj.pk)).delete()
+    if obj.is_published:
+        SearchTerm.objects.bulk_create(_rows(obj, kind, SearchTerm), batch_size=500)
+
+
+def remove_object(obj):
+    kind = KIND_FOR_MODEL[type(obj).__name__]
+    _index_model().objects.filter(kind=kind, object_id=str(obj.pk)).delete()
+
+
+def rebuild(model, SearchTerm=None, batch_size=200) -> int:
+    """Replace every posting for ``model`` (live or historical); return objects indexed."""
+    SearchTerm = SearchTerm or _index_model()
+    kind = KIND_FOR_MODEL[model.__name__]
+    fields = ["pk", *INDEXED_FIELDS[kind]]
+    SearchTerm.objects.filter(kind=kind).delete()
+    indexed = 0
+    rows = []
+    for obj in model.objects.filter(is_published=True).only(*fields).iterator(chunk_size=batch_size):
+        rows.extend(_rows(obj, kind, SearchTerm))
+        indexed += 1
+        if len(rows) >= 2000:
+            SearchTerm.objects.bulk_create(rows, batch_size=500)
+            rows = []
+    SearchTerm.objects.bulk_create(rows, batch_size=500)
+    return indexed
+
+
+# ── Querying ────────────────────────────────────────────────────────────────
+
+def _conditions(text):
+    words = terms(text)[:MAX_QUERY_TERMS]
+    if not words:
+        return []
+    conditions = [Q(term=word) for word in dict.fromkeys(words[:-1])]
+    conditions.append(Q(term__startswith=words[-1]))
+    return conditions
+
+
+def matches(text: str, kinds=None):
+    """Grouped queryset of ``{kind, object_id, score}`` matching every query word, best first."""
+    SearchTerm = _index_model()
+    conditions = _conditions(text)
+    if not conditions:
+        return SearchTerm.objects.none().values("kind", "object_id")
+    any_condition = Q()
+    for condition in conditions:
+        any_condition |= condition
+    postings_qs = SearchTerm.objects.filter(any_condition)
+    if kinds:
+        postings_qs = postings_qs.filter(kind__in=kinds)
+
+    matched = None
+    for condition in conditions:
+        hit = Max(Case(When(condition, then=1), default=0, output_field=IntegerField()))
+        matched = hit if matched is None else matched + hit
+    return (
+        postings_qs.values("kind", "object_id")
+        .annotate(score=Sum("weight"), matched=matched)
+        .filter(matched=len(conditions))
+        .order_by("-score", "kind", "object_id")
+    )
+
+
+def matching_ids(text: str, kind: str):
+    """Ids of ``kind`` objects matching ``text``, for ``pk__in`` filters.
+
+    Evaluated eagerly: ``object_id`` is text, which cannot be compared with a
+    UUID column inside a subquery on every backend.
+    """
+    return [hit["object_id"] for hit in matches(text, [kind])]
+
+
+def _hydrate(hits):
+    from ..models import BlogPost, Event, Resource
+
+    ids = defaultdict(list)
+    for hit in hits:
+        ids[hit["kind"]].append(hit["object_id"])
+    found = {}
+    if ids["blog"]:
+        for post in BlogPost.objects.filter(pk__in=ids["blog"], is_published=True).only(
+            "pk", "title", "slug", "excerpt", "published_at", "created_at",
+        ):
+            found["blog", str(post.pk)] = {
+                "title": post.title,
+                "url": f"/blog/{post.slug}",
+                "summary": post.excerpt,
+                "date": post.published_at or post.created_at,
+            }
+    if ids["resource"]:
+        for resource in Resource.objects.filter(pk__in=ids["resource"], is_published=True).only(
+            "pk", "title", "slug", "description", "resource_type", "created_at",
+        ):
+            found["resource", str(resource.pk)] = {
+                "title": resource.title,
+                "url": f"/resources/{resource.slug}",
+                "summary": resource.description,
+                "date": resource.created_at,
+                "resource_type": resource.resource_type,
+            }
+    if ids["event"]:
+        for event in Event.objects.filter(pk__in=ids["event"], is_published=True).only(
+            "pk", "title", "description", "date", "location", "is_online",
+        ):
+            found["event", str(event.pk)] = {
+                "title": event.title,
+                "url": "/events",
+                "summary": event.description,
+                "date": event.date,
+                "location": "Online" if event.is_online else event.location,
+            }
+    return found
+
+
+def search(text: str, kinds=None, limit=20, offset=0):
+    """Return ``(total, results)`` for one page of merged, ranked results."""
+    grouped = matches(text, kinds)
+    total = grouped.count()
+    hits = list(grouped[offset:offset + limit])
+    found = _hydrate(hits)
+    results = []
+    for hit in hits:
+        item = found.get((hit["kind"], hit["object_id"]))
+        if item is None:        # unpublished/deleted since it was indexed
+            continue
+        date = item["date"]
+        results.append({
+            "type": hit["kind"],
+            "id": hit["object_id"],
+            **item,
+            "summary": Truncator(strip_tags(item["summary"])).words(SUMMARY_WORDS),
+            "date": date.isoformat() if date else None,
+            "score": round(hit["score"], 3),
+        })
+    return total, results
@@ -13,3 +13,4 @@ from .resources import *  # noqa
 from .profile import *  # noqa
 from .goals import *  # noqa
 from .notes import *  # noqa
+from .search import *  # noqa
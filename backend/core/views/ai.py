@@ -1,10 +1,11 @@
 """AI assistant views using Gemini via Vertex AI."""
 import hashlib
+import json
 import logging
-from datetime import timedelta
 from typing import Optional
 
-from django.utils import timezone
+from asgiref.sync import sync_to_async
+from django.http import StreamingHttpResponse
 from rest_framework import status
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import AllowAny, IsAuthenticated
@@ -13,14 +14,12 @@ from rest_framework.response import Response
 from ..models import SystemConfiguration, AIUsageLog
 from ..serializers import AIChatSerializer
 from ..permissions import IsAdmin
-from ..utils.gemini_service import call_gemini, test_connection
+from ..utils import answer_cache, rate_limit
+from ..utils.async_api import async_api_view
+from ..utils.gemini_service import acall_gemini, stream_gemini, test_connection, get_metrics
 
 logger = logging.getLogger("core")
 
-# Rate limits
-RATE_PER_MINUTE = 5    # max requests per minute per IP/user
-RATE_PER_DAY = 50      # max requests per day per IP/user
-
 
 def _rate_key(request) -> str:
     """Return a consistent identifier for rate-limiting (user pk or IP hash)."""
@@ -31,24 +30,26 @@ def _rate_key(request) -> str:
     return f"anon:{hashlib.sha256(f'{ip}:{ua}'.encode()).hexdigest()[:16]}"
 
 
-def _check_rate_limit(request) -> Optional[dict]:
-    """Return a 429 dict if rate-limited, else None."""
-    key = _rate_key(request)
-    now = timezone.now()
-
-    # Per-minute check
-    one_min_ago = now - timedelta(minutes=1)
-    minute_count = AIUsageLog.objects.filter(session_id=key, created_at__gte=one_min_ago).count()
-    if minute_count >= RATE_PER_MINUTE:
-        return {"detail": "Rate limit exceeded. Please wait a moment before trying again.", "retry_after_seconds": 60}
-
-    # Per-day check
-    day_start = now - timedelta(hours=24)
-    day_count = AIUsageLog.objects.filter(session_id=key, created_at__gte=day_start).count()
-    if day_count >= RATE_PER_DAY:
-        return {"detail": "Daily AI usage limit reached. Please try again tomorrow.", "retry_after_seconds": 3600}
-
-    return None
+def _check_rate_limit(request, config) -> Optional[Response]:
+    """Return a 429 response if the caller is over a limit, else None."""
+    limits = [
+        rate_limit.Limit("minute", config.ai_rate_per_minute, 60),
+        rate_limit.Limit("day", config.ai_rate_per_day, 60 * 60 * 24),
+    ]
+    exceeded = rate_limit.hit("ai-chat", _rate_key(request), limits)
+    if not exceeded:
+        return None
+
+    if exceeded.limit.name == "minute":
+        detail = "Rate limit exceeded. Please wait a moment before trying again."
+    else:
+        detail = "Daily AI usage limit reached. Please try again tomorrow."
+    response = Response(
+        {"detail": detail, "retry_after_seconds": exceeded.retry_after},
+        status=status.HTTP_429_TOO_MANY_REQUESTS,
+    )
+    response["Retry-After"] = str(exceeded.retry_after)
+    return response
 
 
 @api_view(["GET"])
@@ -61,56 +62,153 @@ def ai_status(request):
     })
 
 
-@api_view(["POST"])
+@async_api_view(["POST"])
 @permission_classes([AllowAny])
-def ai_chat(request):
-    """Send a message to the AI assistant and get a response."""
-    config = SystemConfiguration.load()
+async def ai_chat(request):
+    """Send a message to the AI assistant and get a response.
+
+    Async so a slow Gemini call waits on the event loop instead of holding
+    a worker thread.
+    """
+    config = await sync_to_async(SystemConfiguration.load)()
     if not config.ai_enabled or not config.gemini_api_key:
         return Response(
             {"detail": "The AI assistant is currently unavailable."},
             status=status.HTTP_503_SERVICE_UNAVAILABLE,
         )
 
-    # Rate limiting
-    rate_error = _check_rate_limit(request)
-    if rate_error:
-        return Response(rate_error, status=status.HTTP_429_TOO_MANY_REQUESTS)
-
     serializer = AIChatSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
 
+    # Rate limiting (after validation, so malformed requests don't use the quota)
+    rate_error = await sync_to_async(_check_rate_limit)(request, config)
+    if rate_error:
+        return rate_error
+
     user_message = serializer.validated_data["message"]
 
-    try:
-        response_text, tokens = call_gemini(
-            user_message=user_message,
-            system_prompt=config.ai_system_prompt,
-            api_key=config.gemini_api_key,
-            max_tokens=config.ai_max_tokens,
-        )
-    except Exception as e:
-        logger.error("Gemini API error: %s", str(e))
-        return Response(
-            {"detail": "The AI assistant encountered an error. Please try again."},
-            status=status.HTTP_502_BAD_GATEWAY,
-        )
+    cached = await sync_to_async(answer_cache.lookup)(user_message, config)
+    if cached:
+        response_text, tokens = cached.text, 0
+    else:
+        try:
+            response_text, tokens = await acall_gemini(
+                user_message=user_message,
+                system_prompt=config.ai_system_prompt,
+                api_key=config.gemini_api_key,
+                max_tokens=config.ai_max_tokens,
+            )
+        except Exception as e:
+            logger.error("Gemini API error: %s", str(e))
+            return Response(
+                {"detail": "The AI assistant encountered an error. Please try again."},
+                status=status.HTTP_502_BAD_GATEWAY,
+            )
+        await sync_to_async(answer_cache.store)(user_message, config, response_text, tokens)
 
     # Log usage (session_id used for anonymous rate-limiting key)
-    AIUsageLog.objects.create(
+    await AIUsageLog.objects.acreate(
         user=request.user if request.user.is_authenticated else None,
         session_id=_rate_key(request),
         prompt=user_message,
         response=response_text,
         tokens_used=tokens,
+        cache_hit=bool(cached),
+        prompt_version=answer_cache.answer_version(config),
     )
 
     return Response({
         "message": response_text,
         "tokens_used": tokens,
+        "cached": bool(cached),
     })
 
 
+def _sse(data: dict, event: str = "") -> str:
+    prefix = f"event: {event}\n" if event else ""
+    return f"{prefix}data: {json.dumps(data)}\n\n"
+
+
+@api_view(["POST"])
+@permission_classes([AllowAny])
+def ai_chat_stream(request):
+    """Stream the AI assistant's reply as server-sent events.
+
+    Emits ``data: {"delta": ...}`` messages as text arrives, then a final
+    ``event: done`` with the token count, or ``event: error``.
+
+    The generator is synchronous; under ASGI Django 4.2 collects it in full
+    before sending, so the reply arrives in one piece there.
+    """
+    config = SystemConfiguration.load()
+    if not config.ai_enabled or not config.gemini_api_key:
+        return Response(
+            {"detail": "The AI assistant is currently unavailable."},
+            status=status.HTTP_503_SERVICE_UNAVAILABLE,
+        )
+
+    serializer = AIChatSerializer(data=request.data)
+    serializer.is_valid(raise_exception=True)
+
+    rate_error = _check_rate_limit(request, config)
+    if rate_error:
+        return rate_error
+
+    user_message = serializer.validated_data["message"]
+    user = request.user if request.user.is_authenticated else None
+    session_id = _rate_key(request)
+
+    def events():
+        cached = answer_cache.lookup(user_message, config)
+        if cached:
+            AIUsageLog.objects.create(
+                user=user,
+                session_id=session_id,
+                prompt=user_message,
+                response=cached.text,
+                tokens_used=0,
+                cache_hit=True,
+                prompt_version=answer_cache.answer_version(config),
+            )
+            yield _sse({"delta": cached.text})
+            yield _sse({"tokens_used": 0, "cached": True}, event="done")
+            return
+
+        chunks = []
+        tokens = 0
+        try:
+            for delta, tokens in stream_gemini(
+                user_message=user_message,
+                system_prompt=config.ai_system_prompt,
+                api_key=config.gemini_api_key,
+                max_tokens=config.ai_max_tokens,
+            ):
+                if delta:
+                    chunks.append(delta)
+                    yield _sse({"delta": delta})
+        except Exception as e:
+            logger.error("Gemini stream error: %s", str(e))
+            yield _sse({"detail": "The AI assistant encountered an error. Please try again."}, event="error")
+            return
+
+        response_text = "".join(chunks)
+        answer_cache.store(user_message, config, response_text, tokens)
+        AIUsageLog.objects.create(
+            user=user,
+            session_id=session_id,
+            prompt=user_message,
+            response=response_text,
+            tokens_used=tokens,
+            prompt_version=answer_cache.answer_version(config),
+        )
+        yield _sse({"tokens_used": tokens, "cached": False}, event="done")
+
+    response = StreamingHttpResponse(events(), content_type="text/event-stream")
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"  # stop nginx buffering the stream
+    return response
+
+
 @api_view(["POST"])
 @permission_classes([IsAdmin])
 def test_gemini(request):
@@ -124,7 +222,7 @@ def test_gemini(request):
 
     try:
         result = test_connection(config.gemini_api_key)
-        return Response({"message": result})
+        return Response({"message": result, "metrics": get_metrics()})
     except Exception as e:
         return Response(
             {"detail": f"Connection failed: {str(e)}"},
@@ -1,6 +1,5 @@
 """Blog views – public listing/detail + admin CRUD + OG metadata."""
 import os
-from django.db.models import Q, F
 from django.utils import timezone
 from django.utils.text import slugify
 from rest_framework import status
@@ -9,15 +8,25 @@ from rest_framework.parsers import MultiPartParser, FormParser, JSONParser
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 
-from ..models import BlogPost
+from ..models import BlogPost, Tag
 from ..serializers import (
-    BlogPostListSerializer, BlogPostDetailSerializer, AdminBlogPostSerializer,
+    BlogPostDetailSerializer, AdminBlogPostSerializer, BlogPostListProjection,
 )
 from ..permissions import IsAdmin
+from ..utils import blog_search, counters
+from ..utils.pagination import CursorError, KeysetPaginator, page_response
+from ..utils.response_cache import cache_response
+
+# BlogPost.Meta.ordering plus the primary key, so every row has a unique position.
+BLOG_ORDERING = ["-is_pinned", "-published_at", "-created_at", "-id"]
+PUBLIC_PAGINATOR = KeysetPaginator(BLOG_ORDERING, page_size=12, max_page_size=48)
+SEARCH_PAGINATOR = KeysetPaginator(["-search_rank", *BLOG_ORDERING], page_size=12, max_page_size=48)
+ADMIN_PAGINATOR = KeysetPaginator(BLOG_ORDERING, page_size=50, max_page_size=200)
 
 
 # ── Public ──────────────────────────────────────────────────────────────────
 
+@cache_response("blog")
 @api_view(["GET"])
 @permission_classes([AllowAny])
 def list_blog_posts(request):
@@ -27,30 +36,24 @@ def list_blog_posts(request):
     # Tag filtering
     tag = request.query_params.get("tag")
     if tag:
-        posts = posts.filter(tags__contains=tag)
+        posts = posts.filter(tag_links__tag__name=tag)
 
-    # Text search
-    search = request.query_params.get("search")
+    # Full-text search: best match first, with a highlighted snippet per post.
+    search = request.query_params.get("search", "").strip()
+    extra = None
     if search:
-        posts = posts.filter(
-            Q(title__icontains=search) |
-            Q(excerpt__icontains=search) |
-            Q(content__icontains=search)
-        )
-
-    page_size = 12
-    page = int(request.query_params.get("page", 1))
-    start = (page - 1) * page_size
-    end = start + page_size
-    total = posts.count()
-
-    serializer = BlogPostListSerializer(posts[start:end], many=True)
-    return Response({
-        "results": serializer.data,
-        "count": total,
-        "page": page,
-        "total_pages": (total + page_size - 1) // page_size,
-    })
+        posts = blog_search.search(posts, search)
+        extra = {"snippet": ("search_snippet", blog_search.highlight)}
+
+    paginator = SEARCH_PAGINATOR if search else PUBLIC_PAGINATOR
+    try:
+        page = paginator.paginate(request, posts)
+    except CursorError as e:
+        return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+    # The projection selects only the listed columns, never the article body.
+    results = BlogPostListProjection.serialize(page.queryset, extra=extra)
+    return Response(page_response(page, counters.add_pending("blog_views", results, "view_count")))
 
 
 @api_view(["GET"])
@@ -62,19 +65,18 @@ def get_blog_post(request, slug):
     except BlogPost.DoesNotExist:
         return Response({"detail": "Post not found."}, status=status.HTTP_404_NOT_FOUND)
 
-    # Increment view count
-    BlogPost.objects.filter(pk=post.pk).update(view_count=F("view_count") + 1)
-    post.refresh_from_db()
-
+    # Counted in the cache and written to the database in batches.
+    post.view_count += counters.increment("blog_views", post.pk)
     return Response(BlogPostDetailSerializer(post).data)
 
 
+@cache_response("blog")
 @api_view(["GET"])
 @permission_classes([AllowAny])
 def get_pinned_posts(request):
     """Return pinned / featured blog posts."""
     posts = BlogPost.objects.filter(is_published=True, is_pinned=True)[:5]
-    return Response(BlogPostListSerializer(posts, many=True).data)
+    return Response(BlogPostListProjection.serialize(posts))
 
 
 @api_view(["GET"])
@@ -100,16 +102,15 @@ def blog_og_metadata(request, slug):
     })
 
 
+@cache_response("blog")
 @api_view(["GET"])
 @permission_classes([AllowAny])
 def blog_tags(request):
-    """Return a list of all unique tags used by published posts."""
-    posts = BlogPost.objects.filter(is_published=True).values_list("tags", flat=True)
-    tags_set = set()
-    for tag_list in posts:
-        if isinstance(tag_list, list):
-            tags_set.update(tag_list)
-    return Response(sorted(tags_set))
+    """Return the tags used by published posts (``?counts=1`` adds per-tag post counts)."""
+    tags = Tag.objects.filter(published_count__gt=0).order_by("name")
+    if request.query_params.get("counts") in ("1", "true"):
+        return Response([{"name": name, "count": count} for name, count in tags.values_list("name", "published_count")])
+    return Response(list(tags.values_list("name", flat=True)))
 
 
 # ── Admin ───────────────────────────────────────────────────────────────────
@@ -118,20 +119,13 @@ def blog_tags(request):
 @permission_classes([IsAdmin])
 def admin_list_blog_posts(request):
     """List all blog posts (published + drafts) for admin."""
-    posts = BlogPost.objects.all()
-    page_size = 50
-    page = int(request.query_params.get("page", 1))
-    start = (page - 1) * page_size
-    end = start + page_size
-    total = posts.count()
-
-    serializer = AdminBlogPostSerializer(posts[start:end], many=True)
-    return Response({
-        "results": serializer.data,
-        "count": total,
-        "page": page,
-        "total_pages": (total + page_size - 1) // page_size,
-    })
+    try:
+        page = ADMIN_PAGINATOR.paginate(request, BlogPost.objects.all())
+    except CursorError as e:
+        return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+    serializer = AdminBlogPostSerializer(page.queryset, many=True)
+    return Response(page_response(page, counters.add_pending("blog_views", serializer.data, "view_count")))
 
 
 @api_view(["POST"])
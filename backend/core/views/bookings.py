@@ -1,31 +1,98 @@
 """Booking views: slots, create booking, my bookings, admin bookings."""
 import uuid
 import logging
-from datetime import timedelta, datetime
+from collections import Counter
+from datetime import datetime, timedelta
+from django.db import IntegrityError, transaction
+from django.utils import timezone
 from rest_framework import status
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from rest_framework.response import Response
 
-from ..models import BookingSlot, Booking
-from ..serializers import BookingSlotSerializer, BookingSerializer, CreateBookingSerializer
+from ..models import AvailabilityRule, BookingSlot, Booking
+from ..serializers import (
+    AvailabilityRuleSerializer, BookingSlotSerializer, BookingSerializer, CreateBookingSerializer,
+)
 from ..permissions import IsAdmin
+from ..utils import availability, response_cache, scheduling
 from ..utils.email_utils import send_booking_confirmation
+from ..utils.pagination import KeysetPaginator, QueryParamError, date_window, page_response, since, window
 from ..utils.notification_service import notify_admin_new_booking
+from ..utils.response_cache import cache_response
 
 logger = logging.getLogger("core")
 
+SLOT_ORDERING = ["date", "start_time", "id"]
+ADMIN_SLOTS_PAGINATOR = KeysetPaginator(SLOT_ORDERING, page_size=100, max_page_size=200)
+ADMIN_BOOKINGS_PAGINATOR = KeysetPaginator(["-created_at", "-id"], page_size=50, max_page_size=200)
+MAX_REPORTED_CONFLICTS = 100
+AVAILABILITY_WINDOW_DAYS = 8 * 7        # default span of available_slots without ?to=
 
+
+def _slots_changed():
+    """Drop cached availability once the current transaction commits.
+
+    Needed after ``update()``/``bulk_create()``, which send no model signals.
+    """
+    transaction.on_commit(lambda: response_cache.invalidate("slots"))
+
+
+def _availability_window(request, default_days):
+    """``(start, end)`` of the requested window, capped at ``availability.MAX_WINDOW_DAYS``."""
+    start, end = window(request, default_from=timezone.localdate(), default_days=default_days)
+    if (end - start).days > availability.MAX_WINDOW_DAYS:
+        raise QueryParamError(f"The window cannot exceed {availability.MAX_WINDOW_DAYS} days.")
+    return start, end
+
+
+@cache_response("slots")
 @api_view(["GET"])
 @permission_classes([AllowAny])
 def available_slots(request):
-    """List available booking slots, optionally filtered by session_type."""
-    queryset = BookingSlot.objects.filter(is_available=True)
-    session_type = request.query_params.get("session_type")
-    if session_type:
-        queryset = queryset.filter(session_type=session_type)
-    serializer = BookingSlotSerializer(queryset, many=True)
-    return Response(serializer.data)
+    """List bookable times (``?session_type=``, ``?from=&to=``, default the next eight weeks).
+
+    One-off slots are merged with occurrences of the recurring availability
+    rules; an occurrence has ``id`` null and is booked by ``rule`` + ``date``.
+    The whole window is returned as a single page.
+    """
+    try:
+        start, end = _availability_window(request, AVAILABILITY_WINDOW_DAYS)
+    except QueryParamError as e:
+        return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+    results = availability.bookable(start, end, request.query_params.get("session_type"))
+    return Response({
+        "results": results,
+        "count": len(results),
+        "next": None,
+        "previous": None,
+        "total_pages": 1,
+    })
+
+
+@cache_response("slots")
+@api_view(["GET"])
+@permission_classes([AllowAny])
+def availability_calendar(request):
+    """Bookable time counts per day for ``?month=YYYY-MM`` (default: this month).
+
+    Days without times are omitted. Honours ``?session_type=``.
+    """
+    today = timezone.localdate()
+    raw = request.query_params.get("month")
+    try:
+        first = datetime.strptime(raw, "%Y-%m").date() if raw else today.replace(day=1)
+    except ValueError:
+        return Response({"detail": "month must be YYYY-MM."}, status=status.HTTP_400_BAD_REQUEST)
+    last = (first + timedelta(days=32)).replace(day=1) - timedelta(days=1)
+
+    counts = Counter(
+        slot["date"] for slot in availability.bookable(first, last, request.query_params.get("session_type"))
+    )
+    return Response({
+        "month": first.strftime("%Y-%m"),
+        "days": [{"date": day, "available": counts[day]} for day in sorted(counts)],
+    })
 
 
 @api_view(["POST"])
@@ -34,18 +101,35 @@ def create_booking(request):
     """Create a new booking for the authenticated client."""
     serializer = CreateBookingSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
-
-    slot = BookingSlot.objects.get(pk=serializer.validated_data["slot_id"])
-    slot.is_available = False
-    slot.save()
-
-    booking = Booking.objects.create(
-        client=request.user,
-        slot=slot,
-        session_type=serializer.validated_data["session_type"],
-        notes=serializer.validated_data.get("notes", ""),
-        video_room_id=f"lily-{uuid.uuid4().hex[:12]}",
-    )
+    data = serializer.validated_data
+    unavailable = Response({"detail": "This slot is no longer available."}, status=status.HTTP_409_CONFLICT)
+
+    # Claim a stored slot with one conditional UPDATE: of any number of
+    # concurrent requests exactly one sees a row change. A rule occurrence is
+    # materialised as an already-taken slot, where the slot's unique
+    # constraint settles a race. The partial unique constraint on
+    # Booking.slot backs both up if a slot is ever freed and claimed twice.
+    try:
+        with transaction.atomic():
+            if "slot_id" in data:
+                slot_id = data["slot_id"]
+                if not BookingSlot.objects.filter(pk=slot_id, is_available=True).update(is_available=False):
+                    return unavailable
+            else:
+                try:
+                    slot_id = availability.materialize(data["rule_id"], data["date"]).pk
+                except availability.Unavailable:
+                    return unavailable
+            booking = Booking.objects.create(
+                client=request.user,
+                slot_id=slot_id,
+                session_type=serializer.validated_data["session_type"],
+                notes=serializer.validated_data.get("notes", ""),
+                video_room_id=f"lily-{uuid.uuid4().hex[:12]}",
+            )
+            _slots_changed()
+    except IntegrityError:
+        return unavailable
 
     logger.info("New booking #%d by %s", booking.pk, request.user.email)
     notify_admin_new_booking(booking)
@@ -71,16 +155,17 @@ def cancel_booking(request, booking_id):
     except Booking.DoesNotExist:
         return Response({"detail": "Booking not found."}, status=status.HTTP_404_NOT_FOUND)
 
-    if booking.status in ("completed", "cancelled"):
-        return Response({"detail": "This booking cannot be cancelled."}, status=status.HTTP_400_BAD_REQUEST)
-
-    booking.status = "cancelled"
-    booking.save()
-
-    # Free up the slot
-    if booking.slot:
-        booking.slot.is_available = True
-        booking.slot.save()
+    with transaction.atomic():
+        # Conditional update so a double-submitted cancel frees the slot once.
+        cancelled = Booking.objects.filter(pk=booking.pk).exclude(
+            status__in=("completed", "cancelled"),
+        ).update(status="cancelled", updated_at=timezone.now())
+        if not cancelled:
+            return Response({"detail": "This booking cannot be cancelled."}, status=status.HTTP_400_BAD_REQUEST)
+        if booking.slot_id:
+            BookingSlot.objects.filter(pk=booking.slot_id).update(is_available=True)
+            _slots_changed()
+    booking.refresh_from_db()
 
     logger.info("Booking #%d cancelled by %s", booking.pk, request.user.email)
     return Response(BookingSerializer(booking).data)
@@ -92,10 +177,17 @@ def cancel_booking(request, booking_id):
 @api_view(["GET"])
 @permission_classes([IsAdmin])
 def admin_all_bookings(request):
-    """List all bookings (admin only)."""
-    bookings = Booking.objects.select_related("client", "slot").all()
-    serializer = BookingSerializer(bookings, many=True)
-    return Response({"results": serializer.data})
+    """List bookings, newest first (admin only). Filters: ``?status=``, ``?since=``."""
+    bookings = Booking.objects.all()
+    booking_status = request.query_params.get("status")
+    if booking_status:
+        bookings = bookings.filter(status=booking_status)
+    try:
+        page = ADMIN_BOOKINGS_PAGINATOR.paginate(request, since(request, bookings, "created_at"))
+    except QueryParamError as e:
+        return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+    serializer = BookingSerializer(page.queryset.select_related("client", "slot"), many=True)
+    return Response(page_response(page, serializer.data))
 
 
 @api_view(["POST"])
@@ -108,7 +200,12 @@ def admin_confirm_booking(request, booking_id):
         return Response({"detail": "Booking not found."}, status=status.HTTP_404_NOT_FOUND)
 
     booking.status = "confirmed"
-    booking.save()
+    try:
+        with transaction.atomic():
+            booking.save()
+    except IntegrityError:
+        # A cancelled booking whose slot has since been taken by someone else.
+        return Response({"detail": "This slot has been booked by another client."}, status=status.HTTP_409_CONFLICT)
 
     send_booking_confirmation(booking)
     logger.info("Booking #%d confirmed by admin", booking.pk)
@@ -116,13 +213,44 @@ def admin_confirm_booking(request, booking_id):
     return Response(BookingSerializer(booking).data)
 
 
+def _existing_intervals(start, end):
+    """Every slot between ``start`` and ``end`` (inclusive) as intervals, in one query."""
+    rows = BookingSlot.objects.filter(date__range=(start, end)).values_list(
+        "date", "start_time", "end_time", "session_type", "id",
+    )
+    return [scheduling.Interval(*row) for row in rows]
+
+
+def _conflict_response(conflicts):
+    return Response(
+        {
+            "detail": "%d overlap(s) with existing or requested slots; nothing was created." % len(conflicts),
+            "conflicts": conflicts[:MAX_REPORTED_CONFLICTS],
+        },
+        status=status.HTTP_409_CONFLICT,
+    )
+
+
 @api_view(["POST"])
 @permission_classes([IsAdmin])
 def admin_create_slot(request):
-    """Create a new available slot (admin only)."""
+    """Create a new available slot (admin only). 409 with a conflict report if it overlaps another."""
     serializer = BookingSlotSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
-    slot = serializer.save()
+    data = serializer.validated_data
+    if data["end_time"] <= data["start_time"]:
+        return Response({"detail": "end_time must be after start_time."}, status=status.HTTP_400_BAD_REQUEST)
+
+    proposed = scheduling.Interval(data["date"], data["start_time"], data["end_time"], data["session_type"])
+    conflicts = scheduling.conflicts([proposed], _existing_intervals(data["date"], data["date"]))
+    if conflicts:
+        return _conflict_response(conflicts)
+    try:
+        with transaction.atomic():
+            slot = serializer.save()
+    except IntegrityError:
+        # Lost a race with another write (caught by the unique/exclusion constraints).
+        return Response({"detail": "This slot overlaps an existing slot."}, status=status.HTTP_409_CONFLICT)
     logger.info("New slot created: %s", slot)
     return Response(BookingSlotSerializer(slot).data, status=status.HTTP_201_CREATED)
 
@@ -130,12 +258,14 @@ def admin_create_slot(request):
 @api_view(["GET"])
 @permission_classes([IsAdmin])
 def admin_list_slots(request):
-    """List all future slots (admin only). Returns both available and booked."""
-    from django.utils import timezone
-    today = timezone.now().date()
-    slots = BookingSlot.objects.filter(date__gte=today).order_by("date", "start_time")
-    serializer = BookingSlotSerializer(slots, many=True)
-    return Response({"results": serializer.data})
+    """List slots from today on, available and booked (admin only). ``?from=&to=`` narrow the window."""
+    try:
+        slots = date_window(request, BookingSlot.objects.all(), "date", default_from=timezone.now().date())
+        page = ADMIN_SLOTS_PAGINATOR.paginate(request, slots)
+    except QueryParamError as e:
+        return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+    serializer = BookingSlotSerializer(page.queryset, many=True)
+    return Response(page_response(page, serializer.data))
 
 
 @api_view(["DELETE"])
@@ -171,13 +301,20 @@ def admin_bulk_create_slots(request):
         "start_date": "2025-02-01",
         "end_date": "2025-03-01",
         "weekdays": [0, 2, 4],    # 0=Mon … 6=Sun
-        "start_time": "09:00",
-        "end_time": "10:00",
+        "times": [{"start_time": "09:00", "end_time": "10:00"},
+                  {"start_time": "14:00", "end_time": "15:00"}],
         "session_type": "standard"
     }
+
+    A single ``start_time``/``end_time`` pair is still accepted in place of
+    ``times``. Slots that already exist are skipped; if any other slot would
+    overlap, nothing is written and the conflicts are returned with a 409.
+    ``"dry_run": true`` reports what would be created without writing.
     """
     d = request.data
-    required = ["start_date", "end_date", "weekdays", "start_time", "end_time", "session_type"]
+    required = ["start_date", "end_date", "weekdays", "session_type"]
+    if "times" not in d:
+        required += ["start_time", "end_time"]
     missing = [f for f in required if f not in d]
     if missing:
         return Response(
@@ -185,36 +322,57 @@ def admin_bulk_create_slots(request):
             status=status.HTTP_400_BAD_REQUEST,
         )
 
+    session_type = d["session_type"]
+    if session_type not in dict(BookingSlot.SESSION_TYPE_CHOICES):
+        return Response({"detail": "Invalid session_type."}, status=status.HTTP_400_BAD_REQUEST)
     try:
-        start = datetime.strptime(d["start_date"], "%Y-%m-%d").date()
-        end = datetime.strptime(d["end_date"], "%Y-%m-%d").date()
-    except (ValueError, TypeError):
-        return Response({"detail": "Invalid date format. Use YYYY-MM-DD."}, status=status.HTTP_400_BAD_REQUEST)
-
-    weekdays = d["weekdays"]
-    if not isinstance(weekdays, list) or not all(isinstance(w, int) and 0 <= w <= 6 for w in weekdays):
-        return Response({"detail": "weekdays must be a list of ints 0-6."}, status=status.HTTP_400_BAD_REQUEST)
-
-    if end < start:
-        return Response({"detail": "end_date must be >= start_date."}, status=status.HTTP_400_BAD_REQUEST)
-
-    if (end - start).days > 365:
-        return Response({"detail": "Range cannot exceed 1 year."}, status=status.HTTP_400_BAD_REQUEST)
+        start = scheduling.parse_date(d["start_date"], "start_date")
+        end = scheduling.parse_date(d["end_date"], "end_date")
+        scheduling.check_range(start, end)
+        weekdays = scheduling.parse_weekdays(d["weekdays"])
+        ranges = scheduling.parse_time_ranges(
+            d["times"] if "times" in d else [{"start_time": d["start_time"], "end_time": d["end_time"]}]
+        )
+    except scheduling.ScheduleError as e:
+        return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+    # Expand in memory and compare with the window's slots, loaded once:
+    # identical slots are skipped, any other overlap aborts with a report.
+    wanted = list(scheduling.expand(start, end, weekdays, ranges))
+    existing = _existing_intervals(start, end)
+    have = {(i.date, i.start_time, i.end_time, i.session_type) for i in existing}
+    new = [key for key in wanted if (*key, session_type) not in have]
+    proposed = [scheduling.Interval(day, start_time, end_time, session_type) for day, start_time, end_time in new]
+    conflicts = scheduling.conflicts(proposed, existing)
+    if conflicts:
+        return _conflict_response(conflicts)
+    if d.get("dry_run"):
+        return Response({"created_count": 0, "would_create": len(new), "conflicts": []})
+
+    # The unique (and on PostgreSQL, exclusion) constraint makes a concurrent
+    # duplicate a no-op.
+    BookingSlot.objects.bulk_create(
+        [
+            BookingSlot(date=day, start_time=start_time, end_time=end_time, session_type=session_type)
+            for day, start_time, end_time in new
+        ],
+        batch_size=500,
+        ignore_conflicts=True,
+    )
+    _slots_changed()
 
     created = []
-    current = start
-    while current <= end:
-        if current.weekday() in weekdays:
-            slot, was_created = BookingSlot.objects.get_or_create(
-                date=current,
-                start_time=d["start_time"],
-                end_time=d["end_time"],
-                session_type=d["session_type"],
-                defaults={"is_available": True},
-            )
-            if was_created:
-                created.append(slot)
-        current += timedelta(days=1)
+    if new:
+        new_keys = set(new)
+        window = BookingSlot.objects.filter(
+            date__range=(start, end),
+            session_type=session_type,
+            start_time__in={r[0] for r in ranges},
+        )
+        created = [
+            slot for slot in window.order_by("date", "start_time")
+            if (slot.date, slot.start_time, slot.end_time) in new_keys
+        ]
 
     logger.info("Bulk slot creation: %d slots created by admin", len(created))
     serializer = BookingSlotSerializer(created, many=True)
@@ -222,3 +380,43 @@ def admin_bulk_create_slots(request):
         {"created_count": len(created), "slots": serializer.data},
         status=status.HTTP_201_CREATED,
     )
+
+
+@api_view(["GET", "POST"])
+@permission_classes([IsAdmin])
+def admin_availability_rules(request):
+    """List or create recurring weekly availability rules (admin only)."""
+    if request.method == "POST":
+        serializer = AvailabilityRuleSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        rule = serializer.save()
+        logger.info("Availability rule created: %s", rule)
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
+
+    rules = AvailabilityRule.objects.all()
+    if request.query_params.get("active") == "1":
+        rules = rules.filter(is_active=True)
+    return Response({"results": AvailabilityRuleSerializer(rules, many=True).data})
+
+
+@api_view(["PATCH", "DELETE"])
+@permission_classes([IsAdmin])
+def admin_availability_rule_detail(request, rule_id):
+    """Update or delete an availability rule (admin only).
+
+    Booked occurrences are stored slots and are not affected.
+    """
+    try:
+        rule = AvailabilityRule.objects.get(pk=rule_id)
+    except AvailabilityRule.DoesNotExist:
+        return Response({"detail": "Rule not found."}, status=status.HTTP_404_NOT_FOUND)
+
+    if request.method == "DELETE":
+        rule.delete()
+        logger.info("Availability rule #%d deleted by admin", rule_id)
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+    serializer = AvailabilityRuleSerializer(rule, data=request.data, partial=True)
+    serializer.is_valid(raise_exception=True)
+    serializer.save()
+    return Response(serializer.data)
@@ -1,21 +1,33 @@
 """Events views – public listing + admin CRUD."""
+from django.utils import timezone
 from rest_framework import status
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 
 from ..models import Event
-from ..serializers import EventSerializer
+from ..serializers import EventSerializer, EventProjection
 from ..permissions import IsAdmin
+from ..utils.pagination import KeysetPaginator, QueryParamError, date_window, page_response
+from ..utils.response_cache import cache_response
 
+EVENTS_PAGINATOR = KeysetPaginator(["date", "start_time", "id"], page_size=50, max_page_size=100)
+ADMIN_EVENTS_PAGINATOR = KeysetPaginator(["-date", "-start_time", "-id"], page_size=50, max_page_size=200)
 
+
+@cache_response("events")
 @api_view(["GET"])
 @permission_classes([AllowAny])
 def list_events(request):
-    """List published events."""
+    """List published events by date, paginated (``?from=&to=`` window, from today by default)."""
     events = Event.objects.filter(is_published=True)
-    serializer = EventSerializer(events, many=True)
-    return Response(serializer.data)
+    try:
+        page = EVENTS_PAGINATOR.paginate(
+            request, date_window(request, events, "date", default_from=timezone.localdate()),
+        )
+    except QueryParamError as e:
+        return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+    return Response(page_response(page, EventProjection.serialize(page.queryset)))
 
 
 @api_view(["GET"])
@@ -34,9 +46,12 @@ def get_event(request, event_id):
 @api_view(["GET"])
 @permission_classes([IsAdmin])
 def admin_list_events(request):
-    """List all events for admin."""
-    events = Event.objects.all()
-    return Response(EventSerializer(events, many=True).data)
+    """List all events for admin, latest first (``?from=&to=`` window)."""
+    try:
+        page = ADMIN_EVENTS_PAGINATOR.paginate(request, date_window(request, Event.objects.all(), "date"))
+    except QueryParamError as e:
+        return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+    return Response(page_response(page, EventSerializer(page.queryset, many=True).data))
 
 
 @api_view(["POST"])
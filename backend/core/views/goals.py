@@ -8,9 +8,12 @@ from rest_framework.response import Response
 from ..models import Goal
 from ..serializers import GoalSerializer
 from ..permissions import IsAdmin
+from ..utils.pagination import KeysetPaginator, QueryParamError, page_response, since
 
 logger = logging.getLogger("core")
 
+GOALS_PAGINATOR = KeysetPaginator(["-created_at", "-id"], page_size=50, max_page_size=100)
+
 
 # ── Client endpoints ────────────────────────────────────────────────────────
 
@@ -20,7 +23,14 @@ def my_goals(request):
     """List or create goals for the current user."""
     if request.method == "GET":
         goals = Goal.objects.filter(client=request.user)
-        return Response(GoalSerializer(goals, many=True).data)
+        goal_status = request.query_params.get("status")
+        if goal_status:
+            goals = goals.filter(status=goal_status)
+        try:
+            page = GOALS_PAGINATOR.paginate(request, since(request, goals, "created_at"))
+        except QueryParamError as e:
+            return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        return Response(page_response(page, GoalSerializer(page.queryset, many=True).data))
 
     serializer = GoalSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
@@ -7,9 +7,12 @@ from rest_framework.response import Response
 
 from ..models import SessionNote
 from ..serializers import SessionNoteSerializer
+from ..utils.pagination import KeysetPaginator, QueryParamError, page_response, since
 
 logger = logging.getLogger("core")
 
+NOTES_PAGINATOR = KeysetPaginator(["-created_at", "-id"], page_size=50, max_page_size=100)
+
 
 @api_view(["GET", "POST"])
 @permission_classes([IsAuthenticated])
@@ -17,7 +20,11 @@ def my_notes(request):
     """List or create session notes for the current user."""
     if request.method == "GET":
         notes = SessionNote.objects.filter(client=request.user)
-        return Response(SessionNoteSerializer(notes, many=True).data)
+        try:
+            page = NOTES_PAGINATOR.paginate(request, since(request, notes, "created_at"))
+        except QueryParamError as e:
+            return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        return Response(page_response(page, SessionNoteSerializer(page.queryset, many=True).data))
 
     serializer = SessionNoteSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
@@ -1,5 +1,5 @@
 """Resource hub views – public listing + admin CRUD."""
-from django.db.models import F
+from django.db.models import Count, Q
 from rest_framework import status
 from rest_framework.decorators import api_view, permission_classes, parser_classes
 from rest_framework.parsers import MultiPartParser, FormParser, JSONParser
@@ -9,20 +9,34 @@ from rest_framework.response import Response
 from ..models import ResourceCategory, Resource
 from ..serializers import (
     ResourceCategorySerializer, ResourceSerializer, AdminResourceSerializer,
+    ResourceProjection,
 )
 from ..permissions import IsAdmin
+from ..utils import counters, site_search
+from ..utils.pagination import KeysetPaginator, QueryParamError, page_response, since
+from ..utils.response_cache import cache_response
+
+ADMIN_RESOURCES_PAGINATOR = KeysetPaginator(["-created_at", "-id"], page_size=50, max_page_size=200)
+
+
+def _categories_with_counts():
+    """Categories annotated with their published resource count, in one query."""
+    return ResourceCategory.objects.annotate(
+        published_resource_count=Count("resources", filter=Q(resources__is_published=True)),
+    )
 
 
 # ── Public ──────────────────────────────────────────────────────────────────
 
+@cache_response("resources")
 @api_view(["GET"])
 @permission_classes([AllowAny])
 def list_resource_categories(request):
     """List all resource categories with counts."""
-    cats = ResourceCategory.objects.all()
-    return Response(ResourceCategorySerializer(cats, many=True).data)
+    return Response(ResourceCategorySerializer(_categories_with_counts(), many=True).data)
 
 
+@cache_response("resources")
 @api_view(["GET"])
 @permission_classes([AllowAny])
 def list_resources(request):
@@ -32,14 +46,11 @@ def list_resources(request):
     if category_slug:
         resources = resources.filter(category__slug=category_slug)
 
-    search = request.query_params.get("search")
+    search = request.query_params.get("search", "").strip()
     if search:
-        from django.db.models import Q
-        resources = resources.filter(
-            Q(title__icontains=search) | Q(description__icontains=search)
-        )
+        resources = resources.filter(pk__in=site_search.matching_ids(search, "resource"))
 
-    return Response(ResourceSerializer(resources, many=True).data)
+    return Response(counters.add_pending("resource_downloads", ResourceProjection.serialize(resources), "download_count"))
 
 
 @api_view(["GET"])
@@ -47,7 +58,7 @@ def list_resources(request):
 def get_resource(request, slug):
     """Get a single resource by slug."""
     try:
-        resource = Resource.objects.get(slug=slug, is_published=True)
+        resource = Resource.objects.select_related("category").get(slug=slug, is_published=True)
     except Resource.DoesNotExist:
         return Response({"detail": "Resource not found."}, status=status.HTTP_404_NOT_FOUND)
 
@@ -55,18 +66,21 @@ def get_resource(request, slug):
     if resource.is_premium and (not request.user or not request.user.is_authenticated):
         return Response({"detail": "Login required to access this resource."}, status=status.HTTP_403_FORBIDDEN)
 
-    return Response(ResourceSerializer(resource).data)
+    data = ResourceSerializer(resource).data
+    data["download_count"] += counters.pending_for("resource_downloads", resource.pk)
+    return Response(data)
 
 
 @api_view(["POST"])
 @permission_classes([AllowAny])
 def track_resource_download(request, slug):
     """Increment download count for a resource."""
-    try:
-        Resource.objects.filter(slug=slug, is_published=True).update(download_count=F("download_count") + 1)
-    except Resource.DoesNotExist:
-        pass
-    return Response({"status": "ok"})
+    found = Resource.objects.filter(slug=slug, is_published=True).values_list("pk", "download_count").first()
+    if found is None:
+        return Response({"status": "ok"})
+    pk, stored = found
+    # Counted in the cache and written to the database in batches.
+    return Response({"status": "ok", "download_count": stored + counters.increment("resource_downloads", pk)})
 
 
 # ── Admin ───────────────────────────────────────────────────────────────────
@@ -76,8 +90,7 @@ def track_resource_download(request, slug):
 def admin_resource_categories(request):
     """List or create resource categories."""
     if request.method == "GET":
-        cats = ResourceCategory.objects.all()
-        return Response(ResourceCategorySerializer(cats, many=True).data)
+        return Response(ResourceCategorySerializer(_categories_with_counts(), many=True).data)
 
     serializer = ResourceCategorySerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
@@ -91,8 +104,12 @@ def admin_resource_categories(request):
 def admin_resources(request):
     """List or create resources."""
     if request.method == "GET":
-        resources = Resource.objects.all()
-        return Response(AdminResourceSerializer(resources, many=True).data)
+        try:
+            page = ADMIN_RESOURCES_PAGINATOR.paginate(request, since(request, Resource.objects.all(), "created_at"))
+        except QueryParamError as e:
+            return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        data = AdminResourceSerializer(page.queryset, many=True).data
+        return Response(page_response(page, counters.add_pending("resource_downloads", data, "download_count")))
 
     serializer = AdminResourceSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
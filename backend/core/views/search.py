@@ -0,0 +1,32 @@
+"""Site-wide search across blog posts, resources and events."""
+from rest_framework import status
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+
+from ..utils import site_search
+
+MAX_LIMIT = 50
+
+
+@api_view(["GET"])
+@permission_classes([AllowAny])
+def site_search_view(request):
+    """Merged, ranked results for ``?q=`` (optionally ``&type=blog,resource,event``)."""
+    query = request.query_params.get("q", "").strip()
+    kinds = [k for k in request.query_params.get("type", "").split(",") if k]
+    if any(kind not in site_search.SOURCES for kind in kinds):
+        return Response(
+            {"detail": f"type must be one of: {', '.join(site_search.SOURCES)}."},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+    try:
+        limit = min(max(int(request.query_params.get("limit", 20)), 1), MAX_LIMIT)
+        offset = max(int(request.query_params.get("offset", 0)), 0)
+    except ValueError:
+        return Response({"detail": "limit and offset must be integers."}, status=status.HTTP_400_BAD_REQUEST)
+
+    if not query:
+        return Response({"query": query, "count": 0, "results": []})
+    total, results = site_search.search(query, kinds or None, limit=limit, offset=offset)
+    return Response({"query": query, "count": total, "results": results})
@@ -7,8 +7,10 @@ from rest_framework.response import Response
 from ..models import SystemConfiguration
 from ..serializers import SystemConfigurationSerializer
 from ..permissions import IsAdmin
+from ..utils.response_cache import cache_response
 
 
+@cache_response("settings")
 @api_view(["GET"])
 @permission_classes([AllowAny])
 def public_settings(request):
@@ -31,7 +33,7 @@ def public_settings(request):
 @permission_classes([IsAdmin])
 def get_settings(request):
     """Get current system settings (admin only)."""
-    config = SystemConfiguration.load()
+    config = SystemConfiguration.load(cached=False)
     return Response(SystemConfigurationSerializer(config).data)
 
 
@@ -39,7 +41,7 @@ def get_settings(request):
 @permission_classes([IsAdmin])
 def update_settings(request):
     """Update system settings (admin only)."""
-    config = SystemConfiguration.load()
+    config = SystemConfiguration.load(cached=False)
     serializer = SystemConfigurationSerializer(config, data=request.data, partial=True)
     serializer.is_valid(raise_exception=True)
     serializer.save()
@@ -4,9 +4,11 @@ from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 
 from ..models import Testimonial
-from ..serializers import TestimonialSerializer
+from ..serializers import TestimonialProjection
+from ..utils.response_cache import cache_response
 
 
+@cache_response("testimonials")
 @api_view(["GET"])
 @permission_classes([AllowAny])
 def list_testimonials(request):
@@ -15,5 +17,4 @@ def list_testimonials(request):
     featured = request.query_params.get("featured")
     if featured == "true":
         testimonials = testimonials.filter(is_featured=True)
-    serializer = TestimonialSerializer(testimonials, many=True)
-    return Response(serializer.data)
+    return Response(TestimonialProjection.serialize(testimonials))
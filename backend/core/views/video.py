@@ -1,5 +1,10 @@
 """Video room views with HTTP-polling signalling (no WebSocket)."""
 import logging
+import math
+import time
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import transaction
 from rest_framework import status
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated
@@ -7,6 +12,8 @@ from rest_framework.response import Response
 
 from ..models import Booking, VideoRoomEvent, VideoSignal
 from ..serializers import VideoSignalSendSerializer, VideoSignalSerializer
+from ..utils import signal_bus
+from ..utils.async_api import async_api_view
 
 logger = logging.getLogger("core")
 
@@ -63,21 +70,46 @@ def signal_send(request, room_id):
         signal_type=serializer.validated_data["type"],
         payload=serializer.validated_data["payload"],
     )
+    transaction.on_commit(lambda: signal_bus.notify(room_id))
     return Response({"detail": "Signal sent."})
 
 
-@api_view(["GET"])
+@async_api_view(["GET"])
 @permission_classes([IsAuthenticated])
-def signal_poll(request, room_id):
-    """Poll for unconsumed signalling messages in this room (excluding own)."""
+async def signal_poll(request, room_id):
+    """Poll for unconsumed signalling messages in this room (excluding own).
+
+    With ``?wait=N`` (seconds, up to ``SIGNAL_POLL_MAX_WAIT``) an empty poll
+    is held open until a signal arrives or the time is up, so new signals are
+    delivered at once and an idle call makes one request per wait instead of
+    one every 1.5 s. See ``signal_bus`` for how waiters are woken.
+    """
+    try:
+        wait = float(request.query_params.get("wait") or 0)
+        if not math.isfinite(wait):
+            raise ValueError
+    except ValueError:
+        return Response({"detail": "wait must be a number of seconds."}, status=status.HTTP_400_BAD_REQUEST)
+    wait = min(max(wait, 0), settings.SIGNAL_POLL_MAX_WAIT)
+
     signals = VideoSignal.objects.filter(
         room_id=room_id,
         consumed=False,
     ).exclude(sender=request.user)
 
-    data = VideoSignalSerializer(signals, many=True).data
-
-    # Mark as consumed
-    signals.update(consumed=True)
+    deadline = time.monotonic() + wait
+    while True:
+        # Read the version before the query so a signal stored in between wakes us.
+        seen = await sync_to_async(signal_bus.version)(room_id) if wait else None
+        pending = [signal async for signal in signals.all()]
+        remaining = deadline - time.monotonic()
+        # Our own signals wake us too; keep waiting until one is for us.
+        if pending or remaining <= 0 or not await signal_bus.wait(room_id, remaining, seen):
+            break
+    data = VideoSignalSerializer(pending, many=True).data
+
+    # Mark as consumed (only what was returned, not signals that arrived since)
+    if pending:
+        await VideoSignal.objects.filter(pk__in=[signal.pk for signal in pending]).aupdate(consumed=True)
 
     return Response(data)
@@ -1,16 +1,40 @@
 #!/bin/bash
 set -e
 
+# Auxiliary containers (e.g. the outbox worker) start with "worker <command>"
+# and skip the start-up tasks, which the web container already runs.
+if [ "$1" = "worker" ]; then
+    shift
+    exec "$@"
+fi
+
 echo "Running migrations..."
 python manage.py migrate --noinput
 
+echo "Creating cache table..."
+python manage.py createcachetable
+
 echo "Collecting static files..."
 python manage.py collectstatic --noinput
 
 echo "Seeding data..."
 python manage.py seed_data || echo "Seed skipped or already done."
 
-echo "Starting Gunicorn..."
+# SERVER_MODE=asgi (the default) runs uvicorn workers under gunicorn, so the
+# async views wait on Gemini and SMTP without holding a worker thread.
+# SERVER_MODE=wsgi runs the gthread workers instead.
+if [ "${SERVER_MODE:-asgi}" = "asgi" ]; then
+    echo "Starting Gunicorn (ASGI, uvicorn workers)..."
+    exec gunicorn lily_backend.asgi:application \
+        --bind 0.0.0.0:8000 \
+        --workers 2 \
+        --worker-class uvicorn.workers.UvicornWorker \
+        --timeout 120 \
+        --access-logfile - \
+        --error-logfile -
+fi
+
+echo "Starting Gunicorn (WSGI, gthread workers)..."
 exec gunicorn lily_backend.wsgi:application \
     --bind 0.0.0.0:8000 \
     --workers 2 \
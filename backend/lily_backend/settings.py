@@ -51,7 +51,7 @@ INSTALLED_APPS = [
 MIDDLEWARE = [
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.security.SecurityMiddleware",
-    "whitenoise.middleware.WhiteNoiseMiddleware",
+    "core.middleware.WhiteNoiseMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
@@ -64,6 +64,7 @@ MIDDLEWARE = [
 
 ROOT_URLCONF = "lily_backend.urls"
 WSGI_APPLICATION = "lily_backend.wsgi.application"
+ASGI_APPLICATION = "lily_backend.asgi.application"
 
 TEMPLATES = [
     {
@@ -100,9 +101,59 @@ else:
         "default": {
             "ENGINE": "django.db.backends.sqlite3",
             "NAME": BASE_DIR / "db.sqlite3",
+            # A file rather than the in-memory default, so the threaded
+            # concurrency tests wait on the write lock instead of failing
+            # with "database table is locked".
+            "TEST": {"NAME": BASE_DIR / "test_db.sqlite3"},
         }
     }
 
+# ---------------------------------------------------------------------------
+# Cache
+# CACHE_BACKEND = locmem | file | db | redis
+# locmem is per-process and only suitable for local development; file and db
+# are shared between gunicorn workers without any extra service. redis is
+# picked automatically when REDIS_URL is set (requires the redis package).
+# ---------------------------------------------------------------------------
+REDIS_URL = os.getenv("REDIS_URL", "")
+CACHE_BACKEND = os.getenv(
+    "CACHE_BACKEND",
+    "redis" if REDIS_URL else ("db" if DJANGO_ENV == "prod" else "locmem"),
+)
+# Prefix keys with the deployed release so pickled objects from a previous
+# build are never read back by new code.
+APP_RELEASE = os.getenv("APP_RELEASE", "dev")
+CACHE_KEY_PREFIX = os.getenv("CACHE_KEY_PREFIX", f"lily:{APP_RELEASE[:12]}")
+CACHE_VERSION = int(os.getenv("CACHE_VERSION", "1"))
+CACHE_MAX_ENTRIES = int(os.getenv("CACHE_MAX_ENTRIES", "5000"))
+CACHE_DEFAULT_TIMEOUT = int(os.getenv("CACHE_DEFAULT_TIMEOUT", "300"))
+
+_CACHE_BACKENDS = {
+    "locmem": ("core.cache_backends.LocMemCache", "lily-default"),
+    "file": ("core.cache_backends.FileBasedCache", os.getenv("CACHE_DIR", str(BASE_DIR / "cache"))),
+    "db": ("core.cache_backends.DatabaseCache", "lily_cache"),
+    "redis": ("core.cache_backends.RedisCache", REDIS_URL or "redis://localhost:6379/0"),
+}
+if CACHE_BACKEND not in _CACHE_BACKENDS:
+    raise ValueError(f"Unknown CACHE_BACKEND {CACHE_BACKEND!r}; expected one of {sorted(_CACHE_BACKENDS)}")
+
+_cache_class, _cache_location = _CACHE_BACKENDS[CACHE_BACKEND]
+CACHES = {
+    "default": {
+        "BACKEND": _cache_class,
+        "LOCATION": _cache_location,
+        "KEY_PREFIX": CACHE_KEY_PREFIX,
+        "VERSION": CACHE_VERSION,
+        "TIMEOUT": CACHE_DEFAULT_TIMEOUT,
+        # Redis evicts by its own maxmemory policy; the others cull a third
+        # of their entries once MAX_ENTRIES is reached.
+        "OPTIONS": {} if CACHE_BACKEND == "redis" else {
+            "MAX_ENTRIES": CACHE_MAX_ENTRIES,
+            "CULL_FREQUENCY": 3,
+        },
+    }
+}
+
 # ---------------------------------------------------------------------------
 # Custom user model
 # ---------------------------------------------------------------------------
@@ -214,6 +265,38 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 STRIPE_SECRET_KEY = os.getenv("STRIPE_SECRET_KEY", "")
 STRIPE_WEBHOOK_SECRET = os.getenv("STRIPE_WEBHOOK_SECRET", "")
 
+# ---------------------------------------------------------------------------
+# Gemini (leave empty for the Vertex AI endpoint; set to point at a stand-in)
+# ---------------------------------------------------------------------------
+GEMINI_MODEL_URL = os.getenv("GEMINI_MODEL_URL", "")
+# Reuse AI answers for this many seconds (0 disables the answer cache) and
+# for earlier questions at least this similar (0 disables fuzzy matching).
+AI_ANSWER_CACHE_TTL = int(os.getenv("AI_ANSWER_CACHE_TTL", str(60 * 60 * 24)))
+AI_ANSWER_NEAR_MATCH = float(os.getenv("AI_ANSWER_NEAR_MATCH", "0.85"))
+
+# ---------------------------------------------------------------------------
+# Write-behind counters (blog views, resource downloads)
+# Increments are buffered and written to the database once this many are
+# pending or this many seconds have passed since the last flush. The buffer
+# is the shared cache when it has an atomic incr (redis, or per-process
+# locmem); with the db and file caches each worker buffers in memory.
+# ---------------------------------------------------------------------------
+COUNTER_CACHE_BUFFER = CACHE_BACKEND in ("redis", "locmem")
+COUNTER_FLUSH_THRESHOLD = int(os.getenv("COUNTER_FLUSH_THRESHOLD", "100"))
+COUNTER_FLUSH_INTERVAL = int(os.getenv("COUNTER_FLUSH_INTERVAL", "60"))
+
+# ---------------------------------------------------------------------------
+# Video signalling (long polling)
+# A waiting signal_poll is woken instantly by a signal sent through the same
+# worker; from other workers it notices within SIGNAL_WAIT_CHECK_INTERVAL
+# seconds. With Redis the check is a cache read (1 s by default, lower is
+# fine); on the db and file caches it is an indexed VideoSignal lookup, so it
+# runs every 5 s by default.
+# ---------------------------------------------------------------------------
+SIGNAL_BUS_CACHE = CACHE_BACKEND in ("redis", "locmem")
+SIGNAL_WAIT_CHECK_INTERVAL = float(os.getenv("SIGNAL_WAIT_CHECK_INTERVAL", "1.0" if SIGNAL_BUS_CACHE else "5.0"))
+SIGNAL_POLL_MAX_WAIT = int(os.getenv("SIGNAL_POLL_MAX_WAIT", "25"))
+
 # ---------------------------------------------------------------------------
 # Logging
 # ---------------------------------------------------------------------------
@@ -1,6 +1,6 @@
 import { useState, useRef, useEffect, useMemo } from "react";
 import { MessageCircle, X, Send, Loader2, Bot, User } from "lucide-react";
-import { apiAIChat, apiAIStatus, type AIMessage } from "@/lib/api";
+import { apiAIChatStream, apiAIStatus, type AIMessage } from "@/lib/api";
 import { useQuery } from "@tanstack/react-query";
 
 const WELCOME_MESSAGE: AIMessage = {
@@ -110,9 +110,12 @@ export default function AIAssistant() {
     setInput("");
     setLoading(true);
 
+    let reply = "";
     try {
-      const res = await apiAIChat(trimmed);
-      setMessages([...updated, { role: "assistant", content: res.message }]);
+      await apiAIChatStream(trimmed, (delta) => {
+        reply += delta;
+        setMessages([...updated, { role: "assistant", content: reply }]);
+      });
     } catch {
       setMessages([
         ...updated,
@@ -182,7 +185,7 @@ export default function AIAssistant() {
                 )}
               </div>
             ))}
-            {loading && (
+            {loading && messages[messages.length - 1]?.role === "user" && (
               <div className="flex gap-2">
                 <div className="w-6 h-6 rounded-full bg-primary/10 flex items-center justify-center shrink-0">
                   <Bot className="w-3.5 h-3.5 text-primary" />
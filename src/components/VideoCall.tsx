@@ -30,6 +30,11 @@ const ICE_SERVERS = [
   { urls: "stun:stun2.l.google.com:19302" },
 ];
 
+// Long polling: each request waits up to LONG_POLL_WAIT_S for a signal and
+// the next one starts as soon as it returns. If an empty poll comes back
+// early (the server did not hold it), wait out POLL_INTERVAL_MS before the
+// next one. Back off the same amount after errors.
+const LONG_POLL_WAIT_S = 20;
 const POLL_INTERVAL_MS = 1500;
 
 const VideoCall = ({ bookingId, onClose }: VideoCallProps) => {
@@ -42,7 +47,7 @@ const VideoCall = ({ bookingId, onClose }: VideoCallProps) => {
   const pcRef = useRef<RTCPeerConnection | null>(null);
   const localStreamRef = useRef<MediaStream | null>(null);
   const screenStreamRef = useRef<MediaStream | null>(null);
-  const pollTimerRef = useRef<ReturnType<typeof setInterval> | null>(null);
+  const pollingRef = useRef(false);
   const mountedRef = useRef(true);
   const makingOfferRef = useRef(false);
   const politeRef = useRef(false);
@@ -282,17 +287,28 @@ const VideoCall = ({ bookingId, onClose }: VideoCallProps) => {
 
   /* â”€â”€ polling loop â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€ */
   const startPolling = useCallback(() => {
-    if (pollTimerRef.current || !roomId) return;
-    pollTimerRef.current = setInterval(async () => {
-      try {
-        const signals = await apiSignalPoll(roomId);
-        if (signals?.length) {
-          for (const sig of signals) {
+    if (pollingRef.current || !roomId) return;
+    pollingRef.current = true;
+    const loop = async () => {
+      while (pollingRef.current) {
+        const started = Date.now();
+        try {
+          const signals = await apiSignalPoll(roomId, LONG_POLL_WAIT_S);
+          if (!pollingRef.current) break;
+          for (const sig of signals ?? []) {
             await handleSignallingRef.current(sig as any);
           }
+          if (!signals?.length) {
+            const left = POLL_INTERVAL_MS - (Date.now() - started);
+            if (left > 0) await new Promise((resolve) => setTimeout(resolve, left));
+          }
+        } catch {
+          /* transient */
+          await new Promise((resolve) => setTimeout(resolve, POLL_INTERVAL_MS));
         }
-      } catch { /* transient */ }
-    }, POLL_INTERVAL_MS);
+      }
+    };
+    loop();
   }, [roomId]);
 
   /* â”€â”€ attach local stream to video element â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€â”€ */
@@ -358,7 +374,7 @@ const VideoCall = ({ bookingId, onClose }: VideoCallProps) => {
         pcRef.current.onnegotiationneeded = null;
         pcRef.current.close();
       }
-      if (pollTimerRef.current) { clearInterval(pollTimerRef.current); pollTimerRef.current = null; }
+      pollingRef.current = false;
       apiLogVideoEvent(roomId, "left").catch(() => {});
     };
     // eslint-disable-next-line react-hooks/exhaustive-deps
@@ -433,7 +449,7 @@ const VideoCall = ({ bookingId, onClose }: VideoCallProps) => {
       pcRef.current.onconnectionstatechange = null;
       pcRef.current.close();
     }
-    if (pollTimerRef.current) { clearInterval(pollTimerRef.current); pollTimerRef.current = null; }
+    pollingRef.current = false;
     apiLogVideoEvent(roomId, "left").catch(() => {});
     onClose();
   };
@@ -116,6 +116,21 @@ export async function apiFetch<T>(
   return res.json();
 }
 
+/** Fetch every page of a cursor-paginated list by following `next`. */
+export async function apiFetchAll<T>(path: string): Promise<T[]> {
+  const sep = path.includes("?") ? "&" : "?";
+  const results: T[] = [];
+  let cursor: string | null = null;
+  do {
+    const page: PaginatedResponse<T> = await apiFetch<PaginatedResponse<T>>(
+      cursor ? `${path}${sep}cursor=${encodeURIComponent(cursor)}` : path,
+    );
+    results.push(...page.results);
+    cursor = page.next;
+  } while (cursor);
+  return results;
+}
+
 /* ── Types ── */
 
 export interface AuthResponse {
@@ -156,6 +171,12 @@ export interface BookingSlot {
   end_time: string;
   is_available: boolean;
   session_type: string;
+  rule?: number | null;
+}
+
+/** A bookable time: a stored slot, or an unbooked rule occurrence (id null, booked by rule + date). */
+export interface AvailableSlot extends Omit<BookingSlot, "id"> {
+  id: number | null;
 }
 
 export interface Booking {
@@ -193,6 +214,8 @@ export interface BlogPost {
   is_pinned?: boolean;
   view_count: number;
   reading_time: number;
+  /** Escaped search excerpt with <mark> around matches (search results only). */
+  snippet?: string;
   seo_title?: string;
   seo_description?: string;
   published_at: string;
@@ -231,10 +254,30 @@ export interface AIMessage {
 
 export interface PaginatedResponse<T> {
   count: number;
+  /** Opaque cursors for the adjacent pages. */
   next: string | null;
   previous: string | null;
   results: T[];
   total_pages?: number;
+  page?: number;
+}
+
+export interface SiteSearchResult {
+  type: "blog" | "resource" | "event";
+  id: string;
+  title: string;
+  url: string;
+  summary: string;
+  date: string | null;
+  score: number;
+  resource_type?: string;
+  location?: string;
+}
+
+export interface SiteSearchResponse {
+  query: string;
+  count: number;
+  results: SiteSearchResult[];
 }
 
 export interface ResourceCategory {
@@ -310,17 +353,70 @@ export const apiLogout = () =>
 
 /* ── Booking endpoints ── */
 
-export const apiGetAvailableSlots = (sessionType?: string) =>
-  apiFetch<BookingSlot[]>(
-    `/bookings/slots/${sessionType ? `?session_type=${sessionType}` : ""}`
+export const apiGetAvailableSlots = (sessionType?: string, from?: string, to?: string) => {
+  const params = new URLSearchParams();
+  if (sessionType) params.set("session_type", sessionType);
+  if (from) params.set("from", from);
+  if (to) params.set("to", to);
+  const qs = params.toString();
+  return apiFetchAll<AvailableSlot>(`/bookings/slots/${qs ? `?${qs}` : ""}`);
+};
+
+export interface AvailabilityCalendar {
+  month: string;                                    // YYYY-MM
+  days: { date: string; available: number }[];      // days with no slots are omitted
+}
+
+export const apiGetAvailabilityCalendar = (month: string, sessionType?: string) =>
+  apiFetch<AvailabilityCalendar>(
+    `/bookings/calendar/?month=${month}${sessionType ? `&session_type=${sessionType}` : ""}`
   );
 
-export const apiCreateBooking = (slotId: number, sessionType: string, notes?: string) =>
+export const apiCreateBooking = (
+  slot: Pick<AvailableSlot, "id" | "rule" | "date">,
+  sessionType: string,
+  notes?: string,
+) =>
   apiFetch<Booking>("/bookings/create/", {
     method: "POST",
-    body: JSON.stringify({ slot_id: slotId, session_type: sessionType, notes }),
+    body: JSON.stringify({
+      ...(slot.id !== null ? { slot_id: slot.id } : { rule_id: slot.rule, date: slot.date }),
+      session_type: sessionType,
+      notes,
+    }),
   });
 
+export interface AvailabilityRule {
+  id: number;
+  weekday: number;              // 0=Mon … 6=Sun
+  start_time: string;
+  end_time: string;
+  session_type: string;
+  valid_from: string;
+  valid_until: string | null;
+  exceptions: string[];         // YYYY-MM-DD dates the rule is skipped
+  is_active: boolean;
+  created_at: string;
+}
+
+export const apiGetAvailabilityRules = () =>
+  apiFetch<{ results: AvailabilityRule[] }>("/admin/bookings/rules/").then((r) => r.results);
+
+export const apiCreateAvailabilityRule = (data: Partial<AvailabilityRule>) =>
+  apiFetch<AvailabilityRule>("/admin/bookings/rules/", {
+    method: "POST",
+    body: JSON.stringify(data),
+  });
+
+export const apiUpdateAvailabilityRule = (id: number, data: Partial<AvailabilityRule>) =>
+  apiFetch<AvailabilityRule>(`/admin/bookings/rules/${id}/`, {
+    method: "PATCH",
+    body: JSON.stringify(data),
+  });
+
+export const apiDeleteAvailabilityRule = (id: number) =>
+  apiFetch<void>(`/admin/bookings/rules/${id}/`, { method: "DELETE" });
+
 export const apiGetMyBookings = () =>
   apiFetch<PaginatedResponse<Booking>>("/bookings/mine/");
 
@@ -330,7 +426,7 @@ export const apiCancelBooking = (id: number) =>
 /* ── Admin booking management ── */
 
 export const apiGetAllBookings = () =>
-  apiFetch<PaginatedResponse<Booking>>("/admin/bookings/");
+  apiFetchAll<Booking>("/admin/bookings/");
 
 export const apiConfirmBooking = (id: number) =>
   apiFetch<Booking>(`/admin/bookings/${id}/confirm/`, { method: "POST" });
@@ -342,22 +438,41 @@ export const apiCreateSlot = (data: Partial<BookingSlot>) =>
   });
 
 export const apiGetAdminSlots = () =>
-  apiFetch<PaginatedResponse<BookingSlot>>("/admin/bookings/slots/");
+  apiFetchAll<BookingSlot>("/admin/bookings/slots/");
 
 export const apiDeleteSlot = (id: number) =>
   apiFetch<void>(`/admin/bookings/slots/${id}/delete/`, { method: "DELETE" });
 
+export interface SlotTimeRange {
+  start_time: string;
+  end_time: string;
+}
+
 export interface BulkSlotPayload {
   start_date: string;
   end_date: string;
   weekdays: number[];
+  times: SlotTimeRange[];
+  session_type: string;
+  dry_run?: boolean;
+}
+
+/** Body of a 409 from the slot endpoints: nothing was written. */
+export interface SlotConflict {
+  slot: ConflictingSlot;
+  overlaps: ConflictingSlot;
+}
+
+export interface ConflictingSlot {
+  id: number | null;    // null for a slot in the request
+  date: string;
   start_time: string;
   end_time: string;
   session_type: string;
 }
 
 export const apiCreateRecurringSlots = (data: BulkSlotPayload) =>
-  apiFetch<{ created_count: number; slots: BookingSlot[] }>("/admin/bookings/slots/bulk/", {
+  apiFetch<{ created_count: number; slots?: BookingSlot[]; would_create?: number; conflicts?: SlotConflict[] }>("/admin/bookings/slots/bulk/", {
     method: "POST",
     body: JSON.stringify(data),
   });
@@ -375,8 +490,9 @@ export const apiSubmitTestimonial = (data: Partial<Testimonial>) =>
 
 /* ── Blog ── */
 
-export const apiGetBlogPosts = (page = 1, tag?: string, search?: string) => {
-  const params = new URLSearchParams({ page: String(page) });
+/** Pass `cursor` (a `next`/`previous` value from an earlier response) instead of `page` for infinite scroll. */
+export const apiGetBlogPosts = (page = 1, tag?: string, search?: string, cursor?: string) => {
+  const params = new URLSearchParams(cursor ? { cursor } : { page: String(page) });
   if (tag) params.set("tag", tag);
   if (search) params.set("search", search);
   return apiFetch<PaginatedResponse<BlogPost>>(`/blog/?${params.toString()}`);
@@ -394,7 +510,7 @@ export const apiGetPinnedPosts = () =>
 /* ── Blog admin ── */
 
 export const apiAdminGetBlogPosts = () =>
-  apiFetch<PaginatedResponse<BlogPost>>("/admin/blog/");
+  apiFetchAll<BlogPost>("/admin/blog/");
 
 export const apiAdminCreateBlogPost = (data: FormData) =>
   apiFetch<BlogPost>("/admin/blog/create/", {
@@ -423,7 +539,7 @@ export const apiAdminUploadBlogImage = (data: FormData) =>
 /* ── Events ── */
 
 export const apiGetEvents = () =>
-  apiFetch<Event[]>("/events/");
+  apiFetchAll<Event>("/events/");
 
 export const apiGetEvent = (id: number) =>
   apiFetch<Event>(`/events/${id}/`);
@@ -431,7 +547,7 @@ export const apiGetEvent = (id: number) =>
 /* ── Events admin ── */
 
 export const apiAdminGetEvents = () =>
-  apiFetch<Event[]>("/admin/events/");
+  apiFetchAll<Event>("/admin/events/");
 
 export const apiAdminCreateEvent = (data: Record<string, unknown>) =>
   apiFetch<Event>("/admin/events/create/", {
@@ -467,6 +583,14 @@ export const apiGetResource = (slug: string) =>
 export const apiTrackResourceDownload = (slug: string) =>
   apiFetch<{ status: string }>(`/resources/${slug}/download/`, { method: "POST" });
 
+/* ── Site search ── */
+
+export const apiSiteSearch = (q: string, types?: SiteSearchResult["type"][], limit = 20, offset = 0) => {
+  const params = new URLSearchParams({ q, limit: String(limit), offset: String(offset) });
+  if (types?.length) params.set("type", types.join(","));
+  return apiFetch<SiteSearchResponse>(`/search/?${params.toString()}`);
+};
+
 /* ── Lead magnet ── */
 
 export const apiSubmitLeadMagnet = (data: LeadMagnetSubmission) =>
@@ -483,6 +607,62 @@ export const apiAIChat = (message: string, conversationId?: string) =>
     body: JSON.stringify({ message, conversation_id: conversationId || "" }),
   });
 
+/**
+ * Stream an assistant reply over server-sent events.
+ * Calls onDelta for each text chunk and resolves with the token count.
+ */
+export async function apiAIChatStream(
+  message: string,
+  onDelta: (text: string) => void,
+  conversationId?: string
+): Promise<{ tokens_used: number }> {
+  const headers: Record<string, string> = { "Content-Type": "application/json" };
+  const token = getAccessToken();
+  if (token) headers["Authorization"] = `Bearer ${token}`;
+
+  const res = await fetch(`${API_BASE}/ai/chat/stream/`, {
+    method: "POST",
+    headers,
+    body: JSON.stringify({ message, conversation_id: conversationId || "" }),
+  });
+  if (!res.ok || !res.body) {
+    let data: Record<string, unknown> = {};
+    try {
+      data = await res.json();
+    } catch {
+      data = { detail: res.statusText };
+    }
+    throw new ApiError(res.status, data);
+  }
+
+  const reader = res.body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = "";
+  for (;;) {
+    const { done, value } = await reader.read();
+    if (done) break;
+    buffer += decoder.decode(value, { stream: true });
+
+    let sep: number;
+    while ((sep = buffer.indexOf("\n\n")) !== -1) {
+      const raw = buffer.slice(0, sep);
+      buffer = buffer.slice(sep + 2);
+      let event = "message";
+      let data = "";
+      for (const line of raw.split("\n")) {
+        if (line.startsWith("event:")) event = line.slice(6).trim();
+        else if (line.startsWith("data:")) data += line.slice(5).trim();
+      }
+      if (!data) continue;
+      const payload = JSON.parse(data);
+      if (event === "error") throw new ApiError(502, payload);
+      if (event === "done") return payload;
+      if (payload.delta) onDelta(payload.delta);
+    }
+  }
+  throw new ApiError(502, { detail: "The response ended unexpectedly." });
+}
+
 export const apiAIStatus = () =>
   apiFetch<{ enabled: boolean }>("/ai/status/");
 
@@ -505,9 +685,10 @@ export const apiSignalSend = (roomId: string, data: Record<string, unknown>) =>
     body: JSON.stringify(data),
   });
 
-export const apiSignalPoll = (roomId: string) =>
+/** With ``wait`` (seconds) the server holds an empty poll open until a signal arrives. */
+export const apiSignalPoll = (roomId: string, wait?: number) =>
   apiFetch<Array<{ id: number; signal_type: string; payload: string; created_at: string }>>(
-    `/video/${roomId}/signal/poll/`
+    `/video/${roomId}/signal/poll/${wait ? `?wait=${wait}` : ""}`
   );
 
 /* ── Contact ── */
@@ -567,7 +748,7 @@ export const apiChangePassword = (currentPassword: string, newPassword: string)
 /* ── Goals (client) ── */
 
 export const apiGetMyGoals = () =>
-  apiFetch<Goal[]>("/goals/");
+  apiFetchAll<Goal>("/goals/");
 
 export const apiCreateGoal = (data: Partial<Goal>) =>
   apiFetch<Goal>("/goals/", {
@@ -587,7 +768,7 @@ export const apiDeleteGoal = (id: string) =>
 /* ── Session Notes (client) ── */
 
 export const apiGetMyNotes = () =>
-  apiFetch<SessionNote[]>("/notes/");
+  apiFetchAll<SessionNote>("/notes/");
 
 export const apiCreateNote = (data: { title?: string; content: string; booking?: number }) =>
   apiFetch<SessionNote>("/notes/", {
@@ -607,7 +788,7 @@ export const apiDeleteNote = (id: string) =>
 /* ── Admin resources ── */
 
 export const apiAdminGetResources = () =>
-  apiFetch<Resource[]>("/admin/resources/");
+  apiFetchAll<Resource>("/admin/resources/");
 
 export const apiAdminCreateResource = (data: FormData) =>
   apiFetch<Resource>("/admin/resources/", {
@@ -22,6 +22,7 @@ import {
   apiAdminGetResources, apiAdminCreateResource, apiAdminUpdateResource, apiAdminDeleteResource,
   apiGetResourceCategories,
   type Booking, type BlogPost, type Event, type Resource, type ResourceCategory, type BookingSlot,
+  type SlotTimeRange,
 } from "@/lib/api";
 
 type Tab = "bookings" | "schedule" | "blog" | "events" | "resources" | "settings";
@@ -108,7 +109,7 @@ function BookingsPanel() {
     );
   }
 
-  const bookings = data?.results || [];
+  const bookings = data || [];
 
   return (
     <div className="space-y-3">
@@ -177,14 +178,13 @@ function SchedulePanel() {
   const [rStartDate, setRStartDate] = useState("");
   const [rEndDate, setREndDate] = useState("");
   const [rWeekdays, setRWeekdays] = useState<number[]>([]);
-  const [rStartTime, setRStartTime] = useState("09:00");
-  const [rEndTime, setREndTime] = useState("10:00");
+  const [rTimes, setRTimes] = useState<SlotTimeRange[]>([{ start_time: "09:00", end_time: "10:00" }]);
   const [rSessionType, setRSessionType] = useState("standard");
   const [rLoading, setRLoading] = useState(false);
 
   const [deletingId, setDeletingId] = useState<number | null>(null);
 
-  const slots = slotsData?.results || [];
+  const slots = slotsData || [];
 
   const handleCreate = async (e: React.FormEvent) => {
     e.preventDefault();
@@ -200,8 +200,9 @@ function SchedulePanel() {
       toast.success("Slot created.");
       setDate("");
       qc.invalidateQueries({ queryKey: ["admin-slots"] });
-    } catch {
-      toast.error("Could not create slot.");
+    } catch (err: unknown) {
+      const msg = err instanceof Error ? err.message : "Could not create slot.";
+      toast.error(msg);
     } finally {
       setLoading(false);
     }
@@ -227,6 +228,10 @@ function SchedulePanel() {
     );
   };
 
+  const updateTime = (idx: number, field: keyof SlotTimeRange, value: string) => {
+    setRTimes((prev) => prev.map((t, i) => (i === idx ? { ...t, [field]: value } : t)));
+  };
+
   const handleRecurringCreate = async (e: React.FormEvent) => {
     e.preventDefault();
     if (rWeekdays.length === 0) {
@@ -239,8 +244,7 @@ function SchedulePanel() {
         start_date: rStartDate,
         end_date: rEndDate,
         weekdays: rWeekdays,
-        start_time: rStartTime,
-        end_time: rEndTime,
+        times: rTimes,
         session_type: rSessionType,
       });
       toast.success(`${res.created_count} slot(s) created.`);
@@ -248,8 +252,9 @@ function SchedulePanel() {
       setREndDate("");
       setRWeekdays([]);
       qc.invalidateQueries({ queryKey: ["admin-slots"] });
-    } catch {
-      toast.error("Could not create recurring slots.");
+    } catch (err: unknown) {
+      const msg = err instanceof Error ? err.message : "Could not create recurring slots.";
+      toast.error(msg);
     } finally {
       setRLoading(false);
     }
@@ -448,27 +453,46 @@ function SchedulePanel() {
                 </div>
               </div>
 
-              <div className="grid grid-cols-2 gap-4">
-                <div>
-                  <label className="block text-sm font-medium text-foreground mb-1">Start</label>
-                  <input
-                    type="time"
-                    value={rStartTime}
-                    onChange={(e) => setRStartTime(e.target.value)}
-                    required
-                    className="w-full px-4 py-2.5 text-sm rounded-lg border border-border bg-background focus:outline-none focus:ring-2 focus:ring-primary/30"
-                  />
-                </div>
-                <div>
-                  <label className="block text-sm font-medium text-foreground mb-1">End</label>
-                  <input
-                    type="time"
-                    value={rEndTime}
-                    onChange={(e) => setREndTime(e.target.value)}
-                    required
-                    className="w-full px-4 py-2.5 text-sm rounded-lg border border-border bg-background focus:outline-none focus:ring-2 focus:ring-primary/30"
-                  />
+              <div className="space-y-2">
+                <div className="grid grid-cols-[1fr_1fr_auto] gap-4">
+                  <label className="block text-sm font-medium text-foreground">Start</label>
+                  <label className="block text-sm font-medium text-foreground">End</label>
+                  <span className="w-8" />
                 </div>
+                {rTimes.map((t, idx) => (
+                  <div key={idx} className="grid grid-cols-[1fr_1fr_auto] gap-4 items-center">
+                    <input
+                      type="time"
+                      value={t.start_time}
+                      onChange={(e) => updateTime(idx, "start_time", e.target.value)}
+                      required
+                      className="w-full px-4 py-2.5 text-sm rounded-lg border border-border bg-background focus:outline-none focus:ring-2 focus:ring-primary/30"
+                    />
+                    <input
+                      type="time"
+                      value={t.end_time}
+                      onChange={(e) => updateTime(idx, "end_time", e.target.value)}
+                      required
+                      className="w-full px-4 py-2.5 text-sm rounded-lg border border-border bg-background focus:outline-none focus:ring-2 focus:ring-primary/30"
+                    />
+                    <button
+                      type="button"
+                      onClick={() => setRTimes((prev) => prev.filter((_, i) => i !== idx))}
+                      disabled={rTimes.length === 1}
+                      aria-label="Remove time range"
+                      className="w-8 h-8 flex items-center justify-center rounded-full text-muted-foreground hover:text-destructive disabled:opacity-30"
+                    >
+                      <X className="w-4 h-4" />
+                    </button>
+                  </div>
+                ))}
+                <button
+                  type="button"
+                  onClick={() => setRTimes((prev) => [...prev, { start_time: "14:00", end_time: "15:00" }])}
+                  className="inline-flex items-center gap-1 text-xs font-medium text-primary hover:underline"
+                >
+                  <Plus className="w-3.5 h-3.5" /> Add time range
+                </button>
               </div>
 
               <div>
@@ -736,6 +760,8 @@ function SettingsPanel() {
   const [geminiKey, setGeminiKey] = useState("");
   const [aiSystemPrompt, setAiSystemPrompt] = useState("");
   const [aiMaxTokens, setAiMaxTokens] = useState(512);
+  const [aiRatePerMinute, setAiRatePerMinute] = useState(5);
+  const [aiRatePerDay, setAiRatePerDay] = useState(50);
 
   /* beta mode */
   const [betaMode, setBetaMode] = useState(true);
@@ -764,6 +790,8 @@ function SettingsPanel() {
     setGeminiKey((settings.gemini_api_key as string) ?? "");
     setAiSystemPrompt((settings.ai_system_prompt as string) ?? "");
     setAiMaxTokens((settings.ai_max_tokens as number) ?? 512);
+    setAiRatePerMinute((settings.ai_rate_per_minute as number) ?? 5);
+    setAiRatePerDay((settings.ai_rate_per_day as number) ?? 50);
     setBetaMode(settings.beta_mode as boolean ?? true);
     setLmEnabled(settings.lead_magnet_enabled as boolean ?? false);
     setLmTitle((settings.lead_magnet_title as string) ?? "");
@@ -1147,6 +1175,33 @@ function SettingsPanel() {
             />
             <p className="text-[11px] text-muted-foreground mt-1">50 – 4096. Higher values = longer responses, more cost.</p>
           </div>
+          <div className="flex gap-4">
+            <div>
+              <label className="block text-sm font-medium text-foreground mb-1">
+                Messages / minute
+              </label>
+              <input
+                type="number"
+                value={aiRatePerMinute}
+                onChange={(e) => setAiRatePerMinute(Math.max(0, parseInt(e.target.value) || 0))}
+                min={0}
+                className="w-32 px-4 py-2.5 text-sm rounded-lg border border-border bg-background focus:outline-none focus:ring-2 focus:ring-primary/30"
+              />
+            </div>
+            <div>
+              <label className="block text-sm font-medium text-foreground mb-1">
+                Messages / day
+              </label>
+              <input
+                type="number"
+                value={aiRatePerDay}
+                onChange={(e) => setAiRatePerDay(Math.max(0, parseInt(e.target.value) || 0))}
+                min={0}
+                className="w-32 px-4 py-2.5 text-sm rounded-lg border border-border bg-background focus:outline-none focus:ring-2 focus:ring-primary/30"
+              />
+            </div>
+          </div>
+          <p className="text-[11px] text-muted-foreground -mt-1">Per-visitor limits for the website assistant. 0 = no limit.</p>
         </div>
 
         <div className="flex gap-3 mt-4">
@@ -1159,6 +1214,8 @@ function SettingsPanel() {
                   gemini_api_key: geminiKey,
                   ai_system_prompt: aiSystemPrompt,
                   ai_max_tokens: aiMaxTokens,
+                  ai_rate_per_minute: aiRatePerMinute,
+                  ai_rate_per_day: aiRatePerDay,
                 });
                 qc.invalidateQueries({ queryKey: ["admin-settings"] });
                 toast.success("AI settings saved.");
@@ -1282,12 +1339,12 @@ function BlogPanel() {
 
   if (isLoading) return <div className="flex justify-center py-16"><Loader2 className="w-8 h-8 animate-spin text-primary" /></div>;
 
-  const posts: BlogPost[] = data?.results || [];
+  const posts: BlogPost[] = data || [];
 
   return (
     <div className="space-y-6">
       <div className="flex items-center justify-between">
-        <h2 className="text-xl font-cormorant font-bold text-foreground">Blog Articles ({data?.count || 0})</h2>
+        <h2 className="text-xl font-cormorant font-bold text-foreground">Blog Articles ({posts.length})</h2>
         <button onClick={() => { resetForm(); setShowForm(true); }} className="flex items-center gap-1.5 px-4 py-2 text-sm bg-primary text-primary-foreground rounded-full hover:bg-primary/90 transition-colors">
           <Plus className="w-4 h-4" /> New Article
         </button>
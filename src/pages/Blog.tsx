@@ -158,9 +158,16 @@ export default function Blog() {
                       <h2 className="text-lg font-cormorant font-bold text-foreground mb-2 group-hover:text-primary transition-colors">
                         {post.title}
                       </h2>
-                      <p className="text-sm text-muted-foreground line-clamp-3">
-                        {post.excerpt}
-                      </p>
+                      {post.snippet ? (
+                        <p
+                          className="text-sm text-muted-foreground line-clamp-3 [&_mark]:bg-primary/20 [&_mark]:text-foreground [&_mark]:rounded-sm"
+                          dangerouslySetInnerHTML={{ __html: post.snippet }}
+                        />
+                      ) : (
+                        <p className="text-sm text-muted-foreground line-clamp-3">
+                          {post.excerpt}
+                        </p>
+                      )}
                       <div className="flex items-center justify-between mt-3">
                         <span className="inline-flex items-center gap-1 text-sm text-primary font-medium">
                           Read more <ArrowRight className="w-3.5 h-3.5" />
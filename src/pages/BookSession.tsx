@@ -1,14 +1,18 @@
 import { useState } from "react";
 import { Helmet } from "react-helmet-async";
-import { useQuery } from "@tanstack/react-query";
-import { Calendar, Loader2, CheckCircle2, ArrowRight } from "lucide-react";
-import { format } from "date-fns";
+import { useQuery, useQueryClient } from "@tanstack/react-query";
+import { Calendar, Loader2, CheckCircle2, ArrowRight, ChevronLeft, ChevronRight } from "lucide-react";
+import {
+  format, addMonths, subMonths, startOfMonth, endOfMonth, eachDayOfInterval, getDay, isBefore,
+} from "date-fns";
 import { toast } from "sonner";
 import SiteHeader from "@/components/SiteHeader";
 import SiteFooter from "@/components/SiteFooter";
 import AIAssistant from "@/components/AIAssistant";
 import { useAuth } from "@/hooks/useAuth";
-import { apiGetAvailableSlots, apiCreateBooking, type BookingSlot } from "@/lib/api";
+import {
+  apiGetAvailableSlots, apiGetAvailabilityCalendar, apiCreateBooking, ApiError, type AvailableSlot,
+} from "@/lib/api";
 import { Link, useNavigate } from "react-router-dom";
 
 const sessionTypes = [
@@ -17,26 +21,60 @@ const sessionTypes = [
   { value: "intensive", label: "Intensive Session", duration: "90 min", price: "From £120" },
 ];
 
+const WEEKDAY_LABELS = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"];
+
+// Unbooked rule occurrences have no id; they are unique by rule and date.
+const slotKey = (slot: AvailableSlot) => (slot.id !== null ? `s${slot.id}` : `r${slot.rule}-${slot.date}`);
+
 export default function BookSession() {
   const { isAuthenticated } = useAuth();
   const navigate = useNavigate();
   const [selectedType, setSelectedType] = useState("discovery");
-  const [selectedSlot, setSelectedSlot] = useState<BookingSlot | null>(null);
+  const [selectedSlot, setSelectedSlot] = useState<AvailableSlot | null>(null);
   const [notes, setNotes] = useState("");
   const [booking, setBooking] = useState(false);
   const [booked, setBooked] = useState(false);
+  const [month, setMonth] = useState(() => startOfMonth(new Date()));
+  const [selectedDay, setSelectedDay] = useState<string | null>(null);
+  const queryClient = useQueryClient();
 
-  const { data: slots, isLoading } = useQuery({
-    queryKey: ["slots", selectedType],
-    queryFn: () => apiGetAvailableSlots(selectedType),
+  // Month summary first (one small request), then the chosen day's slots.
+  const monthKey = format(month, "yyyy-MM");
+  const { data: calendar, isLoading: calendarLoading } = useQuery({
+    queryKey: ["slot-calendar", monthKey, selectedType],
+    queryFn: () => apiGetAvailabilityCalendar(monthKey, selectedType),
+  });
+  const { data: slots, isLoading: slotsLoading } = useQuery({
+    queryKey: ["slots", selectedType, selectedDay],
+    queryFn: () => apiGetAvailableSlots(selectedType, selectedDay!, selectedDay!),
+    enabled: !!selectedDay,
   });
 
+  const availableByDay = new Map((calendar?.days || []).map((d) => [d.date, d.available]));
+  const monthDays = eachDayOfInterval({ start: month, end: endOfMonth(month) });
+  const leadingBlanks = (getDay(month) + 6) % 7;   // grid starts on Monday
+  const canGoBack = !isBefore(subMonths(month, 1), startOfMonth(new Date()));
+
+  const selectDay = (day: string | null) => {
+    setSelectedDay(day);
+    setSelectedSlot(null);
+  };
+
+  const changeMonth = (next: Date) => {
+    setMonth(next);
+    selectDay(null);
+  };
+
   const handleBook = async () => {
     if (!isAuthenticated) {
       navigate("/register", {
         state: {
           pendingBooking: selectedSlot
-            ? { slotId: selectedSlot.id, sessionType: selectedType, notes }
+            ? {
+                slot: { id: selectedSlot.id, rule: selectedSlot.rule, date: selectedSlot.date },
+                sessionType: selectedType,
+                notes,
+              }
             : undefined,
         },
       });
@@ -45,11 +83,19 @@ export default function BookSession() {
     if (!selectedSlot) return;
     setBooking(true);
     try {
-      await apiCreateBooking(selectedSlot.id, selectedType, notes);
+      await apiCreateBooking(selectedSlot, selectedType, notes);
       setBooked(true);
       toast.success("Your session has been booked. Check your email for confirmation.");
-    } catch {
-      toast.error("Something went wrong. Please try again.");
+    } catch (err) {
+      if (err instanceof ApiError && err.status === 409) {
+        // Someone else took the slot first; show what is still free.
+        setSelectedSlot(null);
+        queryClient.invalidateQueries({ queryKey: ["slots"] });
+        queryClient.invalidateQueries({ queryKey: ["slot-calendar"] });
+        toast.error("Sorry, that slot was just taken. Please choose another time.");
+      } else {
+        toast.error("Something went wrong. Please try again.");
+      }
     } finally {
       setBooking(false);
     }
@@ -119,7 +165,7 @@ export default function BookSession() {
             {sessionTypes.map((st) => (
               <button
                 key={st.value}
-                onClick={() => { setSelectedType(st.value); setSelectedSlot(null); }}
+                onClick={() => { setSelectedType(st.value); selectDay(null); }}
                 className={`p-4 rounded-xl border text-left transition-all ${
                   selectedType === st.value
                     ? "border-primary bg-primary/5 shadow-sm"
@@ -139,43 +185,105 @@ export default function BookSession() {
               Available Times
             </h2>
 
-            {isLoading ? (
+            {/* Month summary */}
+            <div className="flex items-center justify-between mb-3">
+              <button
+                onClick={() => changeMonth(subMonths(month, 1))}
+                disabled={!canGoBack}
+                aria-label="Previous month"
+                className="p-2 rounded-full hover:bg-accent/40 disabled:opacity-30"
+              >
+                <ChevronLeft className="w-4 h-4" />
+              </button>
+              <p className="text-sm font-medium text-foreground">{format(month, "MMMM yyyy")}</p>
+              <button
+                onClick={() => changeMonth(addMonths(month, 1))}
+                aria-label="Next month"
+                className="p-2 rounded-full hover:bg-accent/40"
+              >
+                <ChevronRight className="w-4 h-4" />
+              </button>
+            </div>
+
+            {calendarLoading ? (
               <div className="flex justify-center py-10">
                 <Loader2 className="w-6 h-6 animate-spin text-primary" />
               </div>
-            ) : slots && slots.length > 0 ? (
-              <div className="grid sm:grid-cols-2 gap-2 max-h-80 overflow-y-auto">
-                {slots.map((slot) => (
-                  <button
-                    key={slot.id}
-                    onClick={() => setSelectedSlot(slot)}
-                    disabled={!slot.is_available}
-                    className={`flex items-center gap-3 p-3 rounded-lg border text-left transition-all ${
-                      selectedSlot?.id === slot.id
-                        ? "border-primary bg-primary/5"
-                        : slot.is_available
-                        ? "border-border/60 hover:border-primary/30"
-                        : "border-border/30 opacity-40 cursor-not-allowed"
-                    }`}
-                  >
-                    <Calendar className="w-4 h-4 text-primary shrink-0" />
-                    <div>
-                      <p className="text-sm font-medium text-foreground">
-                        {format(new Date(slot.date), "EEEE d MMMM")}
-                      </p>
-                      <p className="text-xs text-muted-foreground">
-                        {slot.start_time} - {slot.end_time}
-                      </p>
-                    </div>
-                  </button>
+            ) : (
+              <div className="grid grid-cols-7 gap-1 text-center">
+                {WEEKDAY_LABELS.map((label) => (
+                  <p key={label} className="text-xs text-muted-foreground py-1">{label}</p>
                 ))}
+                {Array.from({ length: leadingBlanks }).map((_, i) => <span key={`blank-${i}`} />)}
+                {monthDays.map((day) => {
+                  const key = format(day, "yyyy-MM-dd");
+                  const available = availableByDay.get(key) || 0;
+                  return (
+                    <button
+                      key={key}
+                      onClick={() => selectDay(key)}
+                      disabled={available === 0}
+                      className={`py-2 rounded-lg border text-sm transition-all ${
+                        selectedDay === key
+                          ? "border-primary bg-primary/5 font-medium"
+                          : available > 0
+                          ? "border-border/60 hover:border-primary/30"
+                          : "border-transparent text-muted-foreground/40 cursor-not-allowed"
+                      }`}
+                    >
+                      {format(day, "d")}
+                      {available > 0 && (
+                        <span className="block text-[10px] text-primary">{available} free</span>
+                      )}
+                    </button>
+                  );
+                })}
               </div>
-            ) : (
+            )}
+
+            {!calendarLoading && availableByDay.size === 0 && (
               <p className="text-sm text-muted-foreground py-6 text-center">
-                No available slots at the moment. Please check back soon or contact me directly.
+                No available slots this month. Try the next month, or contact me directly.
               </p>
             )}
 
+            {/* Slots for the chosen day */}
+            {selectedDay && (
+              <div className="mt-6">
+                <p className="text-sm font-medium text-foreground mb-2">
+                  {format(new Date(selectedDay), "EEEE d MMMM")}
+                </p>
+                {slotsLoading ? (
+                  <div className="flex justify-center py-6">
+                    <Loader2 className="w-5 h-5 animate-spin text-primary" />
+                  </div>
+                ) : slots && slots.length > 0 ? (
+                  <div className="grid sm:grid-cols-2 gap-2">
+                    {slots.map((slot) => (
+                      <button
+                        key={slotKey(slot)}
+                        onClick={() => setSelectedSlot(slot)}
+                        className={`flex items-center gap-3 p-3 rounded-lg border text-left transition-all ${
+                          selectedSlot && slotKey(selectedSlot) === slotKey(slot)
+                            ? "border-primary bg-primary/5"
+                            : "border-border/60 hover:border-primary/30"
+                        }`}
+                      >
+                        <Calendar className="w-4 h-4 text-primary shrink-0" />
+                        <p className="text-sm text-foreground">
+                          {slot.start_time.slice(0, 5)} - {slot.end_time.slice(0, 5)}
+                        </p>
+                      </button>
+                    ))}
+                  </div>
+                ) : (
+                  <p className="text-sm text-muted-foreground py-4 text-center">
+                    No times left on this day. Please choose another.
+                  </p>
+                )}
+              </div>
+            )}
+
             {/* Notes */}
             {selectedSlot && (
               <div className="mt-6 space-y-4">
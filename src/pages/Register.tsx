@@ -4,13 +4,15 @@ import { Link, useNavigate, useLocation } from "react-router-dom";
 import { Loader2 } from "lucide-react";
 import { toast } from "sonner";
 import { useAuth } from "@/hooks/useAuth";
-import { apiCreateBooking } from "@/lib/api";
+import { apiCreateBooking, type AvailableSlot } from "@/lib/api";
 
 export default function Register() {
   const { register } = useAuth();
   const navigate = useNavigate();
   const location = useLocation();
-  const pendingBooking = (location.state as { pendingBooking?: { slotId: number; sessionType: string; notes: string } })?.pendingBooking;
+  const pendingBooking = (location.state as {
+    pendingBooking?: { slot: Pick<AvailableSlot, "id" | "rule" | "date">; sessionType: string; notes: string };
+  })?.pendingBooking;
   const [form, setForm] = useState({
     first_name: "",
     last_name: "",
@@ -38,7 +40,7 @@ export default function Register() {
       await register(form);
       if (pendingBooking) {
         try {
-          await apiCreateBooking(pendingBooking.slotId, pendingBooking.sessionType, pendingBooking.notes);
+          await apiCreateBooking(pendingBooking.slot, pendingBooking.sessionType, pendingBooking.notes);
           toast.success("Account created and session booked!");
         } catch {
           toast.success("Account created. Please book your session again.");